@@ -1,4 +1,5 @@
 from .config import settings
-from .database import neo4j_db
+from .database import neo4j_db, async_neo4j_db
+from .cache import query_cache
 
-__all__ = ['settings', 'neo4j_db']
+__all__ = ['settings', 'neo4j_db', 'async_neo4j_db', 'query_cache']
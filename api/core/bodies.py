@@ -0,0 +1,48 @@
+"""JSON array / NDJSON request body parsing"""
+
+from functools import lru_cache
+from typing import List, Union
+
+from fastapi import HTTPException
+from pydantic import TypeAdapter, ValidationError
+
+
+@lru_cache(maxsize=None)
+def _adapter(model, allow_single: bool) -> TypeAdapter:
+    return TypeAdapter(Union[List[model], model] if allow_single else List[model])
+
+
+def _errors(e: ValidationError, line: int = None) -> list:
+    """Error details without the raw input (bytes for NDJSON lines, not JSON-encodable)"""
+    errors = e.errors(include_url=False, include_context=False, include_input=False)
+    if line is not None:
+        for error in errors:
+            error["loc"] = (line, *error["loc"])
+    return errors
+
+
+def parse_items(model, body: bytes, content_type: str, allow_single: bool = False) -> list:
+    """
+    Parse a JSON array or newline-delimited JSON (application/x-ndjson) body.
+
+    With allow_single a single JSON object is accepted too. Invalid bodies
+    raise 422 with the pydantic errors; NDJSON error locations start with
+    the line index.
+    """
+    if "ndjson" in content_type:
+        items, errors = [], []
+        for line_no, line in enumerate(body.splitlines()):
+            if not line.strip():
+                continue
+            try:
+                items.append(model.model_validate_json(line))
+            except ValidationError as e:
+                errors.extend(_errors(e, line_no))
+        if errors:
+            raise HTTPException(status_code=422, detail=errors)
+        return items
+    try:
+        items = _adapter(model, allow_single).validate_json(body)
+    except ValidationError as e:
+        raise HTTPException(status_code=422, detail=_errors(e))
+    return items if isinstance(items, list) else [items]
@@ -0,0 +1,123 @@
+"""Read-through query result cache"""
+
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Iterable, Optional
+
+from .config import settings
+
+
+class _Entry:
+    """Cached query result"""
+
+    __slots__ = ("value", "expires_at", "size", "tags")
+
+    def __init__(self, value: Any, expires_at: float, size: int, tags: frozenset):
+        self.value = value
+        self.expires_at = expires_at
+        self.size = size
+        self.tags = tags
+
+
+class QueryCache:
+    """LRU cache with per-entry TTL, bounded by entry count and total size"""
+
+    def __init__(self, max_entries: int = 1024, max_bytes: int = 64 * 1024 * 1024,
+                 clock: Callable[[], float] = time.monotonic):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._clock = clock
+        self._entries: "OrderedDict[tuple, _Entry]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.invalidations = 0
+
+    @staticmethod
+    def make_key(cypher: str, parameters: dict = None) -> tuple:
+        """Build a cache key from query text and parameters"""
+        params = json.dumps(parameters or {}, sort_keys=True, default=str)
+        return (" ".join(cypher.split()), params)
+
+    @staticmethod
+    def estimate_size(value: Any) -> int:
+        """Approximate memory footprint of a result by its JSON size"""
+        return len(json.dumps(value, default=str))
+
+    def get(self, key: tuple) -> Optional[Any]:
+        """Return cached value or None if missing/expired"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            if entry.expires_at <= self._clock():
+                self._remove(key)
+                self.expirations += 1
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry.value
+
+    def set(self, key: tuple, value: Any, ttl: float, tags: Iterable[str] = ()):
+        """Store a value, evicting least recently used entries if needed"""
+        size = self.estimate_size(value)
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = _Entry(value, self._clock() + ttl, size, frozenset(tags))
+            self._bytes += size
+            while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+                oldest = next(iter(self._entries))
+                self._remove(oldest)
+                self.evictions += 1
+
+    def invalidate(self, *tags: str) -> int:
+        """Drop entries carrying any of the tags (all entries if no tags given)"""
+        with self._lock:
+            if tags:
+                wanted = set(tags)
+                keys = [k for k, e in self._entries.items() if e.tags & wanted]
+            else:
+                keys = list(self._entries)
+            for key in keys:
+                self._remove(key)
+            self.invalidations += len(keys)
+            return len(keys)
+
+    def stats(self) -> dict:
+        """Cache counters"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "enabled": settings.cache_enabled,
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "maxEntries": self.max_entries,
+                "maxBytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hitRatio": self.hits / lookups if lookups else 0.0,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                "invalidations": self.invalidations,
+            }
+
+    def _remove(self, key: tuple):
+        entry = self._entries.pop(key)
+        self._bytes -= entry.size
+
+
+# Singleton instance
+query_cache = QueryCache(
+    max_entries=settings.cache_max_entries,
+    max_bytes=settings.cache_max_bytes
+)
@@ -0,0 +1,62 @@
+"""Single-flight coalescing of identical concurrent queries"""
+
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Hashable
+
+from .config import settings
+from .metrics import observe_coalesced
+
+
+class SingleFlight:
+    """
+    Runs at most one execution per key at a time; concurrent callers with
+    the same key await that execution and share its result (or exception).
+
+    The execution runs in its own task, so a caller that is cancelled (e.g.
+    a client disconnect) does not cancel it for the others. Results are
+    shared objects and must not be mutated, as with the query cache.
+    Call from the event loop only.
+    """
+
+    def __init__(self):
+        self._flights: Dict[Hashable, asyncio.Task] = {}
+        self.executions = 0
+        self.coalesced = 0
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[Any]]) -> Any:
+        """Return fn()'s result, joining an in-flight call for key if there is one"""
+        if not settings.coalesce_enabled:
+            return await fn()
+        task = self._flights.get(key)
+        if task is not None:
+            self.coalesced += 1
+            observe_coalesced()
+        else:
+            task = asyncio.ensure_future(fn())
+            self._flights[key] = task
+            self.executions += 1
+            task.add_done_callback(lambda t: self._done(key, t))
+        return await asyncio.shield(task)
+
+    def _done(self, key: Hashable, task: asyncio.Task):
+        if self._flights.get(key) is task:
+            del self._flights[key]
+        # Mark the exception retrieved when every caller was cancelled
+        if not task.cancelled():
+            task.exception()
+
+    def in_flight(self) -> int:
+        return len(self._flights)
+
+    def stats(self) -> dict:
+        """Coalescing counters"""
+        return {
+            "enabled": settings.coalesce_enabled,
+            "inFlight": len(self._flights),
+            "executions": self.executions,
+            "coalesced": self.coalesced,
+        }
+
+
+# Singleton instance
+single_flight = SingleFlight()
@@ -0,0 +1,128 @@
+"""Response compression with gzip / brotli negotiation"""
+
+import zlib
+
+from starlette.datastructures import Headers, MutableHeaders
+
+try:
+    import brotli
+except ImportError:  # brotli is optional; gzip is always available
+    brotli = None
+
+# Streams whose consumers expect every chunk immediately
+EXCLUDED_MEDIA_TYPES = ("text/event-stream",)
+
+
+def negotiate(accept_encoding: str) -> str:
+    """Pick br or gzip from an Accept-Encoding header by q-value (br wins ties)"""
+    supported = ("br", "gzip") if brotli else ("gzip",)
+    best, best_q = None, 0.0
+    for part in accept_encoding.lower().split(","):
+        coding, _, params = part.strip().partition(";")
+        q = 1.0
+        if params.strip().startswith("q="):
+            try:
+                q = float(params.strip()[2:])
+            except ValueError:
+                continue
+        if coding.strip() in supported and q > best_q:
+            best, best_q = coding.strip(), q
+    return best
+
+
+def _weaken_etag(headers: MutableHeaders):
+    """Mark a strong ETag weak: the encoded bytes differ from the identity ones"""
+    etag = headers.get("etag")
+    if etag and not etag.startswith("W/"):
+        headers["ETag"] = f"W/{etag}"
+
+
+class _Compressor:
+    """Incremental gzip or brotli compressor"""
+
+    def __init__(self, encoding: str, gzip_level: int, brotli_quality: int):
+        self.encoding = encoding
+        if encoding == "br":
+            self._br = brotli.Compressor(quality=brotli_quality)
+        else:
+            self._gz = zlib.compressobj(gzip_level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+
+    def compress(self, body: bytes, more_body: bool) -> bytes:
+        if self.encoding == "br":
+            return self._br.process(body) + (self._br.flush() if more_body else self._br.finish())
+        mode = zlib.Z_SYNC_FLUSH if more_body else zlib.Z_FINISH
+        return self._gz.compress(body) + self._gz.flush(mode)
+
+
+class CompressionMiddleware:
+    """
+    Compress responses with the best encoding the client accepts.
+
+    Small single-chunk bodies are sent as-is; streaming bodies are compressed
+    chunk by chunk. Responses that already carry Content-Encoding pass through.
+    Compressed responses (and 304s to clients that would get one) carry a weak
+    ETag, since a strong one must identify the exact bytes sent.
+    """
+
+    def __init__(self, app, minimum_size: int = 1024, gzip_level: int = 6,
+                 brotli_quality: int = 4):
+        self.app = app
+        self.minimum_size = minimum_size
+        self.gzip_level = gzip_level
+        self.brotli_quality = brotli_quality
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        encoding = negotiate(Headers(scope=scope).get("accept-encoding", ""))
+        if not encoding:
+            await self.app(scope, receive, send)
+            return
+
+        start_message = None
+        compressor = None
+        passthrough = False
+
+        async def send_compressed(message):
+            nonlocal start_message, compressor, passthrough
+            if message["type"] == "http.response.start":
+                headers = Headers(raw=message["headers"])
+                media_type = headers.get("content-type", "").split(";")[0].strip()
+                passthrough = "content-encoding" in headers or media_type in EXCLUDED_MEDIA_TYPES
+                if message["status"] == 304:
+                    _weaken_etag(MutableHeaders(raw=message["headers"]))
+                if passthrough:
+                    await send(message)
+                else:
+                    start_message = message
+                return
+            if message["type"] != "http.response.body" or passthrough:
+                await send(message)
+                return
+
+            body = message.get("body", b"")
+            more_body = message.get("more_body", False)
+            if start_message is not None:
+                headers = MutableHeaders(raw=start_message["headers"])
+                headers.add_vary_header("Accept-Encoding")
+                if not more_body and len(body) < self.minimum_size:
+                    passthrough = True
+                    await send(start_message)
+                    await send(message)
+                    return
+                compressor = _Compressor(encoding, self.gzip_level, self.brotli_quality)
+                body = compressor.compress(body, more_body)
+                headers["Content-Encoding"] = encoding
+                _weaken_etag(headers)
+                if more_body:
+                    del headers["Content-Length"]
+                else:
+                    headers["Content-Length"] = str(len(body))
+                await send(start_message)
+                start_message = None
+            else:
+                body = compressor.compress(body, more_body)
+            await send({"type": "http.response.body", "body": body, "more_body": more_body})
+
+        await self.app(scope, receive, send_compressed)
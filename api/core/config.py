@@ -1,6 +1,7 @@
 """Application configuration"""
 
 from pydantic_settings import BaseSettings
+from typing import Optional
 
 
 class Settings(BaseSettings):
@@ -15,6 +16,80 @@ class Settings(BaseSettings):
     neo4j_uri: str = "bolt://localhost:17687"
     neo4j_user: str = "neo4j"
     neo4j_password: str = "password123"
+    # True: native async driver, False: sync driver run in a threadpool
+    neo4j_async: bool = True
+    neo4j_database: Optional[str] = None
+    # Driver connection pool
+    neo4j_max_pool_size: int = 100
+    neo4j_acquisition_timeout: float = 60.0
+    neo4j_connection_timeout: float = 30.0
+    neo4j_max_connection_lifetime: float = 3600.0
+    # Total time managed transactions keep retrying transient errors
+    neo4j_max_retry_time: float = 30.0
+    # Records pulled per round trip
+    neo4j_fetch_size: int = 1000
+    # True: reads run in read sessions so a cluster routes them to followers
+    neo4j_read_routing: bool = True
+
+    # Graph backend: "neo4j" or "memory" (in-process graph, no database needed)
+    graph_backend: str = "neo4j"
+    # Turtle files loaded by the memory backend, relative to the repository root
+    memory_graph_files: str = "ontology/upw.owl.ttl,ontology/sample_data.ttl"
+    # Synthetic plant added on top: equipment units and observations per sensor
+    memory_graph_equipment: int = 0
+    memory_graph_observations: int = 0
+    # Store energy forecast points as arrays on the prediction (compact layout)
+    memory_graph_compact_forecasts: bool = False
+
+    # Slow-query log
+    slow_query_threshold_ms: float = 500.0
+    slow_query_log_size: int = 200
+    # Rerun slow reads with PROFILE and keep db hits / operator tree
+    slow_query_profile: bool = False
+
+    # Responses: orjson fast path for list endpoints (rows validated only in debug)
+    fast_serialization: bool = False
+    # gzip/brotli for responses of at least this many bytes (0 disables)
+    compression_min_size: int = 1024
+
+    # Share one execution among identical concurrent reads (query + params)
+    coalesce_enabled: bool = True
+
+    # Query cache
+    cache_enabled: bool = True
+    cache_max_entries: int = 1024
+    cache_max_bytes: int = 64 * 1024 * 1024
+
+    # Conditional GET: seconds between reads of the graph's change marks (:Stats
+    # node), i.e. how long a write by another process can go unnoticed
+    graph_change_check_interval: float = 1.0
+
+    # Dashboard summary (:Stats node) full recount interval in seconds. Off by
+    # default: enable it on one worker only (or POST /api/summary/refresh from cron)
+    summary_refresh_interval: float = 0.0
+
+    # Live streams (/api/stream): events kept for Last-Event-ID resume,
+    # per-client buffer (slower clients are dropped and resume) and keepalive
+    stream_history_size: int = 1000
+    stream_client_buffer: int = 256
+    stream_heartbeat: float = 15.0
+
+    # Observation ingestion (write-behind queue)
+    ingest_batch_size: int = 5000
+    ingest_flush_interval: float = 0.5
+    ingest_queue_size: int = 200_000
+    ingest_writers: int = 2
+    ingest_max_retries: int = 3
+
+    # Anomaly scoring (/api/anomalies/score): default model artifact and optional
+    # per-sensor registry (ml/train.py --all-sensors), relative to the repository root
+    scoring_model_path: str = "ml/models/anomaly_model.joblib"
+    scoring_registry_path: Optional[str] = None
+    # Micro-batches: most items per batch and longest wait for one to fill (seconds)
+    scoring_batch_size: int = 1024
+    scoring_max_wait: float = 0.002
+    # Directory keeping per-sensor stream state across restarts (None: not kept)
+    scoring_state_dir: Optional[str] = None
 
     class Config:
         env_file = ".env"
@@ -0,0 +1,77 @@
+"""Neo4j connection settings of the API, and a client that records query metrics"""
+
+import logging
+import threading
+
+import graphdb
+from neo4j import READ_ACCESS
+from .config import settings
+from .metrics import observe_error, observe_query
+from .slow_queries import slow_query_log
+
+logger = logging.getLogger(__name__)
+
+
+def connection_config() -> graphdb.ConnectionConfig:
+    """graphdb connection settings from the API settings"""
+    return graphdb.ConnectionConfig(
+        uri=settings.neo4j_uri,
+        user=settings.neo4j_user,
+        password=settings.neo4j_password,
+        database=settings.neo4j_database,
+        max_pool_size=settings.neo4j_max_pool_size,
+        acquisition_timeout=settings.neo4j_acquisition_timeout,
+        connection_timeout=settings.neo4j_connection_timeout,
+        max_connection_lifetime=settings.neo4j_max_connection_lifetime,
+        max_retry_time=settings.neo4j_max_retry_time,
+        fetch_size=settings.neo4j_fetch_size,
+        read_routing=settings.neo4j_read_routing,
+    )
+
+
+def session_options(access_mode: str = READ_ACCESS, fetch_size: int = None) -> dict:
+    """Session options for a read or write session"""
+    return graphdb.session_options(connection_config(), access_mode, fetch_size)
+
+
+def create_async_driver(uri: str = None, user: str = None, password: str = None):
+    """Create an async driver using the shared pool settings"""
+    return graphdb.create_async_driver(connection_config(), uri, user, password)
+
+
+def pool_stats(driver) -> dict:
+    """Connection pool utilisation of a sync or async driver"""
+    return graphdb.pool_stats(driver, settings.neo4j_max_pool_size)
+
+
+class GraphClient(graphdb.GraphClient):
+    """graphdb client that records metrics and slow queries (PROFILEd in the background)"""
+
+    def __init__(self, uri: str = None, user: str = None, password: str = None):
+        super().__init__(uri, user, password, connection_config())
+
+    def _on_error(self):
+        observe_error()
+
+    def _record(self, elapsed: float, summary, rows: int,
+                cypher: str, parameters: dict, access_mode: str):
+        """Record metrics and slow queries; PROFILE slow reads in the background"""
+        observe_query(elapsed, summary, rows)
+        entry = slow_query_log.observe(elapsed, summary, rows, cypher, parameters)
+        if entry is not None and slow_query_log.should_profile(entry, access_mode == READ_ACCESS):
+            threading.Thread(target=self._profile, args=(entry, cypher, parameters),
+                             daemon=True).start()
+
+    def _profile(self, entry: dict, cypher: str, parameters: dict = None):
+        """Rerun a read query with PROFILE and attach the plan to its slow-query entry"""
+        try:
+            with self.driver.session(**session_options(READ_ACCESS)) as session:
+                summary = session.execute_read(_profile_tx, cypher, parameters or {})
+            slow_query_log.attach_profile(entry, summary)
+        except Exception as e:
+            logger.warning(f"PROFILE of slow query {entry['operation']} failed: {e}")
+
+
+def _profile_tx(tx, cypher: str, parameters: dict):
+    """Transaction function running a query with PROFILE and returning its summary"""
+    return tx.run("PROFILE " + cypher, parameters).consume()
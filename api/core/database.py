@@ -1,38 +1,116 @@
 """Neo4j database connection"""
 
-from neo4j import GraphDatabase
-from .config import settings
+import asyncio
+import logging
+import time
 
+from neo4j import READ_ACCESS, WRITE_ACCESS
+from .connection import GraphClient, create_async_driver, session_options, pool_stats
+from .metrics import observe_error, observe_query
+from .slow_queries import slow_query_log
 
-class Neo4jDatabase:
+logger = logging.getLogger(__name__)
+
+
+class Neo4jDatabase(GraphClient):
     """Neo4j database connection manager"""
 
+
+class AsyncNeo4jDatabase:
+    """Neo4j connection manager backed by the async driver"""
+
     def __init__(self):
         self.driver = None
+        self._profiling = set()
 
     def connect(self):
         """Connect to Neo4j"""
-        self.driver = GraphDatabase.driver(
-            settings.neo4j_uri,
-            auth=(settings.neo4j_user, settings.neo4j_password)
-        )
+        self.driver = create_async_driver()
 
-    def close(self):
+    async def close(self):
         """Close connection"""
         if self.driver:
-            self.driver.close()
+            await self.driver.close()
 
-    def query(self, cypher: str, parameters: dict = None) -> list:
-        """Execute a Cypher query and return results"""
-        with self.driver.session() as session:
-            result = session.run(cypher, parameters or {})
-            return [record.data() for record in result]
+    async def query(self, cypher: str, parameters: dict = None) -> list:
+        """Execute a Cypher query in a managed read transaction"""
+        return await self._execute(READ_ACCESS, cypher, parameters)
 
-    def query_single(self, cypher: str, parameters: dict = None):
+    async def query_single(self, cypher: str, parameters: dict = None):
         """Execute a query and return single result"""
-        results = self.query(cypher, parameters)
+        results = await self.query(cypher, parameters)
         return results[0] if results else None
 
+    async def write(self, cypher: str, parameters: dict = None) -> list:
+        """Execute a Cypher query in a managed write transaction (retried on transient errors)"""
+        return await self._execute(WRITE_ACCESS, cypher, parameters)
+
+    async def stream(self, cypher: str, parameters: dict = None, fetch_size: int = None):
+        """Yield records one by one, fetching fetch_size records per round trip"""
+        start, rows = time.perf_counter(), 0
+        async with self.driver.session(**session_options(READ_ACCESS, fetch_size)) as session:
+            result = await session.run(cypher, parameters or {})
+            async for record in result:
+                rows += 1
+                yield record.data()
+            summary = await result.consume()
+        self._record(time.perf_counter() - start, summary, rows, cypher, parameters, READ_ACCESS)
+
+    def pool_stats(self) -> dict:
+        """Connection pool utilisation"""
+        return pool_stats(self.driver)
+
+    async def _execute(self, access_mode: str, cypher: str, parameters: dict = None) -> list:
+        """Run a managed transaction and record its metrics"""
+        start = time.perf_counter()
+        try:
+            options = session_options(access_mode)
+            async with self.driver.session(**options) as session:
+                if options["default_access_mode"] == READ_ACCESS:
+                    execute = session.execute_read
+                else:
+                    execute = session.execute_write
+                records, summary = await execute(_fetch_all, cypher, parameters or {})
+        except Exception:
+            observe_error()
+            raise
+        self._record(time.perf_counter() - start, summary, len(records),
+                     cypher, parameters, access_mode)
+        return records
+
+    def _record(self, elapsed: float, summary, rows: int,
+                cypher: str, parameters: dict, access_mode: str):
+        """Record metrics and slow queries; PROFILE slow reads in the background"""
+        observe_query(elapsed, summary, rows)
+        entry = slow_query_log.observe(elapsed, summary, rows, cypher, parameters)
+        if entry is not None and slow_query_log.should_profile(entry, access_mode == READ_ACCESS):
+            task = asyncio.get_running_loop().create_task(self._profile(entry, cypher, parameters))
+            self._profiling.add(task)
+            task.add_done_callback(self._profiling.discard)
+
+    async def _profile(self, entry: dict, cypher: str, parameters: dict = None):
+        """Rerun a read query with PROFILE and attach the plan to its slow-query entry"""
+        try:
+            async with self.driver.session(**session_options(READ_ACCESS)) as session:
+                summary = await session.execute_read(_profile_tx, cypher, parameters or {})
+            slow_query_log.attach_profile(entry, summary)
+        except Exception as e:
+            logger.warning(f"PROFILE of slow query {entry['operation']} failed: {e}")
+
+
+async def _fetch_all(tx, cypher: str, parameters: dict) -> tuple:
+    """Transaction function returning all records as dicts and the result summary"""
+    result = await tx.run(cypher, parameters)
+    records = await result.data()
+    return records, await result.consume()
+
+
+async def _profile_tx(tx, cypher: str, parameters: dict):
+    """Transaction function running a query with PROFILE and returning its summary"""
+    result = await tx.run("PROFILE " + cypher, parameters)
+    return await result.consume()
+
 
-# Singleton instance
+# Singleton instances
 neo4j_db = Neo4jDatabase()
+async_neo4j_db = AsyncNeo4jDatabase()
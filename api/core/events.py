@@ -0,0 +1,120 @@
+"""In-process fan-out of newly written items to live stream subscribers"""
+
+import asyncio
+import uuid
+from collections import deque
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+from .config import settings
+
+Event = Tuple[int, dict]
+
+
+class Subscription:
+    """One client's bounded queue of events on a channel"""
+
+    def __init__(self, channel: str, accept: Callable[[dict], bool], buffer: int):
+        self.channel = channel
+        self.accept = accept
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=buffer)
+        self.overflowed = False
+        self.replay: List[Event] = []
+        self.reset = False
+
+    def offer(self, event: Event) -> bool:
+        """Queue an event; False (and overflowed) when the client has fallen behind"""
+        try:
+            self.queue.put_nowait(event)
+            return True
+        except asyncio.QueueFull:
+            self.overflowed = True
+            return False
+
+
+class EventBroker:
+    """
+    Publishes items written through the API to per-channel subscribers.
+
+    Every event gets a per-channel sequence id, and the last `history`
+    events are kept so that a reconnecting client resumes after its
+    Last-Event-ID. Event ids are "<boot id>-<seq>": sequences restart with
+    the process and differ between workers, so an id from another boot
+    can't be resumed and the subscriber is flagged for a resync instead.
+    A subscriber whose buffer fills up is dropped; it resumes from history
+    on reconnect instead of slowing the writers. Call from the event loop only.
+    """
+
+    def __init__(self, history: int = 1000, buffer: int = 256):
+        self.boot_id = uuid.uuid4().hex[:8]
+        self.history_size = history
+        self.buffer = buffer
+        self._seq: Dict[str, int] = {}
+        self._history: Dict[str, deque] = {}
+        self._subscribers: Dict[str, List[Subscription]] = {}
+        self.published: Dict[str, int] = {}
+        self.overflows: Dict[str, int] = {}
+
+    def publish(self, channel: str, items: List[dict]):
+        """Assign ids to items and deliver them to matching subscribers"""
+        if not items:
+            return
+        history = self._history.setdefault(channel, deque(maxlen=self.history_size))
+        subscribers = self._subscribers.get(channel, [])
+        seq = self._seq.get(channel, 0)
+        for item in items:
+            seq += 1
+            event = (seq, item)
+            history.append(event)
+            for sub in subscribers:
+                if not sub.overflowed and sub.accept(item):
+                    if not sub.offer(event):
+                        self.overflows[channel] = self.overflows.get(channel, 0) + 1
+        self._seq[channel] = seq
+        self.published[channel] = self.published.get(channel, 0) + len(items)
+        self._subscribers[channel] = [s for s in subscribers if not s.overflowed]
+
+    def event_id(self, seq: int) -> str:
+        return f"{self.boot_id}-{seq}"
+
+    def _resume_seq(self, last_event_id: str) -> Optional[int]:
+        """Sequence number of an event id issued by this boot, else None"""
+        boot, _, seq = last_event_id.rpartition("-")
+        if boot != self.boot_id or not seq.isdigit():
+            return None
+        return int(seq)
+
+    def subscribe(self, channel: str, accept: Callable[[dict], bool] = None,
+                  last_event_id: Optional[str] = None) -> Subscription:
+        """
+        Register a subscriber. Events after last_event_id still in history
+        are put in sub.replay; live events follow without gap or overlap.
+        sub.reset is set when last_event_id can't be resumed from: issued by
+        another boot or worker, unknown, or older than the kept history.
+        """
+        sub = Subscription(channel, accept or (lambda item: True), self.buffer)
+        if last_event_id is not None:
+            after = self._resume_seq(last_event_id)
+            history = self._history.get(channel, ())
+            oldest = history[0][0] if history else self._seq.get(channel, 0) + 1
+            if after is None or after > self._seq.get(channel, 0) or after < oldest - 1:
+                sub.reset = True
+            else:
+                sub.replay = [e for e in history if e[0] > after and sub.accept(e[1])]
+        self._subscribers.setdefault(channel, []).append(sub)
+        return sub
+
+    def unsubscribe(self, sub: Subscription):
+        subscribers = self._subscribers.get(sub.channel, [])
+        if sub in subscribers:
+            subscribers.remove(sub)
+
+    def subscribers(self) -> Iterator[Tuple[str, int]]:
+        for channel, subs in self._subscribers.items():
+            yield channel, len(subs)
+
+
+# Singleton instance
+event_broker = EventBroker(
+    history=settings.stream_history_size,
+    buffer=settings.stream_client_buffer
+)
@@ -0,0 +1,640 @@
+"""In-process graph store loaded from the Turtle files (no Neo4j needed)"""
+
+import bisect
+import random
+import re
+import threading
+from datetime import date, datetime, timedelta, timezone
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+RDF_NS = "http://www.w3.org/1999/02/22-rdf-syntax-ns#"
+RDF_TYPE = RDF_NS + "type"
+RDFS_NS = "http://www.w3.org/2000/01/rdf-schema#"
+XSD_NS = "http://www.w3.org/2001/XMLSchema#"
+UPW_NS = "http://example.org/upw#"
+DATA_NS = "http://example.org/upw/data#"
+
+# Subset of Turtle used by the ontology and sample data: @prefix, prefixed
+# names, <iri>, 'a', blank nodes, collections, numbers and strings with
+# @lang or ^^datatype
+_TOKEN = re.compile(r"""
+    (?P<ws>\s+|\#[^\n]*)
+  | (?P<iri><[^>\s]*>)
+  | (?P<string>"(?:[^"\\]|\\.)*")
+    (?:@(?P<lang>[A-Za-z][\w-]*)|\^\^(?P<dtype><[^>\s]*>|[A-Za-z][\w-]*:[\w-]*))?
+  | (?P<prefix>@prefix)
+  | (?P<pname>[A-Za-z][\w-]*:(?:[\w.-]*[\w-])?|:(?:[\w.-]*[\w-])?)
+  | (?P<a>a(?=\s))
+  | (?P<number>[+-]?\d+(?:\.\d+)?)
+  | (?P<punct>[.;,\[\]()])
+""", re.VERBOSE)
+
+_ESCAPES = {"n": "\n", "t": "\t", "r": "\r", '"': '"', "\\": "\\"}
+
+
+class TurtleError(ValueError):
+    """Raised for Turtle outside the supported subset"""
+
+
+def _unescape(text: str) -> str:
+    return re.sub(r"\\(.)", lambda m: _ESCAPES.get(m.group(1), m.group(1)), text)
+
+
+def _tokens(text: str) -> Iterator[Tuple[str, object]]:
+    pos = 0
+    while pos < len(text):
+        match = _TOKEN.match(text, pos)
+        if not match:
+            raise TurtleError(f"Unsupported Turtle at offset {pos}: {text[pos:pos + 40]!r}")
+        pos = match.end()
+        kind = match.lastgroup
+        if kind == "ws":
+            continue
+        if match.group("string") is not None:
+            yield "literal", (_unescape(match.group("string")[1:-1]), match.group("dtype"))
+        else:
+            yield kind, match.group(kind)
+
+
+def _to_value(lexical: str, datatype: Optional[str]):
+    """Convert a typed literal the way n10s stores it"""
+    local = datatype.rsplit("#", 1)[-1] if datatype else "string"
+    if local in ("double", "decimal", "float"):
+        return float(lexical)
+    if local in ("integer", "int", "long", "short"):
+        return int(lexical)
+    if local == "boolean":
+        return lexical == "true"
+    if local == "dateTime":
+        value = datetime.fromisoformat(lexical.replace("Z", "+00:00"))
+        return value if value.tzinfo else value.replace(tzinfo=timezone.utc)
+    if local == "date":
+        return date.fromisoformat(lexical)
+    return lexical
+
+
+def parse_turtle(text: str) -> Iterator[Tuple[str, str, object, bool]]:
+    """
+    Parse Turtle into (subject, predicate, object, is_iri) triples.
+
+    Literal objects are converted to Python values by their XSD datatype;
+    blank nodes get `_:bN` identifiers and collections become rdf:first /
+    rdf:rest chains.
+    """
+    prefixes = {}
+    triples = []
+    tokens = list(_tokens(text))
+    pos = 0
+    blank = 0
+
+    def take(expected=None):
+        nonlocal pos
+        if pos >= len(tokens):
+            raise TurtleError("Unexpected end of Turtle")
+        kind, value = tokens[pos]
+        if expected is not None and value != expected:
+            raise TurtleError(f"Expected {expected!r}, got {value!r}")
+        pos += 1
+        return kind, value
+
+    def peek():
+        return tokens[pos][1] if pos < len(tokens) else None
+
+    def new_blank():
+        nonlocal blank
+        blank += 1
+        return f"_:b{blank}"
+
+    def expand(kind, value):
+        if kind == "iri":
+            return value[1:-1]
+        if kind == "pname":
+            prefix, _, local = value.partition(":")
+            if prefix not in prefixes:
+                raise TurtleError(f"Unknown prefix: {prefix}")
+            return prefixes[prefix] + local
+        raise TurtleError(f"Expected IRI, got {value!r}")
+
+    def node():
+        """Parse a subject or object that is an IRI, blank node or collection"""
+        kind, value = take()
+        if value == "[":
+            subject = new_blank()
+            if peek() != "]":
+                predicate_objects(subject)
+            take("]")
+            return subject
+        if value == "(":
+            head = rest = None
+            while peek() != ")":
+                cell = new_blank()
+                if rest is None:
+                    head = cell
+                else:
+                    triples.append((rest, RDF_NS + "rest", cell, True))
+                triples.append((cell, RDF_NS + "first", *obj()))
+                rest = cell
+            take(")")
+            if rest is None:
+                return RDF_NS + "nil"
+            triples.append((rest, RDF_NS + "rest", RDF_NS + "nil", True))
+            return head
+        return expand(kind, value)
+
+    def obj():
+        kind, value = tokens[pos]
+        if kind == "literal":
+            take()
+            lexical, dtype = value
+            if dtype and not dtype.startswith("<"):
+                dtype = "<" + expand("pname", dtype) + ">"
+            return _to_value(lexical, dtype and dtype[1:-1]), False
+        if kind == "number":
+            take()
+            return (float(value) if "." in value else int(value)), False
+        return node(), True
+
+    def predicate_objects(subject):
+        while True:
+            kind, value = take()
+            predicate = RDF_TYPE if kind == "a" else expand(kind, value)
+            while True:
+                triples.append((subject, predicate, *obj()))
+                if peek() != ",":
+                    break
+                take()
+            if peek() != ";":
+                return
+            while peek() == ";":
+                take()
+            if peek() in (".", "]", None):
+                return
+
+    while pos < len(tokens):
+        if tokens[pos][0] == "prefix":
+            take()
+            name, iri = take()[1], take()[1]
+            prefixes[name.rstrip(":")] = iri[1:-1]
+            take(".")
+            continue
+        subject = node()
+        if peek() != ".":
+            predicate_objects(subject)
+        take(".")
+        yield from triples
+        triples.clear()
+
+
+def _local(iri: str) -> str:
+    return re.split(r"[#/]", iri)[-1]
+
+
+def _property_name(iri: str) -> str:
+    """n10s MAP naming: rdfs terms keep their prefix, others use the local name"""
+    if iri.startswith(RDFS_NS):
+        return "rdfs__" + _local(iri)
+    return _local(iri)
+
+
+def _ms(value: datetime) -> int:
+    return int(value.timestamp() * 1000)
+
+
+_EPOCH = datetime.fromtimestamp(0, tz=timezone.utc)
+
+# 96 energy forecast intervals per day
+FORECAST_INTERVAL = timedelta(minutes=15)
+_FORECAST_FIELDS = ("intervalIndex", "intervalStartTime", "powerConsumption", "confidenceScore")
+
+
+def ms_to_datetime(ms: int) -> datetime:
+    return datetime.fromtimestamp(ms / 1000, tz=timezone.utc)
+
+
+def _anomaly_key(anomaly: Tuple[Optional[float], str]):
+    """Sort key of (score, uri) index entries; null scores sort last when descending"""
+    return anomaly[0] is not None, anomaly[0] or 0.0, anomaly[1]
+
+
+class _Descending:
+    """Sort key wrapper with inverted order, for bisecting descending lists"""
+
+    __slots__ = ("key",)
+
+    def __init__(self, key):
+        self.key = key
+
+    def __lt__(self, other):
+        return self.key > other.key
+
+
+def _anomaly_rank(anomaly: Tuple[Optional[float], str]) -> _Descending:
+    return _Descending(_anomaly_key(anomaly))
+
+
+class ObservationSeries:
+    """Observations of one sensor, sorted by (timestamp ms, uri)"""
+
+    def __init__(self):
+        self.keys: List[Tuple[int, str]] = []
+        self.values: List[float] = []
+        self.units: List[Optional[str]] = []
+        self._uris = set()
+        self._arrays = None
+
+    def __len__(self):
+        return len(self.keys)
+
+    def add(self, ms: int, uri: str, value: float, unit: Optional[str]) -> bool:
+        """Insert in order; an existing uri is left untouched (MERGE semantics)"""
+        if uri in self._uris:
+            return False
+        self._uris.add(uri)
+        if not self.keys or self.keys[-1] < (ms, uri):
+            index = len(self.keys)
+        else:
+            index = bisect.bisect_left(self.keys, (ms, uri))
+        self.keys.insert(index, (ms, uri))
+        self.values.insert(index, value)
+        self.units.insert(index, unit)
+        self._arrays = None
+        return True
+
+    def extend_sorted(self, times: np.ndarray, values: np.ndarray, unit: str, uri_prefix: str):
+        """Bulk load observations already in time order"""
+        uris = [f"{uri_prefix}{t}" for t in times.tolist()]
+        self.keys = list(zip(times.tolist(), uris))
+        self.values = values.tolist()
+        self.units = [unit] * len(uris)
+        self._uris = set(uris)
+        self._arrays = None
+
+    def arrays(self) -> Tuple[np.ndarray, np.ndarray]:
+        """(timestamps ms, values) as NumPy arrays, rebuilt after writes"""
+        if self._arrays is None:
+            times = np.fromiter((k[0] for k in self.keys), dtype=np.int64, count=len(self.keys))
+            values = np.array([np.nan if v is None else v for v in self.values], dtype=np.float64)
+            self._arrays = (times, values)
+        return self._arrays
+
+    def span(self, from_ms: Optional[int], to_ms: Optional[int]) -> Tuple[int, int]:
+        """Index range [lo, hi) of observations with from_ms <= t < to_ms"""
+        lo = bisect.bisect_left(self.keys, (from_ms,)) if from_ms is not None else 0
+        hi = bisect.bisect_left(self.keys, (to_ms,)) if to_ms is not None else len(self.keys)
+        return lo, hi
+
+
+class MemoryGraph:
+    """
+    Resource nodes with properties and typed relationships, shaped like the
+    n10s import (labels are the rdf:type local names, predicates map to
+    property / relationship names by local name).
+
+    Observations are kept per sensor in sorted columnar series instead of
+    nodes, and the other node kinds are indexed for the service lookups.
+    """
+
+    def __init__(self):
+        self.labels: Dict[str, List[str]] = {}
+        self.props: Dict[str, dict] = {}
+        self.out: Dict[str, Dict[str, List[str]]] = {}
+        self.incoming: Dict[str, Dict[str, List[str]]] = {}
+        self.series: Dict[str, ObservationSeries] = {}
+        self.lock = threading.RLock()
+        self._reset_indexes()
+
+    def _reset_indexes(self):
+        self.equipment: Dict[str, str] = {}
+        self.sensors: Dict[str, str] = {}
+        self.anomalies: List[Tuple[float, str]] = []
+        self.failure_predictions: List[str] = []
+        self.energy_predictions: Dict[date, str] = {}
+        self.maintenance_events: List[Tuple[object, str, str]] = []
+        self.maintenance_total = 0
+
+    # Loading
+    def add_triple(self, subject: str, predicate: str, obj, is_iri: bool):
+        self.labels.setdefault(subject, [])
+        self.props.setdefault(subject, {"uri": subject})
+        if predicate == RDF_TYPE:
+            label = _local(obj)
+            if label not in self.labels[subject]:
+                self.labels[subject].append(label)
+        elif is_iri:
+            rel = _local(predicate)
+            self.out.setdefault(subject, {}).setdefault(rel, []).append(obj)
+            self.incoming.setdefault(obj, {}).setdefault(rel, []).append(subject)
+        else:
+            self.props[subject][_property_name(predicate)] = obj
+
+    def load_turtle(self, path) -> int:
+        """Load a Turtle file; returns the number of triples read"""
+        count = 0
+        for triple in parse_turtle(Path(path).read_text(encoding="utf-8")):
+            self.add_triple(*triple)
+            count += 1
+        return count
+
+    def node_type(self, uri: str) -> Optional[str]:
+        """Equivalent of labels(n)[1] after an n10s import"""
+        labels = self.labels.get(uri)
+        return labels[0] if labels else None
+
+    def has_label(self, uri: str, label: str) -> bool:
+        return label in self.labels.get(uri, ())
+
+    def related(self, uri: str, rel: str, label: str = None) -> List[str]:
+        targets = self.out.get(uri, {}).get(rel, [])
+        return [t for t in targets if label is None or self.has_label(t, label)]
+
+    def related_from(self, uri: str, rel: str, label: str = None) -> List[str]:
+        sources = self.incoming.get(uri, {}).get(rel, [])
+        return [s for s in sources if label is None or self.has_label(s, label)]
+
+    def reindex(self, compact_forecasts: bool = False):
+        """
+        Move observations into per-sensor series and rebuild the lookups;
+        compact_forecasts packs forecast points into arrays on the prediction
+        """
+        with self.lock:
+            for uri in [u for u, labels in self.labels.items() if "SensorObservation" in labels]:
+                props = self.props.pop(uri)
+                self.labels.pop(uri)
+                for sensor in self.out.pop(uri, {}).get("madeBySensor", []):
+                    self.incoming[sensor]["madeBySensor"].remove(uri)
+                    sensor_id = self.props.get(sensor, {}).get("sensorId")
+                    if sensor_id is not None and "timestamp" in props:
+                        self.series.setdefault(sensor_id, ObservationSeries()).add(
+                            _ms(props["timestamp"]), uri, props.get("value"), props.get("unit"))
+
+            self._reset_indexes()
+            for uri, props in self.props.items():
+                labels = self.labels[uri]
+                if props.get("equipmentId") is not None:
+                    self.equipment[props["equipmentId"]] = uri
+                if props.get("sensorId") is not None:
+                    self.sensors[props["sensorId"]] = uri
+                    self.series.setdefault(props["sensorId"], ObservationSeries())
+                if "AnomalyDetection" in labels:
+                    self.anomalies.append((props.get("anomalyScore"), uri))
+                if "FailurePrediction" in labels:
+                    self.failure_predictions.append(uri)
+                if "MaintenanceEvent" in labels:
+                    self.maintenance_total += 1
+                if "EnergyPrediction" in labels and props.get("forecastDate") is not None:
+                    self.energy_predictions[props["forecastDate"]] = uri
+            self._index_maintenance()
+            if compact_forecasts:
+                self._compact_forecasts()
+            self.anomalies.sort(key=_anomaly_key, reverse=True)
+            self.failure_predictions.sort(
+                key=lambda u: (self.props[u].get("predictedFailureDate") is None,
+                               self.props[u].get("predictedFailureDate") or _EPOCH))
+
+    def _compact_forecasts(self):
+        """Same layout as neo4j/migrate-energy-compact.cypher, as NumPy arrays"""
+        for uri in self.energy_predictions.values():
+            points = sorted(self.related(uri, "hasForecastPoint", "EnergyForecastPoint"),
+                            key=lambda p: self.props[p].get("intervalIndex", 0))
+            if not points:
+                continue
+            rows = [self.props[p] for p in points]
+            first = rows[0]
+            if any(r.get(k) is None for r in rows for k in _FORECAST_FIELDS):
+                continue
+            start = first["intervalStartTime"] - FORECAST_INTERVAL * first["intervalIndex"]
+            if any(r["intervalStartTime"] != start + FORECAST_INTERVAL * r["intervalIndex"]
+                   for r in rows):
+                continue
+            self.props[uri].update(
+                forecastIntervals=np.array([r["intervalIndex"] for r in rows], dtype=np.int16),
+                forecastPower=np.array([r["powerConsumption"] for r in rows], dtype=np.float64),
+                forecastConfidence=np.array([r["confidenceScore"] for r in rows], dtype=np.float64),
+                forecastStart=start,
+            )
+            for point in points:
+                self.props.pop(point)
+                self.labels.pop(point)
+                self.incoming.pop(point, None)
+                self.out.pop(point, None)
+            self.out[uri].pop("hasForecastPoint")
+
+    def forecast_points(self, uri: str) -> List[dict]:
+        """Forecast point properties of an EnergyPrediction by intervalIndex, in either layout"""
+        props = self.props[uri]
+        if "forecastPower" in props:
+            start = props["forecastStart"]
+            return [{
+                "intervalIndex": i,
+                "intervalStartTime": start + FORECAST_INTERVAL * i,
+                "powerConsumption": power,
+                "confidenceScore": confidence,
+            } for i, power, confidence in zip(props["forecastIntervals"].tolist(),
+                                              props["forecastPower"].tolist(),
+                                              props["forecastConfidence"].tolist())]
+        return sorted((self.props[p] for p in self.related(uri, "hasForecastPoint")),
+                      key=lambda p: p.get("intervalIndex", 0))
+
+    def _index_maintenance(self):
+        for equipment in self.equipment.values():
+            schedules = self.related(equipment, "hasMaintenanceSchedule", "MaintenanceSchedule")
+            for schedule in schedules:
+                for event in self.related(schedule, "hasMaintenanceEvent", "MaintenanceEvent"):
+                    scheduled = self.props[event].get("scheduledDate")
+                    self.maintenance_events.append((scheduled, event, equipment))
+        self.maintenance_events.sort(key=lambda m: (m[0] is None, m[0] or _EPOCH, m[1]))
+
+    # Observations
+    def add_observation(self, sensor_id: str, timestamp: datetime, value: float,
+                        unit: Optional[str], uri: str) -> bool:
+        """Add one observation; False for unknown sensors or an existing uri"""
+        series = self.series.get(sensor_id)
+        if series is None or sensor_id not in self.sensors:
+            return False
+        with self.lock:
+            return series.add(_ms(timestamp), uri, value, unit)
+
+    def add_anomaly(self, sensor_id: str, uri: str, score: float, timestamp: datetime,
+                    label: Optional[str] = None, description: Optional[str] = None) -> bool:
+        """Add one anomaly detection; False for unknown sensors"""
+        sensor = self.sensors.get(sensor_id)
+        if sensor is None:
+            return False
+        with self.lock:
+            self.labels[uri] = ["AnomalyDetection"]
+            self.props[uri] = {"uri": uri, "anomalyScore": score, "timestamp": timestamp,
+                               "rdfs__label": label, "rdfs__comment": description}
+            self.out.setdefault(uri, {})["madeBySensor"] = [sensor]
+            self.incoming.setdefault(sensor, {}).setdefault("madeBySensor", []).append(uri)
+            bisect.insort(self.anomalies, (score, uri), key=_anomaly_rank)
+        return True
+
+    def anomalies_after(self, after: Optional[Tuple[float, str]] = None) -> int:
+        """Index of the first anomaly ranked after the (score, uri) position"""
+        if after is None:
+            return 0
+        return bisect.bisect_right(self.anomalies, _anomaly_rank(after), key=_anomaly_rank)
+
+    def summary(self) -> dict:
+        """Dashboard counters, matching the :Stats node of the Neo4j backend"""
+        return {
+            "equipmentCount": len(self.equipment),
+            "sensorCount": len(self.sensors),
+            "anomalyCount": len(self.anomalies),
+            "predictionCount": len(self.failure_predictions),
+            "maintenanceCount": self.maintenance_total,
+        }
+
+    def counts(self) -> dict:
+        return {
+            "nodes": len(self.props),
+            "equipment": len(self.equipment),
+            "sensors": len(self.sensors),
+            "observations": sum(len(s) for s in self.series.values()),
+            "anomalies": len(self.anomalies),
+            "maintenanceEvents": len(self.maintenance_events),
+        }
+
+
+# Synthetic dataset
+_EQUIPMENT_TYPES = {
+    "Pump": ("Pressure", "Vibration", "Temperature"),
+    "ReverseOsmosisUnit": ("Pressure", "Conductivity", "Flow"),
+    "UVSterilizer": ("Temperature", "Flow", "Conductivity"),
+    "Filter": ("Pressure", "Flow", "Temperature"),
+    "ElectrodeionizationUnit": ("Conductivity", "Temperature", "Pressure"),
+    "HeatExchanger": ("Temperature", "Flow", "Vibration"),
+}
+_SENSOR_UNITS = {
+    "Pressure": ("bar", 5.0, 0.3), "Vibration": ("mm/s", 2.0, 0.4),
+    "Temperature": ("C", 25.0, 1.0), "Conductivity": ("uS/cm", 0.06, 0.01),
+    "Flow": ("m3/h", 40.0, 3.0),
+}
+
+
+def add_synthetic(graph: MemoryGraph, equipment: int, observations: int,
+                  days: int = 30, seed: int = 42):
+    """
+    Add a generated plant: `equipment` units with three sensors each,
+    `observations` readings per sensor spread over `days`, anomalies on
+    about 1% of readings, failure predictions, maintenance events and a
+    96-point energy forecast per day.
+    """
+    rng = np.random.default_rng(seed)
+    rand = random.Random(seed)
+    end_ms = _ms(datetime(2025, 1, 1, tzinfo=timezone.utc))
+    start_ms = end_ms - days * 86_400_000
+    start = ms_to_datetime(start_ms)
+    types = list(_EQUIPMENT_TYPES)
+
+    def node(uri, label, **props):
+        graph.add_triple(uri, RDF_TYPE, UPW_NS + label, True)
+        for name, value in props.items():
+            graph.add_triple(uri, UPW_NS + name, value, False)
+
+    def link(source, rel, target):
+        graph.add_triple(source, UPW_NS + rel, target, True)
+
+    for n in range(equipment):
+        kind = types[n % len(types)]
+        equipment_id = f"SYN-{n:05d}"
+        eq = f"{DATA_NS}syn-eq-{n}"
+        node(eq, kind, equipmentId=equipment_id, equipmentName=f"Synthetic {kind} {n:05d}",
+             operatingHours=float(rand.randint(100, 40_000)),
+             installationDate=date(2015 + n % 9, 1 + n % 12, 1 + n % 28))
+        for k, sensor_kind in enumerate(_EQUIPMENT_TYPES[kind]):
+            unit, mean, sd = _SENSOR_UNITS[sensor_kind]
+            sensor_id = f"SYN-{sensor_kind[:3].upper()}-{n:05d}-{k}"
+            sensor = f"{DATA_NS}syn-sensor-{n}-{k}"
+            node(sensor, f"{sensor_kind}Sensor", sensorId=sensor_id,
+                 sensorLocation=f"{kind} {n:05d}", samplingRate=60.0)
+            link(eq, "hasSensor", sensor)
+            if not observations:
+                continue
+            times = np.linspace(start_ms, end_ms, observations, endpoint=False).astype(np.int64)
+            values = mean + sd * rng.standard_normal(observations)
+            series = graph.series.setdefault(sensor_id, ObservationSeries())
+            series.extend_sorted(times, values, unit, f"{DATA_NS}obs-{sensor_id}-")
+            spikes = rng.choice(observations, size=max(1, observations // 100), replace=False)
+            for i in spikes.tolist():
+                anomaly = f"{DATA_NS}syn-anomaly-{sensor_id}-{i}"
+                node(anomaly, "AnomalyDetection",
+                     anomalyScore=round(float(rng.uniform(0.5, 1.0)), 4),
+                     timestamp=ms_to_datetime(int(times[i])))
+                graph.add_triple(anomaly, RDFS_NS + "label", f"{sensor_kind} anomaly", False)
+                link(anomaly, "madeBySensor", sensor)
+
+        if n % 3 == 0:
+            prediction = f"{DATA_NS}syn-fp-{n}"
+            node(prediction, "FailurePrediction", failureMode="Bearing wear",
+                 predictedFailureDate=start + timedelta(days=days + rand.randint(7, 180)),
+                 confidenceScore=round(rand.uniform(0.5, 0.95), 2),
+                 remainingUsefulLife=float(rand.randint(100, 4000)))
+            link(eq, "hasPrediction", prediction)
+
+        schedule = f"{DATA_NS}syn-ms-{n}"
+        node(schedule, "MaintenanceSchedule")
+        link(eq, "hasMaintenanceSchedule", schedule)
+        for j, status in enumerate(("Completed", "Scheduled")):
+            event = f"{DATA_NS}syn-me-{n}-{j}"
+            scheduled = start + timedelta(days=rand.randint(0, days * 2), hours=8)
+            node(event, "MaintenanceEvent", scheduledDate=scheduled, status=status,
+                 priority=rand.randint(1, 3), estimatedDuration=4.0,
+                 maintenanceDescription=f"Routine check of {kind} {n:05d}")
+            graph.add_triple(event, RDFS_NS + "label", f"{kind} {n:05d} maintenance", False)
+            link(schedule, "hasMaintenanceEvent", event)
+            link(event, "hasMaintenanceType",
+                 UPW_NS + ("PreventiveMaintenance" if j else "CorrectiveMaintenance"))
+
+    base = 100.0 + 40.0 * np.sin(np.linspace(0, 2 * np.pi, 96, endpoint=False) - np.pi / 2)
+    for d in range(days):
+        day = (start + timedelta(days=d)).date()
+        power = base + rng.normal(0, 5, 96)
+        prediction = f"{DATA_NS}syn-ep-{day.isoformat()}"
+        node(prediction, "EnergyPrediction", forecastDate=day,
+             totalDailyEnergy=round(float(power.sum() * 0.25), 2),
+             peakPower=round(float(power.max()), 2), confidenceScore=0.85)
+        for i in range(96):
+            point = f"{prediction}-{i}"
+            node(point, "EnergyForecastPoint", intervalIndex=i,
+                 intervalStartTime=datetime.combine(day, datetime.min.time(), timezone.utc)
+                 + timedelta(minutes=15 * i),
+                 powerConsumption=round(float(power[i]), 2), confidenceScore=0.85)
+            link(prediction, "hasForecastPoint", point)
+
+
+def build_graph(files: List[str], root=None, synthetic_equipment: int = 0,
+                synthetic_observations: int = 0, compact_forecasts: bool = False) -> MemoryGraph:
+    """Load Turtle files (relative to root) and optionally a synthetic plant"""
+    graph = MemoryGraph()
+    root = Path(root) if root else Path(__file__).resolve().parents[2]
+    for name in files:
+        path = Path(name)
+        graph.load_turtle(path if path.is_absolute() else root / path)
+    if synthetic_equipment:
+        add_synthetic(graph, synthetic_equipment, synthetic_observations)
+    graph.reindex(compact_forecasts)
+    return graph
+
+
+_graph = None
+_graph_lock = threading.Lock()
+
+
+def get_memory_graph() -> MemoryGraph:
+    """Shared graph built from the memory_graph_* settings on first use"""
+    global _graph
+    if _graph is None:
+        with _graph_lock:
+            if _graph is None:
+                from .config import settings
+                _graph = build_graph(
+                    [f.strip() for f in settings.memory_graph_files.split(",") if f.strip()],
+                    synthetic_equipment=settings.memory_graph_equipment,
+                    synthetic_observations=settings.memory_graph_observations,
+                    compact_forecasts=settings.memory_graph_compact_forecasts,
+                )
+    return _graph
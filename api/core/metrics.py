@@ -0,0 +1,232 @@
+"""Prometheus text-format metrics"""
+
+import functools
+import inspect
+import threading
+from contextvars import ContextVar
+from typing import Callable, Dict, Iterable, List, Tuple
+
+# Name of the service operation issuing the current query
+current_operation: ContextVar[str] = ContextVar("current_operation", default="unnamed")
+
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+ROW_BUCKETS = (0, 1, 10, 100, 1000, 10_000, 100_000, 1_000_000)
+
+
+def _labels(names: Tuple[str, ...], values: Tuple[str, ...], extra: str = "") -> str:
+    pairs = [f'{n}="{_escape(v)}"' for n, v in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _escape(value) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+class Counter:
+    """Monotonic counter per label set"""
+
+    def __init__(self, name: str, help: str, labels: Tuple[str, ...] = ()):
+        self.name = name
+        self.help = help
+        self.label_names = labels
+        self._values: Dict[tuple, float] = {}
+        self._lock = threading.Lock()
+
+    def inc(self, *labels: str, amount: float = 1.0):
+        with self._lock:
+            self._values[labels] = self._values.get(labels, 0.0) + amount
+
+    def get(self, *labels: str) -> float:
+        return self._values.get(labels, 0.0)
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} counter"]
+        with self._lock:
+            for labels, value in sorted(self._values.items()):
+                lines.append(f"{self.name}{_labels(self.label_names, labels)} {value}")
+        return lines
+
+
+class Histogram:
+    """Cumulative bucket histogram per label set"""
+
+    def __init__(self, name: str, help: str, labels: Tuple[str, ...] = (),
+                 buckets: Iterable[float] = LATENCY_BUCKETS):
+        self.name = name
+        self.help = help
+        self.label_names = labels
+        self.buckets = tuple(buckets)
+        self._series: Dict[tuple, list] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, *labels: str):
+        with self._lock:
+            series = self._series.get(labels)
+            if series is None:
+                # Per-bucket counts, then sum and count
+                series = self._series[labels] = [0] * len(self.buckets) + [0.0, 0]
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    series[i] += 1
+            series[-2] += value
+            series[-1] += 1
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} histogram"]
+        with self._lock:
+            for labels, series in sorted(self._series.items()):
+                for bound, count in zip(self.buckets, series):
+                    le = _labels(self.label_names, labels, f'le="{bound}"')
+                    lines.append(f"{self.name}_bucket{le} {count}")
+                inf = _labels(self.label_names, labels, 'le="+Inf"')
+                lines.append(f"{self.name}_bucket{inf} {series[-1]}")
+                lines.append(f"{self.name}_sum{_labels(self.label_names, labels)} {series[-2]}")
+                lines.append(f"{self.name}_count{_labels(self.label_names, labels)} {series[-1]}")
+        return lines
+
+
+class Gauge:
+    """Gauge (or externally kept counter) whose samples are read from a callback at scrape time"""
+
+    def __init__(self, name: str, help: str, labels: Tuple[str, ...],
+                 collect: Callable[[], Dict[tuple, float]], kind: str = "gauge"):
+        self.name = name
+        self.help = help
+        self.label_names = labels
+        self.collect = collect
+        self.kind = kind
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} {self.kind}"]
+        for labels, value in sorted(self.collect().items()):
+            lines.append(f"{self.name}{_labels(self.label_names, labels)} {value}")
+        return lines
+
+
+class MetricsRegistry:
+    """Collection of metrics rendered in Prometheus text exposition format"""
+
+    CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+    def __init__(self):
+        self._metrics = []
+
+    def register(self, metric):
+        self._metrics.append(metric)
+        return metric
+
+    def render(self) -> str:
+        lines = []
+        for metric in self._metrics:
+            try:
+                lines.extend(metric.render())
+            except Exception:
+                # A failing collector must not break the whole scrape
+                continue
+        return "\n".join(lines) + "\n"
+
+
+# Singleton registry and core metrics
+metrics = MetricsRegistry()
+
+REQUEST_LATENCY = metrics.register(Histogram(
+    "upw_http_request_duration_seconds", "HTTP request latency by route and status",
+    ("method", "route", "status")
+))
+QUERY_LATENCY = metrics.register(Histogram(
+    "upw_neo4j_query_duration_seconds",
+    "Neo4j query latency by service operation and phase "
+    "(total, wait = client/driver time, available = result_available_after, "
+    "consumed = result_consumed_after)",
+    ("operation", "phase")
+))
+QUERY_ROWS = metrics.register(Histogram(
+    "upw_neo4j_query_rows", "Rows returned per Neo4j query", ("operation",), ROW_BUCKETS
+))
+QUERY_ERRORS = metrics.register(Counter(
+    "upw_neo4j_query_errors_total", "Failed Neo4j queries by service operation", ("operation",)
+))
+QUERY_COALESCED = metrics.register(Counter(
+    "upw_neo4j_query_coalesced_total",
+    "Queries answered by an identical in-flight query instead of running again", ("operation",)
+))
+
+SCORING_BATCH_SIZE = metrics.register(Histogram(
+    "upw_scoring_batch_size", "Observations per anomaly scoring micro-batch", (), ROW_BUCKETS
+))
+SCORING_LATENCY = metrics.register(Histogram(
+    "upw_scoring_batch_duration_seconds", "Time to score one micro-batch", ()
+))
+
+
+def observe_query(elapsed: float, summary, rows: int):
+    """Record one query with timings from its result summary"""
+    operation = current_operation.get()
+    available = (getattr(summary, "result_available_after", None) or 0) / 1000
+    consumed = (getattr(summary, "result_consumed_after", None) or 0) / 1000
+    QUERY_LATENCY.observe(elapsed, operation, "total")
+    QUERY_LATENCY.observe(max(elapsed - available - consumed, 0.0), operation, "wait")
+    QUERY_LATENCY.observe(available, operation, "available")
+    QUERY_LATENCY.observe(consumed, operation, "consumed")
+    QUERY_ROWS.observe(rows, operation)
+
+
+def observe_error():
+    """Record a failed query for the current operation"""
+    QUERY_ERRORS.inc(current_operation.get())
+
+
+def observe_coalesced():
+    """Record a query that joined an identical in-flight execution"""
+    QUERY_COALESCED.inc(current_operation.get())
+
+
+def instrument_operations(cls):
+    """
+    Class decorator naming queries after the async methods that issue them.
+
+    Every coroutine or async generator static method sets current_operation
+    to "Class.method" while it runs, so new methods are covered automatically.
+    """
+    for name, attr in list(vars(cls).items()):
+        if not isinstance(attr, staticmethod) or name.startswith("_"):
+            continue
+        fn = attr.__func__
+        operation = f"{cls.__name__}.{name}"
+        if inspect.iscoroutinefunction(fn):
+            setattr(cls, name, staticmethod(_wrap_coroutine(fn, operation)))
+        elif inspect.isasyncgenfunction(fn):
+            setattr(cls, name, staticmethod(_wrap_asyncgen(fn, operation)))
+    return cls
+
+
+def _wrap_coroutine(fn, operation: str):
+    @functools.wraps(fn)
+    async def wrapper(*args, **kwargs):
+        token = current_operation.set(operation)
+        try:
+            return await fn(*args, **kwargs)
+        finally:
+            current_operation.reset(token)
+    return wrapper
+
+
+def _wrap_asyncgen(fn, operation: str):
+    @functools.wraps(fn)
+    async def wrapper(*args, **kwargs):
+        # Each step may run in a different context (e.g. a streaming response),
+        # so the name is set before every step instead of reset at the end
+        agen = fn(*args, **kwargs)
+        try:
+            while True:
+                current_operation.set(operation)
+                try:
+                    item = await agen.__anext__()
+                except StopAsyncIteration:
+                    return
+                yield item
+        finally:
+            await agen.aclose()
+    return wrapper
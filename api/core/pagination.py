@@ -0,0 +1,74 @@
+"""Keyset pagination helpers"""
+
+import base64
+import json
+from datetime import date, datetime, timezone
+
+
+def _encode_value(value):
+    """Convert a sort key value to a JSON-safe form"""
+    if hasattr(value, "to_native"):
+        value = value.to_native()
+    if isinstance(value, datetime):
+        return {"$datetime": value.isoformat()}
+    if isinstance(value, date):
+        return {"$date": value.isoformat()}
+    return value
+
+
+def _decode_value(value):
+    """Restore a sort key value encoded by _encode_value"""
+    if isinstance(value, dict):
+        if "$datetime" in value:
+            return datetime.fromisoformat(value["$datetime"])
+        if "$date" in value:
+            return date.fromisoformat(value["$date"])
+        raise ValueError("Unknown cursor value")
+    return value
+
+
+def encode_cursor(*values) -> str:
+    """Build an opaque cursor token from sort key values"""
+    raw = json.dumps([_encode_value(v) for v in values], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(token: str, *types) -> list:
+    """Decode a cursor token into its sort key values, one of each of types"""
+    try:
+        raw = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4))
+        values = json.loads(raw)
+        if not isinstance(values, list) or len(values) != len(types):
+            raise ValueError
+        values = [_decode_value(v) for v in values]
+    except ValueError:
+        raise ValueError(f"Invalid cursor: {token}")
+    if not all(isinstance(v, t) for v, t in zip(values, types)):
+        raise ValueError(f"Invalid cursor: {token}")
+    return values
+
+
+def as_utc(value: datetime) -> datetime:
+    """Treat naive datetimes as UTC so they compare with stored DateTimes"""
+    if value is not None and value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value
+
+
+def paginate(rows: list, limit: int, *key_columns: str) -> tuple:
+    """
+    Trim a page fetched with LIMIT limit + 1 and build the next cursor.
+
+    Columns starting with an underscore are internal sort keys and are
+    removed from the returned rows.
+
+    Returns:
+        Tuple of (rows, next_cursor or None)
+    """
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        last = rows[-1]
+        next_cursor = encode_cursor(*(last[c] for c in key_columns))
+    page = [{k: v for k, v in row.items() if not k.startswith("_")} for row in rows]
+    return page, next_cursor
@@ -0,0 +1,102 @@
+"""Fast JSON responses for large list endpoints"""
+
+from functools import lru_cache
+from typing import Any, Optional, get_args, get_origin
+
+from fastapi import Response
+from pydantic import BaseModel, TypeAdapter
+
+from .config import settings
+
+JSON_MEDIA_TYPE = "application/json"
+
+
+def _default(value):
+    """Convert Neo4j temporals to Python ones, which orjson encodes natively"""
+    if hasattr(value, "to_native"):
+        return value.to_native()
+    raise TypeError(f"Type is not JSON serializable: {type(value).__name__}")
+
+
+@lru_cache(maxsize=None)
+def _adapter(data_type) -> TypeAdapter:
+    from api.models import APIResponse
+    return TypeAdapter(APIResponse[data_type])
+
+
+@lru_cache(maxsize=None)
+def _item_fields(data_type) -> tuple:
+    """Field names of the row model for List[Model] data, else empty"""
+    args = get_args(data_type)
+    if get_origin(data_type) is list and args and isinstance(args[0], type) \
+            and issubclass(args[0], BaseModel):
+        return tuple(args[0].model_fields)
+    return ()
+
+
+@lru_cache(maxsize=None)
+def _float_fields(data_type) -> tuple:
+    """Row model fields declared float (or Optional[float]) for List[Model] data"""
+    if not _item_fields(data_type):
+        return ()
+    fields = get_args(data_type)[0].model_fields
+    return tuple(name for name, field in fields.items()
+                 if field.annotation in (float, Optional[float]))
+
+
+def _coerce(row: dict, floats: tuple) -> dict:
+    """Row with integer values of float fields as floats (copied only if any)"""
+    for name in floats:
+        if type(row.get(name)) is int:
+            return {**row, **{n: float(row[n]) for n in floats if type(row.get(n)) is int}}
+    return row
+
+
+def render_fast(payload: dict) -> bytes:
+    """Encode a response payload straight from dicts to JSON bytes"""
+    import orjson
+    return orjson.dumps(payload, default=_default, option=orjson.OPT_NON_STR_KEYS)
+
+
+def api_response(data_type, data: Any = None, response: Response = None,
+                 exclude_unset: bool = False, **fields):
+    """
+    Build a list endpoint response.
+
+    By default this returns an APIResponse for FastAPI to validate against the
+    response model. With FAST_SERIALIZATION the rows are encoded directly with
+    orjson, skipping both Pydantic passes; they are still validated when DEBUG
+    is on. Rows of List[Model] data are projected onto the model fields and
+    integers in float fields (Neo4j returns 14800 for 14800.0) become floats,
+    so the JSON matches the validated response. With exclude_unset, row
+    fields missing from the data are left out instead of sent as null (for
+    routes with response_model_exclude_unset). Headers already set on
+    response (e.g. ETag) are carried over.
+    """
+    from api.models import APIResponse
+
+    payload = {"success": True, "data": data, "count": None, "message": None, "nextCursor": None}
+    payload.update(fields)
+    if not settings.fast_serialization:
+        return APIResponse(**payload)
+
+    names = _item_fields(data_type)
+    floats = _float_fields(data_type)
+    # Rows of one query share their columns, so the first row decides
+    if names and data and data[0].keys() != set(names):
+        if exclude_unset:
+            data = payload["data"] = [{name: row[name] for name in names if name in row}
+                                      for row in data]
+        else:
+            data = payload["data"] = [{name: row.get(name) for name in names} for row in data]
+    if floats and data:
+        payload["data"] = [_coerce(row, floats) for row in data]
+
+    if settings.debug:
+        _adapter(data_type).validate_python(payload)
+    fast = Response(render_fast(payload), media_type=JSON_MEDIA_TYPE)
+    if response is not None:
+        for name, value in response.headers.items():
+            if name.lower() != "content-length":
+                fast.headers[name] = value
+    return fast
@@ -0,0 +1,126 @@
+"""Slow-query log with optional PROFILE capture"""
+
+import logging
+import threading
+import time
+from collections import deque
+from datetime import datetime, timezone
+from typing import Optional
+
+from .config import settings
+from .metrics import current_operation
+
+logger = logging.getLogger(__name__)
+
+# Parameter lists longer than this are summarised in the log
+MAX_LOGGED_ITEMS = 20
+
+
+def _loggable(value):
+    """Shorten bulky parameters (e.g. ingestion batches) for the log"""
+    if isinstance(value, (list, tuple)) and len(value) > MAX_LOGGED_ITEMS:
+        return f"<{len(value)} items>"
+    if isinstance(value, dict):
+        return {k: _loggable(v) for k, v in value.items()}
+    if hasattr(value, "isoformat"):
+        return value.isoformat()
+    return value
+
+
+def plan_tree(plan) -> dict:
+    """Convert a driver profile/plan dict into a compact operator tree"""
+    args = plan.get("args", {})
+    return {
+        "operator": plan.get("operatorType"),
+        "details": args.get("Details"),
+        "rows": plan.get("rows"),
+        "dbHits": plan.get("dbHits"),
+        "children": [plan_tree(child) for child in plan.get("children", [])],
+    }
+
+
+def total_db_hits(tree: dict) -> int:
+    """Sum db hits over an operator tree"""
+    return (tree.get("dbHits") or 0) + sum(total_db_hits(c) for c in tree["children"])
+
+
+class SlowQueryLog:
+    """Ring buffer of queries slower than a threshold"""
+
+    def __init__(self, threshold_ms: float = 500, size: int = 200,
+                 profile_interval: float = 60.0):
+        self.threshold_ms = threshold_ms
+        self.profile_interval = profile_interval
+        self._entries: deque = deque(maxlen=size)
+        self._last_profiled = {}
+        self._lock = threading.Lock()
+
+    def observe(self, elapsed: float, summary, rows: int,
+                cypher: str, parameters: dict = None) -> Optional[dict]:
+        """Record the query if it exceeded the threshold; returns the entry"""
+        elapsed_ms = elapsed * 1000
+        if elapsed_ms < self.threshold_ms:
+            return None
+        available = getattr(summary, "result_available_after", None) or 0
+        consumed = getattr(summary, "result_consumed_after", None) or 0
+        entry = {
+            "operation": current_operation.get(),
+            "query": " ".join(cypher.split()),
+            "parameters": _loggable(parameters or {}),
+            "elapsedMs": round(elapsed_ms, 3),
+            "availableMs": available,
+            "consumedMs": consumed,
+            "waitMs": round(max(elapsed_ms - available - consumed, 0.0), 3),
+            "rows": rows,
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "profile": None,
+        }
+        with self._lock:
+            self._entries.append(entry)
+        logger.warning(
+            f"Slow query {entry['operation']} took {entry['elapsedMs']:.1f} ms "
+            f"(available {available} ms, consumed {consumed} ms, rows {rows}) "
+            f"params={entry['parameters']}"
+        )
+        return entry
+
+    def should_profile(self, entry: dict, read: bool) -> bool:
+        """PROFILE reads only, and each query text at most once per interval"""
+        if not settings.slow_query_profile or not read:
+            return False
+        now = time.monotonic()
+        with self._lock:
+            last = self._last_profiled.get(entry["query"])
+            if last is not None and now - last < self.profile_interval:
+                return False
+            self._last_profiled[entry["query"]] = now
+            return True
+
+    @staticmethod
+    def attach_profile(entry: dict, summary):
+        """Store db hits and operator tree of a PROFILE run on the entry"""
+        if not summary.profile:
+            return
+        tree = plan_tree(summary.profile)
+        entry["profile"] = {"dbHits": total_db_hits(tree), "plan": tree}
+
+    def entries(self, limit: int = None) -> list:
+        """Recorded slow queries, newest first"""
+        with self._lock:
+            items = list(reversed(self._entries))
+        return items[:limit] if limit else items
+
+    def clear(self) -> int:
+        """Empty the buffer"""
+        with self._lock:
+            count = len(self._entries)
+            self._entries.clear()
+            self._last_profiled.clear()
+            return count
+
+
+# Singleton instance
+slow_query_log = SlowQueryLog(
+    threshold_ms=settings.slow_query_threshold_ms,
+    size=settings.slow_query_log_size
+)
@@ -0,0 +1,150 @@
+"""Graph change counters for conditional GET (ETag / Last-Modified)"""
+
+import hashlib
+import logging
+import threading
+import time
+import uuid
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+
+from fastapi import Depends, HTTPException, Request, Response
+
+logger = logging.getLogger(__name__)
+
+
+class GraphVersions:
+    """
+    Per-tag version counters bumped by every write path, plus change marks
+    kept in the graph.
+
+    Tags match the query cache tags. The counters only see writes made by
+    this process; the change marks (tag -> time of its last change, read from
+    `source` at most every `check_interval` seconds) cover writes by other
+    API workers, the ML loader writing to Neo4j directly and re-imports. The
+    boot id is part of every ETag, so a restarted process never answers 304
+    for a tag it has lost track of.
+    """
+
+    def __init__(self):
+        self.boot_id = uuid.uuid4().hex[:8]
+        self._started = datetime.now(timezone.utc).replace(microsecond=0)
+        self._global = 0
+        self._changes = 0
+        self._global_modified = self._started
+        self._versions = {}
+        self._modified = {}
+        self._marks = {}
+        self._marks_checked = None
+        self._source = None
+        self.check_interval = 1.0
+        self._lock = threading.Lock()
+
+    def bump(self, *tags: str):
+        """Record a change to the given tags (all data if no tags given)"""
+        now = datetime.now(timezone.utc).replace(microsecond=0)
+        with self._lock:
+            self._changes += 1
+            if not tags:
+                self._global += 1
+                self._global_modified = now
+            for tag in tags:
+                self._versions[tag] = self._versions.get(tag, 0) + 1
+                self._modified[tag] = now
+
+    def set_source(self, source, check_interval: float = 1.0):
+        """Use an async callable returning the graph's {tag: datetime} change marks"""
+        self._source = source
+        self.check_interval = check_interval
+        self._marks_checked = None
+
+    async def refresh_marks(self):
+        """Re-read the graph's change marks if check_interval has passed"""
+        now = time.monotonic()
+        if self._source is None or (self._marks_checked is not None
+                                    and now - self._marks_checked < self.check_interval):
+            return
+        # Concurrent requests keep using the previous marks meanwhile
+        self._marks_checked = now
+        try:
+            marks = await self._source()
+        except Exception as e:
+            logger.warning(f"Reading graph change marks failed: {e}")
+            return
+        with self._lock:
+            self._marks = marks or {}
+
+    def state(self, tags: tuple = ()) -> tuple:
+        """Counters that change whenever data covered by tags (any data without tags) changes"""
+        with self._lock:
+            if not tags:
+                return (self._changes,)
+            return (self._global,) + tuple(self._versions.get(t, 0) for t in tags)
+
+    def etag(self, tags: tuple, variant: str = "") -> str:
+        """Strong ETag for data covered by tags; variant distinguishes query parameters"""
+        with self._lock:
+            versions = ".".join(str(self._versions.get(t, 0)) for t in tags)
+            state = f"{self.boot_id}-{self._global}-{versions}"
+            marks = "|".join(str(self._marks.get(t)) for t in tags)
+        digest = hashlib.blake2b(f"{variant}#{marks}".encode(), digest_size=6).hexdigest()
+        return f'"{state}-{digest}"'
+
+    def last_modified(self, tags: tuple) -> datetime:
+        """Time of the latest change to any of the tags"""
+        with self._lock:
+            times = ([self._global_modified]
+                     + [self._modified.get(t, self._started) for t in tags]
+                     + [self._marks[t] for t in tags if self._marks.get(t) is not None])
+        return max(times).replace(microsecond=0)
+
+
+def _matches(header: str, etag: str) -> bool:
+    """Weak comparison of an If-None-Match header against an ETag"""
+    if header.strip() == "*":
+        return True
+    candidates = [c.strip() for c in header.split(",")]
+    return any(c.removeprefix("W/") == etag for c in candidates)
+
+
+def _not_modified_since(header: str, last_modified: datetime) -> bool:
+    try:
+        since = parsedate_to_datetime(header)
+    except (TypeError, ValueError):
+        return False
+    if since.tzinfo is None:
+        since = since.replace(tzinfo=timezone.utc)
+    return last_modified <= since
+
+
+def conditional_get(*tags: str):
+    """
+    Dependency answering conditional GETs for data covered by tags.
+
+    Raises a 304 before the endpoint runs when the client's copy is current;
+    otherwise sets ETag / Last-Modified on the response.
+    """
+    async def check(request: Request, response: Response):
+        await graph_versions.refresh_marks()
+        etag = graph_versions.etag(tags, f"{request.url.path}?{request.url.query}")
+        last_modified = graph_versions.last_modified(tags)
+        headers = {
+            "ETag": etag,
+            "Last-Modified": format_datetime(last_modified, usegmt=True),
+            "Cache-Control": "no-cache",
+        }
+        if_none_match = request.headers.get("if-none-match")
+        if_modified_since = request.headers.get("if-modified-since")
+        if if_none_match is not None:
+            fresh = _matches(if_none_match, etag)
+        else:
+            fresh = (if_modified_since is not None
+                     and _not_modified_since(if_modified_since, last_modified))
+        if fresh:
+            raise HTTPException(status_code=304, headers=headers)
+        response.headers.update(headers)
+    return Depends(check)
+
+
+# Singleton instance
+graph_versions = GraphVersions()
@@ -1,30 +1,58 @@
 """UPW Process API - Main Application"""
 
-from fastapi import FastAPI
+import time
+
+from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import PlainTextResponse
 from contextlib import asynccontextmanager
 
+from api.core.compression import CompressionMiddleware
+from api.core.coalesce import single_flight
 from api.core.config import settings
-from api.core.database import neo4j_db
+from api.core.database import neo4j_db, async_neo4j_db
+from api.core.events import event_broker
+from api.core.metrics import metrics, Gauge, REQUEST_LATENCY
 from api.routers import (
     equipment_router,
     sensors_router,
     anomalies_router,
     predictions_router,
-    maintenance_router
+    maintenance_router,
+    cache_router,
+    observations_router,
+    debug_router,
+    summary_router,
+    stream_router
 )
-from api.services import Neo4jService
+from api.core.memory_graph import get_memory_graph
+from api.services import GraphService, observation_writer, summary_refresher, anomaly_scorer
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Startup and shutdown events"""
     # Startup
-    neo4j_db.connect()
-    print("Connected to Neo4j")
+    if settings.graph_backend == "memory":
+        print(f"Loaded in-memory graph: {get_memory_graph().counts()}")
+    else:
+        db = async_neo4j_db if settings.neo4j_async else neo4j_db
+        db.connect()
+        print(f"Connected to Neo4j ({'async' if settings.neo4j_async else 'sync'} driver)")
+    observation_writer.start()
+    summary_refresher.start()
+    anomaly_scorer.start()
     yield
     # Shutdown
-    neo4j_db.close()
+    await anomaly_scorer.stop()
+    await summary_refresher.stop()
+    await observation_writer.stop()
+    if settings.graph_backend == "memory":
+        return
+    if settings.neo4j_async:
+        await async_neo4j_db.close()
+    else:
+        neo4j_db.close()
     print("Disconnected from Neo4j")
 
 
@@ -45,12 +73,76 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+if settings.compression_min_size:
+    app.add_middleware(CompressionMiddleware, minimum_size=settings.compression_min_size)
+
+# Metrics
+metrics.register(Gauge(
+    "upw_neo4j_pool_connections", "Driver connection pool connections by state", ("state",),
+    lambda: {(state,): GraphService.get_pool_stats()[key]
+             for state, key in (("in_use", "inUse"), ("idle", "idle"))}
+))
+metrics.register(Gauge(
+    "upw_cache_hit_ratio", "Query cache hit ratio", (),
+    lambda: {(): GraphService.get_cache_stats()["hitRatio"]}
+))
+metrics.register(Gauge(
+    "upw_cache_lookups_total", "Query cache lookups by outcome", ("outcome",),
+    lambda: {(k,): v for k, v in GraphService.get_cache_stats().items() if k in ("hits", "misses")},
+    kind="counter"
+))
+metrics.register(Gauge(
+    "upw_neo4j_queries_in_flight", "Distinct Neo4j reads running (identical calls share one)", (),
+    lambda: {(): single_flight.in_flight()}
+))
+metrics.register(Gauge(
+    "upw_stream_subscribers", "Live stream subscribers by channel", ("channel",),
+    lambda: {(channel,): n for channel, n in event_broker.subscribers()}
+))
+metrics.register(Gauge(
+    "upw_stream_events_total", "Events published to live streams", ("channel",),
+    lambda: {(channel,): n for channel, n in event_broker.published.items()},
+    kind="counter"
+))
+metrics.register(Gauge(
+    "upw_stream_overflows_total", "Subscribers dropped because their buffer was full", ("channel",),
+    lambda: {(channel,): n for channel, n in event_broker.overflows.items()},
+    kind="counter"
+))
+metrics.register(Gauge(
+    "upw_scoring_queued_items", "Observations waiting for an anomaly scoring batch", (),
+    lambda: {(): anomaly_scorer.stats()["queued"]}
+))
+
+
+@app.middleware("http")
+async def record_request_latency(request: Request, call_next):
+    """Record request latency by route template, so path parameters do not add series"""
+    start = time.perf_counter()
+    status = 500
+    try:
+        response = await call_next(request)
+        status = response.status_code
+        return response
+    finally:
+        route = request.scope.get("route")
+        path = getattr(route, "path", "unmatched")
+        REQUEST_LATENCY.observe(time.perf_counter() - start, request.method, path, str(status))
+
+
 # Include routers
 app.include_router(equipment_router)
 app.include_router(sensors_router)
 app.include_router(anomalies_router)
 app.include_router(predictions_router)
 app.include_router(maintenance_router)
+app.include_router(cache_router)
+app.include_router(observations_router)
+if settings.debug:
+    # Exposes query text and parameters
+    app.include_router(debug_router)
+app.include_router(summary_router)
+app.include_router(stream_router)
 
 
 @app.get("/", tags=["Root"])
@@ -64,16 +156,27 @@ async def root():
             "equipment": "/api/equipment",
             "sensors": "/api/sensors",
             "anomalies": "/api/anomalies",
+            "scoring": "/api/anomalies/score",
             "predictions": "/api/predictions",
-            "maintenance": "/api/maintenance"
+            "maintenance": "/api/maintenance",
+            "observations": "/api/observations",
+            "summary": "/api/summary",
+            "stream": "/api/stream/anomalies",
+            "cache": "/api/cache/stats"
         }
     }
 
 
+@app.get("/metrics", tags=["Health"], include_in_schema=False)
+async def get_metrics():
+    """Prometheus metrics"""
+    return PlainTextResponse(metrics.render(), media_type=metrics.CONTENT_TYPE)
+
+
 @app.get("/health", tags=["Health"])
 async def health_check():
     """Health check endpoint"""
-    return Neo4jService.health_check()
+    return await GraphService.health_check()
 
 
 if __name__ == "__main__":
@@ -1,15 +1,29 @@
-from .equipment import Equipment, EquipmentWithSensors
-from .sensor import Sensor, SensorObservation
-from .anomaly import Anomaly
-from .prediction import FailurePrediction, EnergyPrediction, EnergyForecastPoint
+from .equipment import Equipment, EquipmentWithSensors, EquipmentDetail
+from .sensor import Sensor, SensorObservation, SeriesPoint
+from .anomaly import Anomaly, AnomalyIn, ScoreIn, AnomalyScore, ScorerStats
+from .prediction import (
+    FailurePrediction, EnergyPrediction, EnergyForecastPoint,
+    EnergyRange, EnergyRangeAggregates, EnergyExtreme
+)
 from .maintenance import MaintenanceEvent
+from .cache import CacheStats
+from .summary import DashboardSummary
+from .ingest import ObservationIn, IngestResult, IngestStats
+from .debug import SlowQuery, QueryProfile, PlanOperator
+from .request import BatchRequest, LatestObservationsRequest
 from .response import APIResponse
 
 __all__ = [
-    'Equipment', 'EquipmentWithSensors',
-    'Sensor', 'SensorObservation',
-    'Anomaly',
+    'Equipment', 'EquipmentWithSensors', 'EquipmentDetail',
+    'Sensor', 'SensorObservation', 'SeriesPoint',
+    'Anomaly', 'AnomalyIn', 'ScoreIn', 'AnomalyScore', 'ScorerStats',
     'FailurePrediction', 'EnergyPrediction', 'EnergyForecastPoint',
+    'EnergyRange', 'EnergyRangeAggregates', 'EnergyExtreme',
     'MaintenanceEvent',
+    'CacheStats',
+    'DashboardSummary',
+    'ObservationIn', 'IngestResult', 'IngestStats',
+    'SlowQuery', 'QueryProfile', 'PlanOperator',
+    'BatchRequest', 'LatestObservationsRequest',
     'APIResponse'
 ]
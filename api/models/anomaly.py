@@ -1,7 +1,9 @@
 """Anomaly models"""
 
-from pydantic import BaseModel
+from datetime import datetime
+from pydantic import BaseModel, Field
 from typing import Optional
+from .fields import Temporal
 
 
 class Anomaly(BaseModel):
@@ -9,5 +11,43 @@ class Anomaly(BaseModel):
     score: Optional[float] = None
     label: Optional[str] = None
     description: Optional[str] = None
-    timestamp: Optional[str] = None
+    timestamp: Temporal = None
     sensorId: Optional[str] = None
+
+
+class AnomalyIn(BaseModel):
+    """Anomaly detection result submitted by a detector"""
+    sensorId: str
+    score: float = Field(ge=0.0, le=1.0)
+    timestamp: datetime
+    label: Optional[str] = None
+    description: Optional[str] = None
+
+
+class ScoreIn(BaseModel):
+    """Observation submitted for anomaly scoring"""
+    sensorId: str
+    timestamp: datetime
+    value: float
+
+
+class AnomalyScore(BaseModel):
+    """Anomaly score of one submitted observation"""
+    sensorId: str
+    timestamp: datetime
+    value: float
+    score: float
+    label: str
+
+
+class ScorerStats(BaseModel):
+    """Anomaly scorer counters"""
+    running: bool = False
+    models: int = 0
+    sensors: int = 0
+    requests: int = 0
+    items: int = 0
+    batches: int = 0
+    failed: int = 0
+    queued: int = 0
+    meanBatchSize: float = 0.0
@@ -0,0 +1,18 @@
+"""Cache models"""
+
+from pydantic import BaseModel
+
+
+class CacheStats(BaseModel):
+    """Query cache counters"""
+    enabled: bool = True
+    entries: int = 0
+    bytes: int = 0
+    maxEntries: int = 0
+    maxBytes: int = 0
+    hits: int = 0
+    misses: int = 0
+    hitRatio: float = 0.0
+    evictions: int = 0
+    expirations: int = 0
+    invalidations: int = 0
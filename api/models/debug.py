@@ -0,0 +1,33 @@
+"""Debug models"""
+
+from pydantic import BaseModel
+from typing import Any, Dict, List, Optional
+
+
+class PlanOperator(BaseModel):
+    """Operator in a PROFILE plan"""
+    operator: Optional[str] = None
+    details: Optional[str] = None
+    rows: Optional[int] = None
+    dbHits: Optional[int] = None
+    children: List["PlanOperator"] = []
+
+
+class QueryProfile(BaseModel):
+    """PROFILE result of a slow query"""
+    dbHits: int = 0
+    plan: PlanOperator
+
+
+class SlowQuery(BaseModel):
+    """Query that exceeded the slow-query threshold"""
+    operation: str
+    query: str
+    parameters: Dict[str, Any] = {}
+    elapsedMs: float
+    availableMs: float = 0
+    consumedMs: float = 0
+    waitMs: float = 0
+    rows: int = 0
+    timestamp: str
+    profile: Optional[QueryProfile] = None
@@ -3,6 +3,12 @@
 from pydantic import BaseModel
 from typing import Optional, List
 
+from .anomaly import Anomaly
+from .fields import Temporal
+from .maintenance import MaintenanceEvent
+from .prediction import FailurePrediction
+from .sensor import SensorObservation
+
 
 class Equipment(BaseModel):
     """Equipment model"""
@@ -10,7 +16,7 @@ class Equipment(BaseModel):
     name: Optional[str] = None
     type: Optional[str] = None
     operatingHours: Optional[float] = None
-    installationDate: Optional[str] = None
+    installationDate: Temporal = None
 
 
 class SensorInfo(BaseModel):
@@ -24,3 +30,20 @@ class EquipmentWithSensors(BaseModel):
     equipmentId: Optional[str] = None
     equipmentName: Optional[str] = None
     sensors: List[SensorInfo] = []
+
+
+class SensorWithObservations(BaseModel):
+    """Sensor with its latest observations"""
+    id: Optional[str] = None
+    type: Optional[str] = None
+    location: Optional[str] = None
+    samplingRate: Optional[float] = None
+    observations: List[SensorObservation] = []
+
+
+class EquipmentDetail(Equipment):
+    """Equipment with sensors, anomalies, predictions and upcoming maintenance"""
+    sensors: List[SensorWithObservations] = []
+    anomalies: List[Anomaly] = []
+    failurePredictions: List[FailurePrediction] = []
+    maintenanceEvents: List[MaintenanceEvent] = []
@@ -0,0 +1,17 @@
+"""Shared model field types"""
+
+from pydantic import BeforeValidator
+from typing import Annotated, Optional
+
+
+def _iso(value):
+    """Render Neo4j / Python temporal values as ISO 8601 strings"""
+    if hasattr(value, "to_native"):
+        value = value.to_native()
+    if hasattr(value, "isoformat"):
+        return value.isoformat()
+    return value
+
+
+# Date/time returned by Neo4j, exposed as an ISO 8601 string
+Temporal = Annotated[Optional[str], BeforeValidator(_iso)]
@@ -0,0 +1,31 @@
+"""Observation ingestion models"""
+
+from datetime import datetime
+from pydantic import BaseModel
+from typing import Optional
+
+
+class ObservationIn(BaseModel):
+    """Observation submitted for ingestion"""
+    sensorId: str
+    timestamp: datetime
+    value: float
+    unit: Optional[str] = None
+
+
+class IngestResult(BaseModel):
+    """Result of one ingestion request"""
+    accepted: int = 0
+    queued: int = 0
+
+
+class IngestStats(BaseModel):
+    """Write-behind queue counters"""
+    accepted: int = 0
+    rejected: int = 0
+    flushed: int = 0
+    skipped: int = 0
+    failed: int = 0
+    queued: int = 0
+    batches: int = 0
+    retries: int = 0
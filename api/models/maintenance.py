@@ -2,6 +2,7 @@
 
 from pydantic import BaseModel
 from typing import Optional
+from .fields import Temporal
 
 
 class MaintenanceEvent(BaseModel):
@@ -9,8 +10,8 @@ class MaintenanceEvent(BaseModel):
     equipmentId: Optional[str] = None
     equipmentName: Optional[str] = None
     eventName: Optional[str] = None
-    scheduledDate: Optional[str] = None
-    completedDate: Optional[str] = None
+    scheduledDate: Temporal = None
+    completedDate: Temporal = None
     priority: Optional[int] = None
     duration: Optional[float] = None
     status: Optional[str] = None
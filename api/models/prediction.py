@@ -2,6 +2,7 @@
 
 from pydantic import BaseModel
 from typing import Optional, List
+from .fields import Temporal
 
 
 class FailurePrediction(BaseModel):
@@ -9,7 +10,7 @@ class FailurePrediction(BaseModel):
     equipmentId: Optional[str] = None
     equipmentName: Optional[str] = None
     failureMode: Optional[str] = None
-    predictedDate: Optional[str] = None
+    predictedDate: Temporal = None
     confidence: Optional[float] = None
     rul: Optional[float] = None
     comment: Optional[str] = None
@@ -18,15 +19,49 @@ class FailurePrediction(BaseModel):
 class EnergyForecastPoint(BaseModel):
     """Energy forecast point model"""
     intervalIndex: Optional[int] = None
-    startTime: Optional[str] = None
+    startTime: Temporal = None
     powerKW: Optional[float] = None
     confidence: Optional[float] = None
 
 
 class EnergyPrediction(BaseModel):
     """Energy prediction model"""
-    forecastDate: Optional[str] = None
+    forecastDate: Temporal = None
     totalEnergy: Optional[float] = None
     peakPower: Optional[float] = None
     confidence: Optional[float] = None
     forecastPoints: List[EnergyForecastPoint] = []
+
+
+class EnergyExtreme(BaseModel):
+    """Highest or lowest forecast point of a range"""
+    date: Temporal = None
+    interval: Optional[int] = None
+    powerKW: Optional[float] = None
+
+
+class EnergyRangeAggregates(BaseModel):
+    """Per-day (one entry per date) and range statistics of a forecast matrix"""
+    periods: List[str] = []
+    dailyEnergy: List[Optional[float]] = []
+    dailyPeak: List[Optional[float]] = []
+    dailyPeakInterval: List[Optional[int]] = []
+    dailyMin: List[Optional[float]] = []
+    dailyMinInterval: List[Optional[int]] = []
+    periodMeans: List[List[Optional[float]]] = []
+    intervalMeans: List[Optional[float]] = []
+    weekOverWeek: List[Optional[float]] = []
+    weekOverWeekPct: List[Optional[float]] = []
+    totalEnergy: Optional[float] = None
+    meanPower: Optional[float] = None
+    peak: Optional[EnergyExtreme] = None
+    minimum: Optional[EnergyExtreme] = None
+
+
+class EnergyRange(BaseModel):
+    """Dense day x 96 power matrix (kW, null where no forecast) with aggregates"""
+    dates: List[Temporal] = []
+    intervals: int = 96
+    forecastDays: int = 0
+    power: List[List[Optional[float]]] = []
+    aggregates: EnergyRangeAggregates
@@ -0,0 +1,14 @@
+"""API request models"""
+
+from pydantic import BaseModel, Field
+from typing import List
+
+
+class BatchRequest(BaseModel):
+    """Batch lookup by IDs"""
+    ids: List[str] = Field(..., min_length=1, max_length=1000)
+
+
+class LatestObservationsRequest(BatchRequest):
+    """Latest observations for many sensors"""
+    limit: int = Field(1, ge=1, le=100)
@@ -12,3 +12,4 @@ class APIResponse(BaseModel, Generic[T]):
     data: Optional[T] = None
     count: Optional[int] = None
     message: Optional[str] = None
+    nextCursor: Optional[str] = None
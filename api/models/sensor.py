@@ -2,6 +2,7 @@
 
 from pydantic import BaseModel
 from typing import Optional
+from .fields import Temporal
 
 
 class Sensor(BaseModel):
@@ -15,6 +16,17 @@ class Sensor(BaseModel):
 class SensorObservation(BaseModel):
     """Sensor observation model"""
     sensorId: Optional[str] = None
-    timestamp: Optional[str] = None
+    timestamp: Temporal = None
     value: Optional[float] = None
     unit: Optional[str] = None
+
+
+class SeriesPoint(BaseModel):
+    """Aggregated or downsampled time series point"""
+    timestamp: Temporal = None
+    value: Optional[float] = None
+    avg: Optional[float] = None
+    min: Optional[float] = None
+    max: Optional[float] = None
+    count: Optional[int] = None
+    sum: Optional[float] = None
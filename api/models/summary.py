@@ -0,0 +1,15 @@
+"""Dashboard summary models"""
+
+from pydantic import BaseModel
+
+from .fields import Temporal
+
+
+class DashboardSummary(BaseModel):
+    """Graph-wide counters for the overview KPI cards"""
+    equipmentCount: int = 0
+    sensorCount: int = 0
+    anomalyCount: int = 0
+    predictionCount: int = 0
+    maintenanceCount: int = 0
+    updatedAt: Temporal = None
@@ -3,11 +3,21 @@ from .sensors import router as sensors_router
 from .anomalies import router as anomalies_router
 from .predictions import router as predictions_router
 from .maintenance import router as maintenance_router
+from .cache import router as cache_router
+from .observations import router as observations_router
+from .debug import router as debug_router
+from .summary import router as summary_router
+from .stream import router as stream_router
 
 __all__ = [
     'equipment_router',
     'sensors_router',
     'anomalies_router',
     'predictions_router',
-    'maintenance_router'
+    'maintenance_router',
+    'cache_router',
+    'observations_router',
+    'debug_router',
+    'summary_router',
+    'stream_router'
 ]
@@ -1,15 +1,91 @@
 """Anomalies API router"""
 
-from fastapi import APIRouter
-from typing import List
-from api.models import Anomaly, APIResponse
-from api.services import Neo4jService
+from datetime import datetime
+from fastapi import APIRouter, HTTPException, Request, Response, Query
+from typing import List, Optional
+from api.core.bodies import parse_items
+from api.core.pagination import as_utc
+from api.core.responses import api_response
+from api.core.versions import conditional_get
+from api.models import Anomaly, AnomalyIn, AnomalyScore, ScoreIn, ScorerStats, APIResponse
+from api.services import GraphService, anomaly_scorer
+from api.services.ingest import anomaly_row
 
 router = APIRouter(prefix="/api/anomalies", tags=["Anomalies"])
 
 
-@router.get("", response_model=APIResponse[List[Anomaly]])
-async def get_anomalies(threshold: float = 0.0):
-    """Get anomalies above threshold"""
-    data = Neo4jService.get_anomalies(threshold)
-    return APIResponse(success=True, data=data, count=len(data))
+@router.get("", response_model=APIResponse[List[Anomaly]],
+            dependencies=[conditional_get("anomalies")])
+async def get_anomalies(response: Response,
+                        threshold: float = 0.0,
+                        limit: int = Query(100, ge=1, le=1000),
+                        cursor: Optional[str] = None,
+                        from_time: Optional[datetime] = Query(None, alias="from"),
+                        to_time: Optional[datetime] = Query(None, alias="to")):
+    """Get anomalies above threshold, paged by score"""
+    try:
+        data, next_cursor = await GraphService.get_anomalies(
+            threshold, limit, cursor, from_time, to_time
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return api_response(List[Anomaly], data, response, count=len(data), nextCursor=next_cursor)
+
+
+@router.post("", status_code=201, response_model=APIResponse)
+async def create_anomalies(anomalies: List[AnomalyIn]):
+    """Record detector results and push them to /api/stream/anomalies subscribers"""
+    if not anomalies:
+        raise HTTPException(status_code=400, detail="No anomalies in request body")
+    rows = [anomaly_row(a.sensorId, a.score, a.timestamp, a.label, a.description)
+            for a in anomalies]
+    written = await GraphService.write_anomalies(rows)
+    skipped = len(rows) - written
+    return APIResponse(success=True, count=written,
+                       message=f"{skipped} skipped (unknown sensor)" if skipped else None)
+
+
+@router.post("/score", response_model=APIResponse[List[AnomalyScore]])
+async def score_observations(request: Request, response: Response,
+                             persist: bool = False,
+                             threshold: float = Query(0.5, ge=0.0, le=1.0)):
+    """
+    Score observations with the resident anomaly detectors.
+
+    Accepts one {sensorId, timestamp, value} object, a JSON array or
+    newline-delimited JSON (application/x-ndjson). Concurrent requests are
+    scored together in micro-batches. With persist=true, results scoring at
+    least threshold are recorded as anomalies and streamed like POST
+    /api/anomalies, and the values enter the sensors' scoring windows;
+    without it scoring is a dry run that leaves them unchanged. Returns 503
+    when no model is available.
+    """
+    observations = parse_items(ScoreIn, await request.body(),
+                               request.headers.get("content-type", ""), allow_single=True)
+    if not observations:
+        raise HTTPException(status_code=400, detail="No observations in request body")
+
+    items = [(o.sensorId, as_utc(o.timestamp), o.value) for o in observations]
+    try:
+        results = await anomaly_scorer.score(items, update=persist)
+    except (RuntimeError, OSError, LookupError) as e:
+        raise HTTPException(status_code=503, detail=f"Anomaly scoring unavailable: {e}")
+
+    data = [{"sensorId": sensor_id, "timestamp": timestamp, "value": value,
+             "score": score, "label": label}
+            for (sensor_id, timestamp, value), (score, label) in zip(items, results)]
+    message = None
+    if persist:
+        rows = [anomaly_row(r["sensorId"], r["score"], r["timestamp"],
+                            f"ML detected anomaly ({r['label']})",
+                            f"Anomaly detected with score {r['score']:.4f}")
+                for r in data if r["score"] >= threshold]
+        written = await GraphService.write_anomalies(rows) if rows else 0
+        message = f"{written} persisted"
+    return api_response(List[AnomalyScore], data, response, count=len(data), message=message)
+
+
+@router.get("/score/stats", response_model=APIResponse[ScorerStats])
+async def get_scorer_stats():
+    """Get request, batch and resident model counters of the anomaly scorer"""
+    return APIResponse(success=True, data=anomaly_scorer.stats())
@@ -0,0 +1,21 @@
+"""Cache API router"""
+
+from fastapi import APIRouter, Query
+from typing import List, Optional
+from api.models import CacheStats, APIResponse
+from api.services import GraphService
+
+router = APIRouter(prefix="/api/cache", tags=["Cache"])
+
+
+@router.get("/stats", response_model=APIResponse[CacheStats])
+async def get_cache_stats():
+    """Get query cache hit/miss/eviction counters"""
+    return APIResponse(success=True, data=GraphService.get_cache_stats())
+
+
+@router.post("/invalidate", response_model=APIResponse)
+async def invalidate_cache(tag: Optional[List[str]] = Query(None)):
+    """Invalidate cached results by tag (all entries if no tag given)"""
+    count = GraphService.invalidate_cache(*(tag or []))
+    return APIResponse(success=True, count=count, message=f"Invalidated {count} cache entries")
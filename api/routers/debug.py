@@ -0,0 +1,22 @@
+"""Debug API router"""
+
+from fastapi import APIRouter, Query
+from typing import List
+from api.core.slow_queries import slow_query_log
+from api.models import SlowQuery, APIResponse
+
+router = APIRouter(prefix="/debug", tags=["Debug"])
+
+
+@router.get("/slow-queries", response_model=APIResponse[List[SlowQuery]])
+async def get_slow_queries(limit: int = Query(50, ge=1, le=1000)):
+    """Get the most recent queries slower than SLOW_QUERY_THRESHOLD_MS, newest first"""
+    entries = slow_query_log.entries(limit)
+    return APIResponse(success=True, data=entries, count=len(entries))
+
+
+@router.delete("/slow-queries", response_model=APIResponse)
+async def clear_slow_queries():
+    """Clear the slow-query buffer"""
+    count = slow_query_log.clear()
+    return APIResponse(success=True, count=count, message=f"Cleared {count} slow queries")
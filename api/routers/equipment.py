@@ -1,9 +1,10 @@
 """Equipment API router"""
 
-from fastapi import APIRouter, HTTPException
-from typing import List
-from api.models import Equipment, Sensor, APIResponse
-from api.services import Neo4jService
+from fastapi import APIRouter, HTTPException, Query
+from typing import Dict, List, Optional
+from api.core.responses import api_response
+from api.models import Equipment, EquipmentDetail, Sensor, APIResponse, BatchRequest
+from api.services import GraphService
 
 router = APIRouter(prefix="/api/equipment", tags=["Equipment"])
 
@@ -11,14 +12,23 @@ router = APIRouter(prefix="/api/equipment", tags=["Equipment"])
 @router.get("", response_model=APIResponse[List[Equipment]])
 async def get_all_equipment():
     """Get all equipment"""
-    data = Neo4jService.get_all_equipment()
-    return APIResponse(success=True, data=data, count=len(data))
+    data = await GraphService.get_all_equipment()
+    return api_response(List[Equipment], data, count=len(data))
+
+
+@router.post("/batch", response_model=APIResponse[Dict[str, Optional[Equipment]]])
+async def get_equipment_batch(request: BatchRequest):
+    """Get many equipment by ID; IDs that do not exist map to null"""
+    data = await GraphService.get_equipment_batch(request.ids)
+    found = sum(1 for v in data.values() if v is not None)
+    return APIResponse(success=True, data=data, count=found,
+                       message=f"{len(data) - found} not found" if found < len(data) else None)
 
 
 @router.get("/{equipment_id}", response_model=APIResponse[Equipment])
 async def get_equipment(equipment_id: str):
     """Get equipment by ID"""
-    data = Neo4jService.get_equipment_by_id(equipment_id)
+    data = await GraphService.get_equipment_by_id(equipment_id)
     if not data:
         raise HTTPException(status_code=404, detail=f"Equipment {equipment_id} not found")
     return APIResponse(success=True, data=data)
@@ -27,5 +37,19 @@ async def get_equipment(equipment_id: str):
 @router.get("/{equipment_id}/sensors", response_model=APIResponse[List[Sensor]])
 async def get_equipment_sensors(equipment_id: str):
     """Get sensors for equipment"""
-    data = Neo4jService.get_equipment_sensors(equipment_id)
-    return APIResponse(success=True, data=data, count=len(data))
+    data = await GraphService.get_equipment_sensors(equipment_id)
+    return api_response(List[Sensor], data, count=len(data))
+
+
+@router.get("/{equipment_id}/full", response_model=APIResponse[EquipmentDetail])
+async def get_equipment_detail(equipment_id: str,
+                               observations: int = Query(10, ge=0, le=1000),
+                               limit: int = Query(20, ge=0, le=1000)):
+    """
+    Get equipment with sensors (latest `observations` each), recent anomalies,
+    failure predictions and upcoming maintenance (`limit` each) in one call
+    """
+    data = await GraphService.get_equipment_detail(equipment_id, observations, limit)
+    if not data:
+        raise HTTPException(status_code=404, detail=f"Equipment {equipment_id} not found")
+    return APIResponse(success=True, data=data)
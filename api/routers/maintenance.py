@@ -1,15 +1,26 @@
 """Maintenance API router"""
 
-from fastapi import APIRouter
+from datetime import datetime
+from fastapi import APIRouter, HTTPException, Query
 from typing import List, Optional
+from api.core.responses import api_response
 from api.models import MaintenanceEvent, APIResponse
-from api.services import Neo4jService
+from api.services import GraphService
 
 router = APIRouter(prefix="/api/maintenance", tags=["Maintenance"])
 
 
 @router.get("", response_model=APIResponse[List[MaintenanceEvent]])
-async def get_maintenance_events(status: Optional[str] = None):
-    """Get maintenance events, optionally filtered by status"""
-    data = Neo4jService.get_maintenance_events(status)
-    return APIResponse(success=True, data=data, count=len(data))
+async def get_maintenance_events(status: Optional[str] = None,
+                                 limit: int = Query(100, ge=1, le=1000),
+                                 cursor: Optional[str] = None,
+                                 from_time: Optional[datetime] = Query(None, alias="from"),
+                                 to_time: Optional[datetime] = Query(None, alias="to")):
+    """Get maintenance events, optionally filtered by status, paged by scheduled date"""
+    try:
+        data, next_cursor = await GraphService.get_maintenance_events(
+            status, limit, cursor, from_time, to_time
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return api_response(List[MaintenanceEvent], data, count=len(data), nextCursor=next_cursor)
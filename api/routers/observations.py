@@ -0,0 +1,50 @@
+"""Observation ingestion API router"""
+
+from fastapi import APIRouter, HTTPException, Request
+from api.core.bodies import parse_items
+from api.models import ObservationIn, IngestResult, IngestStats, APIResponse
+from api.services import GraphService, observation_writer
+from api.services.ingest import observation_row
+
+router = APIRouter(prefix="/api/observations", tags=["Observations"])
+
+
+@router.post("", status_code=202, response_model=APIResponse[IngestResult])
+async def ingest_observations(request: Request):
+    """
+    Queue sensor observations for batched writing.
+
+    Accepts a JSON array or newline-delimited JSON (application/x-ndjson).
+    Returns 422 for unknown sensor IDs, 413 for requests larger than the
+    queue and 429 when the write-behind queue is full.
+    """
+    observations = parse_items(ObservationIn, await request.body(),
+                               request.headers.get("content-type", ""))
+    if not observations:
+        raise HTTPException(status_code=400, detail="No observations in request body")
+    if len(observations) > observation_writer.max_queued:
+        raise HTTPException(
+            status_code=413,
+            detail=f"At most {observation_writer.max_queued} observations per request")
+
+    known = {sensor["id"] for sensor in await GraphService.get_all_sensors()}
+    unknown = sorted({o.sensorId for o in observations} - known)
+    if unknown:
+        raise HTTPException(status_code=422, detail={"message": "Unknown sensor IDs",
+                                                     "unknownSensors": unknown})
+
+    rows = [observation_row(o.sensorId, o.timestamp, o.value, o.unit) for o in observations]
+    if not observation_writer.submit(rows):
+        raise HTTPException(status_code=429, detail="Ingestion queue is full, retry later",
+                            headers={"Retry-After": "1"})
+    return APIResponse(
+        success=True,
+        data=IngestResult(accepted=len(rows), queued=observation_writer.queued),
+        count=len(rows)
+    )
+
+
+@router.get("/stats", response_model=APIResponse[IngestStats])
+async def get_ingest_stats():
+    """Get accepted/flushed/failed counters of the write-behind queue"""
+    return APIResponse(success=True, data=observation_writer.stats())
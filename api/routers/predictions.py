@@ -1,24 +1,50 @@
 """Predictions API router"""
 
-from fastapi import APIRouter, HTTPException
+from datetime import date
+from fastapi import APIRouter, HTTPException, Query, Response
 from typing import List, Optional
-from api.models import FailurePrediction, EnergyPrediction, APIResponse
-from api.services import Neo4jService
+from api.core.responses import api_response
+from api.core.versions import conditional_get
+from api.models import FailurePrediction, EnergyPrediction, EnergyRange, APIResponse
+from api.services import GraphService
+from api.services.energy import MAX_RANGE_DAYS, energy_range
 
 router = APIRouter(prefix="/api/predictions", tags=["Predictions"])
 
 
-@router.get("/failure", response_model=APIResponse[List[FailurePrediction]])
-async def get_failure_predictions():
+@router.get("/failure", response_model=APIResponse[List[FailurePrediction]],
+            dependencies=[conditional_get("predictions")])
+async def get_failure_predictions(response: Response):
     """Get failure predictions"""
-    data = Neo4jService.get_failure_predictions()
-    return APIResponse(success=True, data=data, count=len(data))
+    data = await GraphService.get_failure_predictions()
+    return api_response(List[FailurePrediction], data, response, count=len(data))
 
 
-@router.get("/energy", response_model=APIResponse[EnergyPrediction])
+@router.get("/energy", response_model=APIResponse[EnergyPrediction],
+            dependencies=[conditional_get("predictions")])
 async def get_energy_prediction(date: Optional[str] = None):
-    """Get energy prediction for date"""
-    data = Neo4jService.get_energy_prediction(date)
+    """Get energy prediction for date (the latest forecast without one)"""
+    data = await GraphService.get_energy_prediction(date)
     if not data:
         raise HTTPException(status_code=404, detail="Energy prediction not found")
     return APIResponse(success=True, data=data)
+
+
+@router.get("/energy/range", response_model=APIResponse[EnergyRange],
+            dependencies=[conditional_get("predictions")])
+async def get_energy_range(response: Response,
+                           from_date: date = Query(..., alias="from"),
+                           to_date: date = Query(..., alias="to")):
+    """
+    Get forecasts for from..to (inclusive) as a dense day x 96 power matrix.
+
+    Aggregates (daily totals, peak/min intervals, period means, week-over-week
+    deltas) are computed server-side in one vectorized pass.
+    """
+    days = (to_date - from_date).days + 1
+    if days < 1 or days > MAX_RANGE_DAYS:
+        raise HTTPException(status_code=400,
+                            detail=f"Range must be 1 to {MAX_RANGE_DAYS} days with from <= to")
+    rows = await GraphService.get_energy_range(from_date, to_date)
+    data = energy_range(rows, from_date, to_date)
+    return api_response(EnergyRange, data, response, count=data["forecastDays"])
@@ -1,9 +1,17 @@
 """Sensors API router"""
 
-from fastapi import APIRouter, HTTPException
-from typing import List
-from api.models import Sensor, SensorObservation, APIResponse
-from api.services import Neo4jService
+from datetime import datetime
+from fastapi import APIRouter, HTTPException, Query
+from fastapi.responses import StreamingResponse
+from typing import Dict, List, Optional
+from api.core.responses import api_response
+from api.models import (
+    Sensor, SensorObservation, SeriesPoint, APIResponse,
+    BatchRequest, LatestObservationsRequest
+)
+from api.services import GraphService
+from api.services.export import ENCODERS, MEDIA_TYPES, OBSERVATION_COLUMNS
+from api.services.series import parse_aggregates, parse_bucket
 
 router = APIRouter(prefix="/api/sensors", tags=["Sensors"])
 
@@ -11,21 +19,104 @@ router = APIRouter(prefix="/api/sensors", tags=["Sensors"])
 @router.get("", response_model=APIResponse[List[Sensor]])
 async def get_all_sensors():
     """Get all sensors"""
-    data = Neo4jService.get_all_sensors()
-    return APIResponse(success=True, data=data, count=len(data))
+    data = await GraphService.get_all_sensors()
+    return api_response(List[Sensor], data, count=len(data))
+
+
+@router.post("/batch", response_model=APIResponse[Dict[str, Optional[Sensor]]])
+async def get_sensor_batch(request: BatchRequest):
+    """Get many sensors by ID; IDs that do not exist map to null"""
+    data = await GraphService.get_sensor_batch(request.ids)
+    found = sum(1 for v in data.values() if v is not None)
+    return APIResponse(success=True, data=data, count=found,
+                       message=f"{len(data) - found} not found" if found < len(data) else None)
+
+
+@router.post("/observations/latest",
+             response_model=APIResponse[Dict[str, Optional[List[SensorObservation]]]])
+async def get_latest_observations(request: LatestObservationsRequest):
+    """Get the latest observations for many sensors; unknown sensors map to null"""
+    data = await GraphService.get_latest_observations(request.ids, request.limit)
+    found = sum(1 for v in data.values() if v is not None)
+    return APIResponse(success=True, data=data, count=found,
+                       message=f"{len(data) - found} not found" if found < len(data) else None)
 
 
 @router.get("/{sensor_id}", response_model=APIResponse[Sensor])
 async def get_sensor(sensor_id: str):
     """Get sensor by ID"""
-    data = Neo4jService.get_sensor_by_id(sensor_id)
+    data = await GraphService.get_sensor_by_id(sensor_id)
     if not data:
         raise HTTPException(status_code=404, detail=f"Sensor {sensor_id} not found")
     return APIResponse(success=True, data=data)
 
 
 @router.get("/{sensor_id}/observations", response_model=APIResponse[List[SensorObservation]])
-async def get_sensor_observations(sensor_id: str, limit: int = 100):
-    """Get observations for sensor"""
-    data = Neo4jService.get_sensor_observations(sensor_id, limit)
-    return APIResponse(success=True, data=data, count=len(data))
+async def get_sensor_observations(sensor_id: str,
+                                  limit: int = Query(100, ge=1, le=10000),
+                                  cursor: Optional[str] = None,
+                                  from_time: Optional[datetime] = Query(None, alias="from"),
+                                  to_time: Optional[datetime] = Query(None, alias="to")):
+    """Get observations for sensor, newest first"""
+    try:
+        data, next_cursor = await GraphService.get_sensor_observations(
+            sensor_id, limit, cursor, from_time, to_time
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return api_response(List[SensorObservation], data, count=len(data), nextCursor=next_cursor)
+
+
+@router.get("/{sensor_id}/observations/export")
+async def export_sensor_observations(sensor_id: str,
+                                     fmt: str = Query("ndjson", alias="format",
+                                                      pattern="^(ndjson|csv|arrow)$"),
+                                     from_time: Optional[datetime] = Query(None, alias="from"),
+                                     to_time: Optional[datetime] = Query(None, alias="to")):
+    """Stream full observation history for sensor as NDJSON, CSV or Arrow IPC"""
+    if not await GraphService.get_sensor_by_id(sensor_id):
+        raise HTTPException(status_code=404, detail=f"Sensor {sensor_id} not found")
+    if fmt == "arrow":
+        try:
+            import pyarrow  # noqa: F401
+        except ImportError:
+            raise HTTPException(status_code=400, detail="Arrow export requires pyarrow")
+
+    rows = GraphService.stream_sensor_observations(sensor_id, from_time, to_time)
+    extension = {"ndjson": "ndjson", "csv": "csv", "arrow": "arrows"}[fmt]
+    return StreamingResponse(
+        ENCODERS[fmt](rows, OBSERVATION_COLUMNS),
+        media_type=MEDIA_TYPES[fmt],
+        headers={"Content-Disposition": f'attachment; filename="{sensor_id}.{extension}"'}
+    )
+
+
+@router.get("/{sensor_id}/series", response_model=APIResponse[List[SeriesPoint]],
+            response_model_exclude_unset=True)
+async def get_sensor_series(sensor_id: str,
+                            from_time: Optional[datetime] = Query(None, alias="from"),
+                            to_time: Optional[datetime] = Query(None, alias="to"),
+                            mode: str = Query("bucket", pattern="^(bucket|lttb|minmax)$"),
+                            bucket: str = "15m",
+                            agg: str = "avg,min,max,count",
+                            points: int = Query(1000, ge=3, le=100000)):
+    """
+    Get a chart-ready series for sensor.
+
+    - bucket: fixed-width time buckets aggregated in Neo4j (agg=avg,min,max,count,sum)
+    - lttb / minmax: downsampled to about `points` raw points
+
+    Points only carry the fields of their mode: value, or the requested aggregates.
+    """
+    if mode == "bucket":
+        try:
+            data = await GraphService.get_sensor_series(
+                sensor_id, parse_bucket(bucket), parse_aggregates(agg), from_time, to_time
+            )
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+    else:
+        data = await GraphService.get_sensor_series_downsampled(
+            sensor_id, points, mode, from_time, to_time
+        )
+    return api_response(List[SeriesPoint], data, count=len(data), exclude_unset=True)
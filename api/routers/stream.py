@@ -0,0 +1,121 @@
+"""Live stream API router (Server-Sent Events)"""
+
+import asyncio
+import json
+from typing import List, Optional
+
+from fastapi import APIRouter, HTTPException, Query, Request
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import StreamingResponse
+
+from api.core.config import settings
+from api.core.events import Subscription, event_broker
+from api.services import GraphService
+
+router = APIRouter(prefix="/api/stream", tags=["Stream"])
+
+SSE_MEDIA_TYPE = "text/event-stream"
+
+
+def _last_event_id(request: Request, last_event_id: Optional[str]) -> Optional[str]:
+    """Resume point from the Last-Event-ID header (sent by EventSource on reconnect) or query"""
+    return request.headers.get("last-event-id") or last_event_id
+
+
+async def _sensor_filter(sensors: Optional[List[str]], equipment: Optional[str]) -> Optional[set]:
+    """Sensor IDs to pass, from sensor= and the sensors of equipment= (None: all)"""
+    if not sensors and not equipment:
+        return None
+    allowed = set(sensors or ())
+    if equipment:
+        if not await GraphService.get_equipment_by_id(equipment):
+            raise HTTPException(status_code=404, detail=f"Equipment {equipment} not found")
+        allowed |= {s["id"] for s in await GraphService.get_equipment_sensors(equipment)}
+    return allowed
+
+
+def _format(event: str, seq: int, item: dict) -> bytes:
+    data = json.dumps(jsonable_encoder(item), separators=(",", ":"))
+    return f"id: {event_broker.event_id(seq)}\nevent: {event}\ndata: {data}\n\n".encode()
+
+
+def _reset() -> bytes:
+    """Tell the client its Last-Event-ID can't be resumed; it should reload via the REST API"""
+    data = json.dumps({"bootId": event_broker.boot_id}, separators=(",", ":"))
+    return f"event: reset\ndata: {data}\n\n".encode()
+
+
+async def _events(request: Request, sub: Subscription, event: str):
+    """
+    Replay missed events, then forward live ones with keepalive comments.
+
+    A client whose Last-Event-ID can't be resumed gets a `reset` event first.
+    A client whose buffer overflowed gets an `overflow` event and the stream
+    ends; EventSource reconnects with Last-Event-ID and resumes from history.
+    """
+    try:
+        yield b"retry: 3000\n\n"
+        if sub.reset:
+            yield _reset()
+        for seq, item in sub.replay:
+            yield _format(event, seq, item)
+        sub.replay = []
+        while True:
+            if sub.overflowed and sub.queue.empty():
+                yield b"event: overflow\ndata: {}\n\n"
+                return
+            try:
+                seq, item = await asyncio.wait_for(sub.queue.get(), settings.stream_heartbeat)
+            except asyncio.TimeoutError:
+                if await request.is_disconnected():
+                    return
+                yield b": keepalive\n\n"
+                continue
+            yield _format(event, seq, item)
+    finally:
+        event_broker.unsubscribe(sub)
+
+
+def _stream(request: Request, sub: Subscription, event: str) -> StreamingResponse:
+    return StreamingResponse(
+        _events(request, sub, event), media_type=SSE_MEDIA_TYPE,
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+
+@router.get("/anomalies")
+async def stream_anomalies(request: Request,
+                           threshold: float = 0.0,
+                           equipment: Optional[str] = None,
+                           sensor: Optional[List[str]] = Query(None),
+                           last_event_id: Optional[str] = Query(None, alias="lastEventId")):
+    """
+    Server-Sent Events feed of anomalies as they are written.
+
+    Filters: score >= threshold, sensors of one equipment and/or sensor IDs.
+    Reconnect with Last-Event-ID to receive events missed in between.
+    """
+    resume = _last_event_id(request, last_event_id)
+    sensors = await _sensor_filter(sensor, equipment)
+    sub = event_broker.subscribe(
+        "anomalies",
+        lambda a: a["score"] >= threshold and (sensors is None or a["sensorId"] in sensors),
+        resume
+    )
+    return _stream(request, sub, "anomaly")
+
+
+@router.get("/observations")
+async def stream_observations(request: Request,
+                              sensor: Optional[List[str]] = Query(None),
+                              equipment: Optional[str] = None,
+                              last_event_id: Optional[str] = Query(None, alias="lastEventId")):
+    """Server-Sent Events feed of observations as they are written, by sensor or equipment"""
+    resume = _last_event_id(request, last_event_id)
+    sensors = await _sensor_filter(sensor, equipment)
+    sub = event_broker.subscribe(
+        "observations",
+        lambda o: sensors is None or o["sensorId"] in sensors,
+        resume
+    )
+    return _stream(request, sub, "observation")
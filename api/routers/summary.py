@@ -0,0 +1,24 @@
+"""Dashboard summary API router"""
+
+from fastapi import APIRouter
+from api.core.versions import conditional_get
+from api.models import DashboardSummary, APIResponse
+from api.services import GraphService
+from api.services.repository import SUMMARY_TAGS
+
+router = APIRouter(prefix="/api/summary", tags=["Summary"])
+
+
+@router.get("", response_model=APIResponse[DashboardSummary],
+            dependencies=[conditional_get(*SUMMARY_TAGS)])
+async def get_summary():
+    """Get the overview counters from the materialized :Stats node"""
+    data = await GraphService.get_summary()
+    return APIResponse(success=True, data=data)
+
+
+@router.post("/refresh", response_model=APIResponse[DashboardSummary])
+async def refresh_summary():
+    """Recount the summary now instead of waiting for the periodic refresh"""
+    data = await GraphService.refresh_summary()
+    return APIResponse(success=True, data=data, message="Summary refreshed")
@@ -1,3 +1,10 @@
+from .repository import GraphRepository
 from .neo4j_service import Neo4jService
+from .memory_service import MemoryGraphService
+from .graph import GraphService
+from .ingest import observation_writer
+from .summary import summary_refresher
+from .scoring import anomaly_scorer
 
-__all__ = ['Neo4jService']
+__all__ = ['GraphRepository', 'Neo4jService', 'MemoryGraphService', 'GraphService',
+           'observation_writer', 'summary_refresher', 'anomaly_scorer']
@@ -0,0 +1,116 @@
+"""Energy forecast range matrix and aggregates"""
+
+from datetime import date, timedelta
+from typing import Optional
+
+import numpy as np
+
+INTERVALS_PER_DAY = 96
+INTERVAL_HOURS = 0.25
+# Six-hour periods of 24 intervals each, in interval order
+PERIODS = ("night", "morning", "afternoon", "evening")
+# Longest range served by /api/predictions/energy/range
+MAX_RANGE_DAYS = 731
+
+
+def _native(value):
+    return value.to_native() if hasattr(value, "to_native") else value
+
+
+def forecast_matrix(rows: list, from_date: date, to_date: date) -> np.ndarray:
+    """
+    Dense (days x 96) power matrix for from_date..to_date inclusive.
+
+    Rows carry forecastDate, intervals and power (aligned lists); days and
+    intervals without a forecast point are NaN.
+    """
+    days = (to_date - from_date).days + 1
+    power = np.full((days, INTERVALS_PER_DAY), np.nan)
+    for row in rows:
+        day = (_native(row["forecastDate"]) - from_date).days
+        intervals = np.asarray(row["intervals"], dtype=np.int64)
+        values = np.asarray(row["power"], dtype=np.float64)
+        valid = (intervals >= 0) & (intervals < INTERVALS_PER_DAY)
+        if 0 <= day < days:
+            power[day, intervals[valid]] = values[valid]
+    return power
+
+
+def _nullable(values: np.ndarray, mask: Optional[np.ndarray] = None) -> list:
+    """Array to list with NaN (or masked-out entries) as None"""
+    missing = np.isnan(values) if mask is None else ~mask
+    return np.where(missing, None, values).tolist()
+
+
+def _masked_mean(total: np.ndarray, count: np.ndarray) -> np.ndarray:
+    return np.divide(total, count, out=np.full(total.shape, np.nan), where=count > 0)
+
+
+def _extreme(power: np.ndarray, filled: np.ndarray, from_date: date, peak: bool):
+    """Largest (or smallest) point of the whole range"""
+    if not filled.any():
+        return None
+    flat = np.where(filled, power, -np.inf if peak else np.inf)
+    day, interval = np.unravel_index(np.argmax(flat) if peak else np.argmin(flat), power.shape)
+    return {"date": from_date + timedelta(days=int(day)), "interval": int(interval),
+            "powerKW": float(power[day, interval])}
+
+
+def energy_aggregates(power: np.ndarray, from_date: date) -> dict:
+    """
+    Daily totals, peak/min intervals, period and interval means, and
+    week-over-week deltas of a (days x 96) matrix, in vectorized passes.
+    """
+    days = len(power)
+    rows = np.arange(days)
+    filled = ~np.isnan(power)
+    has_day = filled.any(axis=1)
+    zeroed = np.where(filled, power, 0.0)
+
+    daily_energy = np.where(has_day, zeroed.sum(axis=1) * INTERVAL_HOURS, np.nan)
+    peak_interval = np.where(filled, power, -np.inf).argmax(axis=1)
+    min_interval = np.where(filled, power, np.inf).argmin(axis=1)
+
+    per_period = INTERVALS_PER_DAY // len(PERIODS)
+    period_means = _masked_mean(zeroed.reshape(days, len(PERIODS), per_period).sum(axis=2),
+                                filled.reshape(days, len(PERIODS), per_period).sum(axis=2))
+    interval_means = _masked_mean(zeroed.sum(axis=0), filled.sum(axis=0))
+
+    week_delta = np.full(days, np.nan)
+    week_pct = np.full(days, np.nan)
+    if days > 7:
+        previous = daily_energy[:-7]
+        week_delta[7:] = daily_energy[7:] - previous
+        week_pct[7:] = np.divide(week_delta[7:] * 100, previous,
+                                 out=np.full(days - 7, np.nan),
+                                 where=~np.isnan(previous) & (previous != 0))
+
+    return {
+        "periods": list(PERIODS),
+        "dailyEnergy": _nullable(daily_energy),
+        "dailyPeak": _nullable(power[rows, peak_interval], has_day),
+        "dailyPeakInterval": _nullable(peak_interval, has_day),
+        "dailyMin": _nullable(power[rows, min_interval], has_day),
+        "dailyMinInterval": _nullable(min_interval, has_day),
+        "periodMeans": _nullable(period_means),
+        "intervalMeans": _nullable(interval_means),
+        "weekOverWeek": _nullable(week_delta),
+        "weekOverWeekPct": _nullable(week_pct),
+        "totalEnergy": float(np.nansum(daily_energy)) if has_day.any() else None,
+        "meanPower": float(zeroed.sum() / filled.sum()) if has_day.any() else None,
+        "peak": _extreme(power, filled, from_date, peak=True),
+        "minimum": _extreme(power, filled, from_date, peak=False),
+    }
+
+
+def energy_range(rows: list, from_date: date, to_date: date) -> dict:
+    """EnergyRange response body: dates, dense power matrix and aggregates"""
+    power = forecast_matrix(rows, from_date, to_date)
+    days = len(power)
+    return {
+        "dates": [from_date + timedelta(days=d) for d in range(days)],
+        "intervals": INTERVALS_PER_DAY,
+        "forecastDays": int((~np.isnan(power)).any(axis=1).sum()),
+        "power": _nullable(power),
+        "aggregates": energy_aggregates(power, from_date),
+    }
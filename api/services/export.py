@@ -0,0 +1,100 @@
+"""Streaming encoders for bulk exports"""
+
+import csv
+import io
+import json
+from typing import AsyncIterator, Dict, List
+
+# Rows are encoded in chunks so each write to the socket carries many rows
+CHUNK_ROWS = 1000
+
+# Column name -> value type (used for the Arrow schema)
+OBSERVATION_COLUMNS = {
+    "sensorId": "string",
+    "timestamp": "timestamp",
+    "value": "float",
+    "unit": "string",
+}
+
+MEDIA_TYPES = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv",
+    "arrow": "application/vnd.apache.arrow.stream",
+}
+
+
+def _native(value):
+    """Convert Neo4j temporal values to Python equivalents"""
+    return value.to_native() if hasattr(value, "to_native") else value
+
+
+def _text(value):
+    """Convert a value to its text form for NDJSON/CSV"""
+    value = _native(value)
+    return value.isoformat() if hasattr(value, "isoformat") else value
+
+
+async def _chunks(rows: AsyncIterator[dict], size: int = CHUNK_ROWS) -> AsyncIterator[List[dict]]:
+    """Group rows into lists of up to size rows"""
+    chunk = []
+    async for row in rows:
+        chunk.append(row)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+async def encode_ndjson(rows: AsyncIterator[dict], columns: Dict[str, str]) -> AsyncIterator[bytes]:
+    """Encode rows as newline-delimited JSON"""
+    async for chunk in _chunks(rows):
+        lines = [json.dumps({c: _text(row.get(c)) for c in columns}) for row in chunk]
+        yield ("\n".join(lines) + "\n").encode()
+
+
+async def encode_csv(rows: AsyncIterator[dict], columns: Dict[str, str]) -> AsyncIterator[bytes]:
+    """Encode rows as CSV with a header line"""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(list(columns))
+    async for chunk in _chunks(rows):
+        writer.writerows([_text(row.get(c)) for c in columns] for row in chunk)
+        yield buffer.getvalue().encode()
+        buffer.seek(0)
+        buffer.truncate()
+    if buffer.tell():
+        yield buffer.getvalue().encode()
+
+
+async def encode_arrow(rows: AsyncIterator[dict], columns: Dict[str, str]) -> AsyncIterator[bytes]:
+    """Encode rows as an Arrow IPC stream, one record batch per chunk"""
+    import pyarrow as pa
+
+    types = {
+        "string": pa.string(),
+        "timestamp": pa.timestamp("us", tz="UTC"),
+        "float": pa.float64(),
+        "int": pa.int64(),
+    }
+    schema = pa.schema([(name, types[kind]) for name, kind in columns.items()])
+
+    sink = io.BytesIO()
+    writer = pa.ipc.new_stream(sink, schema)
+    async for chunk in _chunks(rows):
+        batch = pa.RecordBatch.from_pylist(
+            [{c: _native(row.get(c)) for c in columns} for row in chunk], schema=schema
+        )
+        writer.write_batch(batch)
+        yield sink.getvalue()
+        sink.seek(0)
+        sink.truncate()
+    writer.close()
+    yield sink.getvalue()
+
+
+ENCODERS = {
+    "ndjson": encode_ndjson,
+    "csv": encode_csv,
+    "arrow": encode_arrow,
+}
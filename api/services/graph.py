@@ -0,0 +1,15 @@
+"""Graph backend selected by GRAPH_BACKEND"""
+
+from api.core.config import settings
+from api.core.versions import graph_versions
+
+if settings.graph_backend == "memory":
+    from .memory_service import MemoryGraphService as GraphService
+elif settings.graph_backend == "neo4j":
+    from .neo4j_service import Neo4jService as GraphService
+else:
+    raise ValueError(f"Unknown GRAPH_BACKEND: {settings.graph_backend} (expected neo4j or memory)")
+
+graph_versions.set_source(GraphService.get_change_marks, settings.graph_change_check_interval)
+
+__all__ = ['GraphService']
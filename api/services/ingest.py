@@ -0,0 +1,156 @@
+"""Write-behind queue for observation ingestion"""
+
+import asyncio
+import logging
+import uuid
+from collections import deque
+from typing import List, Optional
+
+from ..core.config import settings
+from ..core.pagination import as_utc
+from .graph import GraphService
+
+logger = logging.getLogger(__name__)
+
+DATA_NS = "http://example.org/upw/data#"
+
+
+def observation_row(sensor_id: str, timestamp, value: float, unit: Optional[str] = None) -> dict:
+    """
+    Build a write row for one observation.
+
+    The uri is derived from sensor and timestamp, so replays of the same
+    reading MERGE onto the existing node instead of duplicating it.
+    """
+    timestamp = as_utc(timestamp)
+    epoch_ms = int(timestamp.timestamp() * 1000)
+    return {
+        "uri": f"{DATA_NS}obs-{sensor_id}-{epoch_ms}",
+        "sensorId": sensor_id,
+        "timestamp": timestamp,
+        "value": value,
+        "unit": unit,
+    }
+
+
+def anomaly_row(sensor_id: str, score: float, timestamp, label: Optional[str] = None,
+                description: Optional[str] = None) -> dict:
+    """Build a write row for one anomaly detection result"""
+    timestamp = as_utc(timestamp)
+    epoch_ms = int(timestamp.timestamp() * 1000)
+    return {
+        "uri": f"{DATA_NS}anomaly-{sensor_id}-{epoch_ms}-{uuid.uuid4().hex[:8]}",
+        "sensorId": sensor_id,
+        "score": score,
+        "timestamp": timestamp,
+        "label": label,
+        "description": description,
+    }
+
+
+class ObservationWriter:
+    """Buffers observations and flushes them to Neo4j in UNWIND batches"""
+
+    def __init__(self, batch_size: int = 5000, flush_interval: float = 0.5,
+                 max_queued: int = 200_000, writers: int = 2, max_retries: int = 3):
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.max_queued = max_queued
+        self.writers = writers
+        self.max_retries = max_retries
+        self._queue: deque = deque()
+        self._wakeup: Optional[asyncio.Event] = None
+        self._tasks: List[asyncio.Task] = []
+        self._stopping = False
+        self.accepted = 0
+        self.rejected = 0
+        self.flushed = 0
+        self.skipped = 0
+        self.failed = 0
+        self.batches = 0
+        self.retries = 0
+
+    def start(self):
+        """Start the writer tasks on the running event loop"""
+        self._stopping = False
+        self._wakeup = asyncio.Event()
+        self._tasks = [asyncio.create_task(self._run()) for _ in range(self.writers)]
+
+    async def stop(self):
+        """Flush everything still queued and stop the writer tasks"""
+        self._stopping = True
+        if self._wakeup:
+            self._wakeup.set()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    def submit(self, rows: List[dict]) -> bool:
+        """Queue rows for writing; False if the queue has no room for all of them"""
+        if len(self._queue) + len(rows) > self.max_queued:
+            self.rejected += len(rows)
+            return False
+        self._queue.extend(rows)
+        self.accepted += len(rows)
+        if self._wakeup and len(self._queue) >= self.batch_size:
+            self._wakeup.set()
+        return True
+
+    @property
+    def queued(self) -> int:
+        return len(self._queue)
+
+    def stats(self) -> dict:
+        """Queue counters"""
+        return {
+            "accepted": self.accepted,
+            "rejected": self.rejected,
+            "flushed": self.flushed,
+            "skipped": self.skipped,
+            "failed": self.failed,
+            "queued": self.queued,
+            "batches": self.batches,
+            "retries": self.retries,
+        }
+
+    async def _run(self):
+        while True:
+            if not self._queue:
+                if self._stopping:
+                    return
+                self._wakeup.clear()
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), self.flush_interval)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+            batch = [self._queue.popleft() for _ in range(min(self.batch_size, len(self._queue)))]
+            await self._flush(batch)
+
+    async def _flush(self, batch: List[dict]):
+        """Write one batch, retrying with exponential backoff"""
+        for attempt in range(self.max_retries + 1):
+            try:
+                written = await GraphService.write_observations(batch)
+                # Rows whose sensor does not exist are not written
+                self.flushed += written
+                self.skipped += len(batch) - written
+                self.batches += 1
+                return
+            except Exception as exc:
+                if attempt == self.max_retries:
+                    self.failed += len(batch)
+                    logger.error(f"Dropped {len(batch)} observations "
+                                 f"after {attempt + 1} attempts: {exc}")
+                    return
+                self.retries += 1
+                await asyncio.sleep(0.1 * 2 ** attempt)
+
+
+# Singleton instance
+observation_writer = ObservationWriter(
+    batch_size=settings.ingest_batch_size,
+    flush_interval=settings.ingest_flush_interval,
+    max_queued=settings.ingest_queue_size,
+    writers=settings.ingest_writers,
+    max_retries=settings.ingest_max_retries
+)
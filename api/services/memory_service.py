@@ -0,0 +1,454 @@
+"""In-memory graph service (GRAPH_BACKEND=memory)"""
+
+import bisect
+from datetime import date, datetime, timezone
+
+import numpy as np
+
+from api.core.memory_graph import MemoryGraph, get_memory_graph, ms_to_datetime
+from api.core.metrics import instrument_operations
+from api.core.pagination import as_utc, decode_cursor, paginate
+from api.services.repository import (
+    GraphRepository, publish_anomalies, publish_observations, record_change
+)
+from api.services.series import CHUNK_ROWS, epoch_ms_to_iso, lttb, minmax_reduce
+
+_NO_POOL = {"maxSize": 0, "inUse": 0, "idle": 0}
+_EPOCH = datetime.fromtimestamp(0, tz=timezone.utc)
+
+
+def _ms(value: datetime):
+    return int(as_utc(value).timestamp() * 1000) if value is not None else None
+
+
+def _equipment_row(graph: MemoryGraph, uri: str) -> dict:
+    props = graph.props[uri]
+    return {
+        "id": props.get("equipmentId"),
+        "name": props.get("equipmentName"),
+        "type": graph.node_type(uri),
+        "operatingHours": props.get("operatingHours"),
+        "installationDate": props.get("installationDate"),
+    }
+
+
+def _sensor_row(graph: MemoryGraph, uri: str) -> dict:
+    props = graph.props[uri]
+    return {
+        "id": props.get("sensorId"),
+        "type": graph.node_type(uri),
+        "location": props.get("sensorLocation"),
+        "samplingRate": props.get("samplingRate"),
+    }
+
+
+def _anomaly_row(graph: MemoryGraph, uri: str) -> dict:
+    props = graph.props[uri]
+    sensors = [s for s in graph.related(uri, "madeBySensor")
+               if "sensorId" in graph.props.get(s, {})]
+    return {
+        "score": props.get("anomalyScore"),
+        "label": props.get("rdfs__label"),
+        "description": props.get("rdfs__comment"),
+        "timestamp": props.get("timestamp"),
+        "sensorId": graph.props[sensors[0]]["sensorId"] if sensors else None,
+    }
+
+
+def _prediction_row(graph: MemoryGraph, uri: str, equipment: str = None) -> dict:
+    props = graph.props[uri]
+    owner = graph.props.get(equipment, {})
+    return {
+        "equipmentId": owner.get("equipmentId"),
+        "equipmentName": owner.get("equipmentName"),
+        "failureMode": props.get("failureMode"),
+        "predictedDate": props.get("predictedFailureDate"),
+        "confidence": props.get("confidenceScore"),
+        "rul": props.get("remainingUsefulLife"),
+        "comment": props.get("rdfs__comment"),
+    }
+
+
+def _maintenance_row(graph: MemoryGraph, uri: str, equipment: str) -> dict:
+    props = graph.props[uri]
+    owner = graph.props[equipment]
+    types = [graph.props.get(t, {}).get("rdfs__label")
+             for t in graph.related(uri, "hasMaintenanceType")]
+    return {
+        "equipmentId": owner.get("equipmentId"),
+        "equipmentName": owner.get("equipmentName"),
+        "eventName": props.get("rdfs__label"),
+        "scheduledDate": props.get("scheduledDate"),
+        "completedDate": props.get("completedDate"),
+        "priority": props.get("priority"),
+        "duration": props.get("estimatedDuration"),
+        "status": props.get("status"),
+        "description": props.get("maintenanceDescription"),
+        "maintenanceType": types[0] if types else None,
+    }
+
+
+def _observation_rows(graph: MemoryGraph, sensor_id: str, indexes) -> list:
+    series = graph.series[sensor_id]
+    return [{
+        "sensorId": sensor_id,
+        "timestamp": ms_to_datetime(series.keys[i][0]),
+        "value": series.values[i],
+        "unit": series.units[i],
+        "_nodeId": series.keys[i][1],
+    } for i in indexes]
+
+
+def _latest(graph: MemoryGraph, sensor_id: str, limit: int) -> list:
+    series = graph.series[sensor_id]
+    newest = len(series) - 1
+    rows = _observation_rows(graph, sensor_id, range(newest, max(newest - limit, -1), -1))
+    return [{k: v for k, v in row.items() if k != "_nodeId"} for row in rows]
+
+
+def _in_range(value, from_time: datetime, to_time: datetime) -> bool:
+    if from_time and (value is None or value < as_utc(from_time)):
+        return False
+    if to_time and (value is None or value >= as_utc(to_time)):
+        return False
+    return True
+
+
+def _window(graph: MemoryGraph, sensor_id: str, from_time: datetime, to_time: datetime):
+    """(timestamps, values) arrays of a sensor inside [from_time, to_time), nulls dropped"""
+    series = graph.series.get(sensor_id)
+    if series is None:
+        return np.empty(0, dtype=np.int64), np.empty(0)
+    with graph.lock:
+        t, v = series.arrays()
+        lo, hi = series.span(_ms(from_time), _ms(to_time))
+    t, v = t[lo:hi], v[lo:hi]
+    keep = ~np.isnan(v)
+    return t[keep], v[keep]
+
+
+async def _chunks(t: np.ndarray, v: np.ndarray):
+    for start in range(0, len(t), CHUNK_ROWS):
+        yield t[start:start + CHUNK_ROWS], v[start:start + CHUNK_ROWS]
+
+
+@instrument_operations
+class MemoryGraphService(GraphRepository):
+    """Service answering the Neo4jService operations from the in-process graph"""
+
+    # Equipment queries
+    @staticmethod
+    async def get_all_equipment():
+        """Get all equipment"""
+        graph = get_memory_graph()
+        rows = [_equipment_row(graph, uri) for uri in graph.equipment.values()]
+        return sorted(rows, key=lambda r: (r["name"] is None, r["name"] or ""))
+
+    @staticmethod
+    async def get_equipment_by_id(equipment_id: str):
+        """Get equipment by ID"""
+        graph = get_memory_graph()
+        uri = graph.equipment.get(equipment_id)
+        return _equipment_row(graph, uri) if uri else None
+
+    @staticmethod
+    async def get_equipment_sensors(equipment_id: str):
+        """Get sensors for equipment"""
+        graph = get_memory_graph()
+        uri = graph.equipment.get(equipment_id)
+        if uri is None:
+            return []
+        return [_sensor_row(graph, s) for s in graph.related(uri, "hasSensor")
+                if "sensorId" in graph.props.get(s, {})]
+
+    @staticmethod
+    async def get_equipment_detail(equipment_id: str, observations: int = 10, limit: int = 20):
+        """Get equipment with its whole subgraph"""
+        graph = get_memory_graph()
+        uri = graph.equipment.get(equipment_id)
+        if uri is None:
+            return None
+        detail = _equipment_row(graph, uri)
+        sensors = [s for s in graph.related(uri, "hasSensor")
+                   if "sensorId" in graph.props.get(s, {})]
+
+        detail["sensors"] = [
+            {**_sensor_row(graph, s),
+             "observations": _latest(graph, graph.props[s]["sensorId"], observations)}
+            for s in sensors
+        ]
+        anomalies = [_anomaly_row(graph, a) for s in sensors
+                     for a in graph.related_from(s, "madeBySensor", "AnomalyDetection")]
+        anomalies.sort(key=lambda a: a["timestamp"] or _EPOCH, reverse=True)
+        detail["anomalies"] = anomalies[:limit]
+        detail["failurePredictions"] = [
+            _prediction_row(graph, fp, uri)
+            for fp in graph.related(uri, "hasPrediction", "FailurePrediction")
+        ][:limit]
+        detail["maintenanceEvents"] = [
+            _maintenance_row(graph, event, owner) for _, event, owner in graph.maintenance_events
+            if owner == uri and graph.props[event].get("status") == "Scheduled"
+        ][:limit]
+        return detail
+
+    @staticmethod
+    async def get_equipment_batch(equipment_ids: list):
+        """Get many equipment by ID, keyed by ID"""
+        graph = get_memory_graph()
+        return {key: _equipment_row(graph, graph.equipment[key]) if key in graph.equipment else None
+                for key in dict.fromkeys(equipment_ids)}
+
+    # Sensor queries
+    @staticmethod
+    async def get_all_sensors():
+        """Get all sensors"""
+        graph = get_memory_graph()
+        return [_sensor_row(graph, graph.sensors[key]) for key in sorted(graph.sensors)]
+
+    @staticmethod
+    async def get_sensor_by_id(sensor_id: str):
+        """Get sensor by ID"""
+        graph = get_memory_graph()
+        uri = graph.sensors.get(sensor_id)
+        return _sensor_row(graph, uri) if uri else None
+
+    @staticmethod
+    async def get_sensor_batch(sensor_ids: list):
+        """Get many sensors by ID, keyed by ID"""
+        graph = get_memory_graph()
+        return {key: _sensor_row(graph, graph.sensors[key]) if key in graph.sensors else None
+                for key in dict.fromkeys(sensor_ids)}
+
+    @staticmethod
+    async def get_latest_observations(sensor_ids: list, limit: int = 1):
+        """Get the latest observations of many sensors, keyed by sensor ID"""
+        graph = get_memory_graph()
+        with graph.lock:
+            return {key: _latest(graph, key, limit) if key in graph.sensors else None
+                    for key in dict.fromkeys(sensor_ids)}
+
+    @staticmethod
+    async def get_sensor_observations(sensor_id: str, limit: int = 100,
+                                      cursor: str = None, from_time: datetime = None,
+                                      to_time: datetime = None):
+        """Get a page of observations for sensor, newest first"""
+        graph = get_memory_graph()
+        series = graph.series.get(sensor_id)
+        if series is None:
+            return [], None
+        with graph.lock:
+            lo, hi = series.span(_ms(from_time), _ms(to_time))
+            if cursor:
+                key, node_id = decode_cursor(cursor, datetime, str)
+                hi = min(hi, bisect.bisect_left(series.keys, (_ms(key), node_id)))
+            rows = _observation_rows(graph, sensor_id,
+                                     range(hi - 1, max(lo, hi - limit - 1) - 1, -1))
+        return paginate(rows, limit, "timestamp", "_nodeId")
+
+    @staticmethod
+    async def stream_sensor_observations(sensor_id: str, from_time: datetime = None,
+                                         to_time: datetime = None):
+        """Stream all observations for sensor in time order"""
+        graph = get_memory_graph()
+        series = graph.series.get(sensor_id)
+        if series is None:
+            return
+        with graph.lock:
+            lo, hi = series.span(_ms(from_time), _ms(to_time))
+            keys, values, units = series.keys[lo:hi], series.values[lo:hi], series.units[lo:hi]
+        for (ms, _), value, unit in zip(keys, values, units):
+            yield {"sensorId": sensor_id, "timestamp": ms_to_datetime(ms),
+                   "value": value, "unit": unit}
+
+    @staticmethod
+    async def get_sensor_series(sensor_id: str, bucket_ms: int, aggregates: list,
+                                from_time: datetime = None, to_time: datetime = None):
+        """Aggregate observations into fixed time buckets with NumPy"""
+        t, v = _window(get_memory_graph(), sensor_id, from_time, to_time)
+        if not len(t):
+            return []
+        buckets = (t // bucket_ms) * bucket_ms
+        starts = np.flatnonzero(np.r_[True, buckets[1:] != buckets[:-1]])
+        counts = np.diff(np.r_[starts, len(t)])
+        sums = np.add.reduceat(v, starts)
+        columns = {
+            "avg": lambda: sums / counts,
+            "min": lambda: np.minimum.reduceat(v, starts),
+            "max": lambda: np.maximum.reduceat(v, starts),
+            "count": lambda: counts,
+            "sum": lambda: sums,
+        }
+        values = {a: columns[a]().tolist() for a in aggregates}
+        return [{"timestamp": epoch_ms_to_iso(bucket), **{a: values[a][i] for a in aggregates}}
+                for i, bucket in enumerate(buckets[starts].tolist())]
+
+    @staticmethod
+    async def get_sensor_series_downsampled(sensor_id: str, points: int, mode: str = "lttb",
+                                            from_time: datetime = None,
+                                            to_time: datetime = None):
+        """Downsample observations to about `points` points (MinMax, then LTTB)"""
+        t, v = _window(get_memory_graph(), sensor_id, from_time, to_time)
+        if not len(t):
+            return []
+        n_buckets = max(1, points // 2) if mode == "minmax" else max(1, points * 2)
+        t, v = await minmax_reduce(_chunks(t, v), int(t[0]), int(t[-1]) + 1, n_buckets)
+        if mode == "lttb":
+            t, v = lttb(t, v, points)
+        return [{"timestamp": epoch_ms_to_iso(ts), "value": val}
+                for ts, val in zip(t.tolist(), v.tolist())]
+
+    @staticmethod
+    async def write_observations(rows: list) -> int:
+        """
+        Add observations to the sensor series.
+
+        Existing uris are kept (MERGE semantics) and rows for unknown sensors
+        are skipped. New observations are pushed to stream subscribers.
+
+        Returns:
+            Number of rows for known sensors
+        """
+        graph = get_memory_graph()
+        written, created = 0, []
+        for row in rows:
+            if row["sensorId"] in graph.sensors:
+                if graph.add_observation(row["sensorId"], as_utc(row["timestamp"]), row["value"],
+                                         row.get("unit"), row["uri"]):
+                    created.append(row)
+                written += 1
+        record_change("observations")
+        publish_observations(created)
+        return written
+
+    @staticmethod
+    async def write_anomalies(rows: list) -> int:
+        """Add anomaly detections; rows for unknown sensors are skipped"""
+        graph = get_memory_graph()
+        created = [row for row in rows if graph.add_anomaly(
+            row["sensorId"], row["uri"], row["score"], as_utc(row["timestamp"]),
+            row.get("label"), row.get("description"))]
+        record_change("anomalies")
+        publish_anomalies(created)
+        return len(created)
+
+    # Anomaly queries
+    @staticmethod
+    async def get_anomalies(threshold: float = 0.0, limit: int = 100,
+                            cursor: str = None, from_time: datetime = None,
+                            to_time: datetime = None):
+        """Get a page of anomalies above threshold, highest score first"""
+        graph = get_memory_graph()
+        after = tuple(decode_cursor(cursor, (int, float), str)) if cursor else None
+        rows = []
+        # The index is sorted by (score, uri) descending: start right after
+        # the cursor and stop below threshold
+        anomalies = graph.anomalies
+        for index in range(graph.anomalies_after(after), len(anomalies)):
+            score, uri = anomalies[index]
+            if score is None or score < threshold or len(rows) > limit:
+                break
+            if _in_range(graph.props[uri].get("timestamp"), from_time, to_time):
+                rows.append({**_anomaly_row(graph, uri), "_nodeId": uri})
+        return paginate(rows, limit, "score", "_nodeId")
+
+    # Prediction queries
+    @staticmethod
+    async def get_failure_predictions():
+        """Get failure predictions"""
+        graph = get_memory_graph()
+        rows = []
+        for fp in graph.failure_predictions:
+            owners = [e for e in graph.related_from(fp, "hasPrediction")
+                      if "equipmentId" in graph.props.get(e, {})] or [None]
+            rows.extend(_prediction_row(graph, fp, owner) for owner in owners)
+        return rows
+
+    @staticmethod
+    async def get_energy_prediction(forecast_date: str = None):
+        """Get energy prediction (the latest forecast when no date is given, either layout)"""
+        graph = get_memory_graph()
+        if forecast_date:
+            uri = graph.energy_predictions.get(date.fromisoformat(forecast_date))
+        else:
+            uri = graph.energy_predictions[max(graph.energy_predictions)] \
+                if graph.energy_predictions else None
+        if uri is None:
+            return None
+        props = graph.props[uri]
+        points = graph.forecast_points(uri)
+        return {
+            "forecastDate": props.get("forecastDate"),
+            "totalEnergy": props.get("totalDailyEnergy"),
+            "peakPower": props.get("peakPower"),
+            "confidence": props.get("confidenceScore"),
+            "forecastPoints": [{
+                "intervalIndex": p.get("intervalIndex"),
+                "startTime": p.get("intervalStartTime"),
+                "powerKW": p.get("powerConsumption"),
+                "confidence": p.get("confidenceScore"),
+            } for p in points],
+        }
+
+    @staticmethod
+    async def get_energy_range(from_date: date, to_date: date) -> list:
+        """Get the forecast points of every prediction in from_date..to_date"""
+        graph = get_memory_graph()
+        rows = []
+        for day in sorted(d for d in graph.energy_predictions if from_date <= d <= to_date):
+            uri = graph.energy_predictions[day]
+            props = graph.props[uri]
+            if "forecastPower" in props:
+                intervals, power = props["forecastIntervals"], props["forecastPower"]
+            else:
+                points = [p for p in graph.forecast_points(uri)
+                          if p.get("intervalIndex") is not None]
+                intervals = [p["intervalIndex"] for p in points]
+                power = [p.get("powerConsumption") for p in points]
+            rows.append({"forecastDate": day, "intervals": intervals, "power": power})
+        return rows
+
+    # Maintenance queries
+    @staticmethod
+    async def get_maintenance_events(status: str = None, limit: int = 100,
+                                     cursor: str = None, from_time: datetime = None,
+                                     to_time: datetime = None):
+        """Get a page of maintenance events by scheduled date"""
+        graph = get_memory_graph()
+        after = tuple(decode_cursor(cursor, datetime, str)) if cursor else None
+        rows = []
+        for scheduled, event, equipment in graph.maintenance_events:
+            if len(rows) > limit:
+                break
+            if after and (scheduled is None or (scheduled, event) <= after):
+                continue
+            if status and graph.props[event].get("status") != status:
+                continue
+            if _in_range(scheduled, from_time, to_time):
+                rows.append({**_maintenance_row(graph, event, equipment), "_nodeId": event})
+        return paginate(rows, limit, "scheduledDate", "_nodeId")
+
+    # Summary
+    @staticmethod
+    async def get_summary():
+        """Get the dashboard counters (index sizes, always current)"""
+        graph = get_memory_graph()
+        return {**graph.summary(), "updatedAt": datetime.now(timezone.utc)}
+
+    @staticmethod
+    async def refresh_summary():
+        """Nothing to recount: the counters are the index sizes"""
+        return await MemoryGraphService.get_summary()
+
+    # Health check
+    @staticmethod
+    def get_pool_stats() -> dict:
+        """No connection pool in memory mode"""
+        return {**_NO_POOL, "servers": {}}
+
+    @staticmethod
+    async def health_check():
+        """Report the loaded graph"""
+        try:
+            return {"status": "healthy", "backend": "memory", "graph": get_memory_graph().counts()}
+        except Exception as e:
+            return {"status": "unhealthy", "backend": "memory", "error": str(e)}
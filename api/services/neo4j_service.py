@@ -1,217 +1,705 @@
 """Neo4j service layer"""
 
-from api.core.database import neo4j_db
+from datetime import date, datetime
 
+from fastapi.concurrency import iterate_in_threadpool, run_in_threadpool
 
-class Neo4jService:
+from graphdb.summary import GET_CHANGE_MARKS, GET_SUMMARY, REFRESH_SUMMARY
+
+from api.core.cache import query_cache
+from api.core.coalesce import single_flight
+from api.core.config import settings
+from api.core.database import neo4j_db, async_neo4j_db
+from api.core.metrics import instrument_operations
+from api.core.pagination import as_utc, decode_cursor, paginate
+from api.core.versions import graph_versions
+from api.services.repository import (
+    SUMMARY_TAGS, GraphRepository, publish_anomalies, publish_observations, record_change
+)
+from api.services.series import (
+    AGGREGATES, chunked_arrays, epoch_ms_to_iso, lttb, minmax_reduce
+)
+
+# Cache TTLs in seconds
+STATIC_TTL = 300      # equipment / sensor metadata
+PREDICTION_TTL = 60   # failure / energy predictions, maintenance plans
+EVENT_TTL = 10        # observations and anomalies
+
+# EnergyPrediction row. Forecasts migrated by neo4j/migrate-energy-compact.cypher
+# keep their points as arrays on the prediction node (one node read per day);
+# older ones still fan out to EnergyForecastPoint nodes.
+ENERGY_PREDICTION_FIELDS = """
+ep.forecastDate AS forecastDate,
+ep.totalDailyEnergy AS totalEnergy,
+ep.peakPower AS peakPower,
+ep.confidenceScore AS confidence,
+CASE WHEN ep.forecastPower IS NOT NULL
+  THEN [i IN range(0, size(ep.forecastPower) - 1) | {
+    intervalIndex: ep.forecastIntervals[i],
+    startTime: ep.forecastStart + duration({minutes: 15 * ep.forecastIntervals[i]}),
+    powerKW: ep.forecastPower[i],
+    confidence: ep.forecastConfidence[i]
+  }]
+  ELSE COLLECT {
+    MATCH (ep)-[:hasForecastPoint]->(fp:EnergyForecastPoint)
+    RETURN {
+      intervalIndex: fp.intervalIndex,
+      startTime: fp.intervalStartTime,
+      powerKW: fp.powerConsumption,
+      confidence: fp.confidenceScore
+    } ORDER BY fp.intervalIndex
+  }
+END AS forecastPoints"""
+
+
+async def _run(cypher: str, parameters: dict = None) -> list:
+    """Run a query on the configured driver without blocking the event loop"""
+    if settings.neo4j_async:
+        return await async_neo4j_db.query(cypher, parameters)
+    return await run_in_threadpool(neo4j_db.query, cypher, parameters)
+
+
+async def _query(cypher: str, parameters: dict = None,
+                 ttl: float = None, tags: tuple = ()) -> list:
+    """
+    Run a query, serving it from the query cache when a TTL is given.
+
+    Identical concurrent calls share one execution. The flight key includes
+    the graph versions of the tags, so a call made after a write never gets
+    the result of a query that started before it.
+    """
+    key = query_cache.make_key(cypher, parameters)
+    cached = ttl and settings.cache_enabled
+    if cached:
+        results = query_cache.get(key)
+        if results is not None:
+            return results
+
+    state = graph_versions.state(tags)
+
+    async def fetch():
+        rows = await _run(cypher, parameters)
+        # Skip caching results that a write made stale while the query ran
+        if cached and graph_versions.state(tags) == state:
+            query_cache.set(key, rows, ttl, tags)
+        return rows
+
+    return await single_flight.do(key + state, fetch)
+
+
+async def _query_single(cypher: str, parameters: dict = None,
+                        ttl: float = None, tags: tuple = ()):
+    """Run a query and return single result"""
+    results = await _query(cypher, parameters, ttl, tags)
+    return results[0] if results else None
+
+
+async def _write(cypher: str, parameters: dict = None) -> list:
+    """Run a write query in a managed write transaction"""
+    if settings.neo4j_async:
+        return await async_neo4j_db.write(cypher, parameters)
+    return await run_in_threadpool(neo4j_db.write, cypher, parameters)
+
+
+async def _stream(cypher: str, parameters: dict = None):
+    """Stream records from the configured driver without buffering the result"""
+    if settings.neo4j_async:
+        async for row in async_neo4j_db.stream(cypher, parameters):
+            yield row
+    else:
+        async for row in iterate_in_threadpool(neo4j_db.stream(cypher, parameters)):
+            yield row
+
+
+def _keyed(rows: list, found: str) -> dict:
+    """Key batch rows by requested ID; IDs whose `found` column is null map to None"""
+    return {
+        row["_key"]: ({k: v for k, v in row.items() if k != "_key"}
+                      if row[found] is not None else None)
+        for row in rows
+    }
+
+
+def _where(conditions: list) -> str:
+    """Join filter conditions into a WHERE clause"""
+    return "WHERE " + " AND ".join(conditions) if conditions else ""
+
+
+@instrument_operations
+class Neo4jService(GraphRepository):
     """Service for Neo4j operations"""
 
     # Equipment queries
     @staticmethod
-    def get_all_equipment():
+    async def get_all_equipment():
         """Get all equipment"""
         query = """
-        MATCH (e)
+        MATCH (e:Resource)
         WHERE e.equipmentId IS NOT NULL
-        RETURN e.equipmentId[0] AS id,
-               e.equipmentName[0] AS name,
+        RETURN e.equipmentId AS id,
+               e.equipmentName AS name,
                labels(e)[1] AS type,
-               e.operatingHours[0] AS operatingHours,
-               e.installationDate[0] AS installationDate
+               e.operatingHours AS operatingHours,
+               e.installationDate AS installationDate
         ORDER BY e.equipmentName
         """
-        return neo4j_db.query(query)
+        return await _query(query, ttl=STATIC_TTL, tags=("equipment",))
 
     @staticmethod
-    def get_equipment_by_id(equipment_id: str):
+    async def get_equipment_by_id(equipment_id: str):
         """Get equipment by ID"""
         query = """
-        MATCH (e)
-        WHERE e.equipmentId[0] = $id OR e.equipmentId = $id
-        RETURN e.equipmentId[0] AS id,
-               e.equipmentName[0] AS name,
+        MATCH (e:Resource {equipmentId: $id})
+        RETURN e.equipmentId AS id,
+               e.equipmentName AS name,
                labels(e)[1] AS type,
-               e.operatingHours[0] AS operatingHours,
-               e.installationDate[0] AS installationDate
+               e.operatingHours AS operatingHours,
+               e.installationDate AS installationDate
         """
-        return neo4j_db.query_single(query, {"id": equipment_id})
+        return await _query_single(query, {"id": equipment_id},
+                                   ttl=STATIC_TTL, tags=("equipment",))
 
     @staticmethod
-    def get_equipment_sensors(equipment_id: str):
+    async def get_equipment_sensors(equipment_id: str):
         """Get sensors for equipment"""
         query = """
-        MATCH (e)-[:hasSensor]->(s:Sensor)
-        WHERE e.equipmentId[0] = $id OR e.equipmentId = $id
-        RETURN s.sensorId[0] AS id,
+        MATCH (e:Resource {equipmentId: $id})-[:hasSensor]->(s:Sensor)
+        RETURN s.sensorId AS id,
                labels(s)[1] AS type,
-               s.sensorLocation[0] AS location,
-               s.samplingRate[0] AS samplingRate
+               s.sensorLocation AS location,
+               s.samplingRate AS samplingRate
         """
-        return neo4j_db.query(query, {"id": equipment_id})
+        return await _query(query, {"id": equipment_id},
+                            ttl=STATIC_TTL, tags=("equipment", "sensors"))
+
+    @staticmethod
+    async def get_equipment_detail(equipment_id: str, observations: int = 10, limit: int = 20):
+        """Get equipment with its whole subgraph in one query"""
+        query = """
+        MATCH (e:Resource {equipmentId: $id})
+        RETURN e.equipmentId AS id,
+               e.equipmentName AS name,
+               labels(e)[1] AS type,
+               e.operatingHours AS operatingHours,
+               e.installationDate AS installationDate,
+               [(e)-[:hasSensor]->(s:Sensor) | {
+                 id: s.sensorId,
+                 type: labels(s)[1],
+                 location: s.sensorLocation,
+                 samplingRate: s.samplingRate,
+                 observations: COLLECT {
+                   MATCH (o:SensorObservation)-[:madeBySensor]->(s)
+                   RETURN {sensorId: s.sensorId, timestamp: o.timestamp,
+                           value: o.value, unit: o.unit}
+                   ORDER BY o.timestamp DESC
+                   LIMIT $observations
+                 }
+               }] AS sensors,
+               COLLECT {
+                 MATCH (e)-[:hasSensor]->(s:Sensor)<-[:madeBySensor]-(a:AnomalyDetection)
+                 RETURN {score: a.anomalyScore, label: a.rdfs__label,
+                         description: a.rdfs__comment, timestamp: a.timestamp,
+                         sensorId: s.sensorId}
+                 ORDER BY a.timestamp DESC
+                 LIMIT $limit
+               } AS anomalies,
+               [(e)-[:hasPrediction]->(fp:FailurePrediction) | {
+                 equipmentId: e.equipmentId,
+                 equipmentName: e.equipmentName,
+                 failureMode: fp.failureMode,
+                 predictedDate: fp.predictedFailureDate,
+                 confidence: fp.confidenceScore,
+                 rul: fp.remainingUsefulLife,
+                 comment: fp.rdfs__comment
+               }][..$limit] AS failurePredictions,
+               COLLECT {
+                 MATCH (e)-[:hasMaintenanceSchedule]->(:MaintenanceSchedule)
+                       -[:hasMaintenanceEvent]->(me:MaintenanceEvent {status: 'Scheduled'})
+                 RETURN {equipmentId: e.equipmentId,
+                         equipmentName: e.equipmentName,
+                         eventName: me.rdfs__label,
+                         scheduledDate: me.scheduledDate,
+                         completedDate: me.completedDate,
+                         priority: me.priority,
+                         duration: me.estimatedDuration,
+                         status: me.status,
+                         description: me.maintenanceDescription,
+                         maintenanceType: head([(me)-[:hasMaintenanceType]->(mt) | mt.rdfs__label])}
+                 ORDER BY me.scheduledDate
+                 LIMIT $limit
+               } AS maintenanceEvents
+        """
+        params = {"id": equipment_id, "observations": observations, "limit": limit}
+        return await _query_single(
+            query, params, ttl=EVENT_TTL,
+            tags=("equipment", "sensors", "observations", "anomalies",
+                  "predictions", "maintenance")
+        )
+
+    @staticmethod
+    async def get_equipment_batch(equipment_ids: list):
+        """Get many equipment by ID in one query, keyed by ID"""
+        query = """
+        UNWIND $ids AS key
+        OPTIONAL MATCH (e:Resource {equipmentId: key})
+        RETURN key AS _key,
+               e.equipmentId AS id,
+               e.equipmentName AS name,
+               labels(e)[1] AS type,
+               e.operatingHours AS operatingHours,
+               e.installationDate AS installationDate
+        """
+        ids = list(dict.fromkeys(equipment_ids))
+        rows = await _query(query, {"ids": ids}, ttl=STATIC_TTL, tags=("equipment",))
+        return _keyed(rows, "id")
 
     # Sensor queries
     @staticmethod
-    def get_all_sensors():
+    async def get_all_sensors():
         """Get all sensors"""
         query = """
         MATCH (s:Sensor)
-        RETURN s.sensorId[0] AS id,
+        RETURN s.sensorId AS id,
                labels(s)[1] AS type,
-               s.sensorLocation[0] AS location,
-               s.samplingRate[0] AS samplingRate
+               s.sensorLocation AS location,
+               s.samplingRate AS samplingRate
         ORDER BY s.sensorId
         """
-        return neo4j_db.query(query)
+        return await _query(query, ttl=STATIC_TTL, tags=("sensors",))
 
     @staticmethod
-    def get_sensor_by_id(sensor_id: str):
+    async def get_sensor_by_id(sensor_id: str):
         """Get sensor by ID"""
         query = """
-        MATCH (s:Sensor)
-        WHERE s.sensorId[0] = $id OR s.sensorId = $id
-        RETURN s.sensorId[0] AS id,
+        MATCH (s:Resource {sensorId: $id})
+        RETURN s.sensorId AS id,
+               labels(s)[1] AS type,
+               s.sensorLocation AS location,
+               s.samplingRate AS samplingRate
+        """
+        return await _query_single(query, {"id": sensor_id},
+                                   ttl=STATIC_TTL, tags=("sensors",))
+
+    @staticmethod
+    async def get_sensor_batch(sensor_ids: list):
+        """Get many sensors by ID in one query, keyed by ID"""
+        query = """
+        UNWIND $ids AS key
+        OPTIONAL MATCH (s:Resource {sensorId: key})
+        RETURN key AS _key,
+               s.sensorId AS id,
                labels(s)[1] AS type,
-               s.sensorLocation[0] AS location,
-               s.samplingRate[0] AS samplingRate
+               s.sensorLocation AS location,
+               s.samplingRate AS samplingRate
         """
-        return neo4j_db.query_single(query, {"id": sensor_id})
+        ids = list(dict.fromkeys(sensor_ids))
+        rows = await _query(query, {"ids": ids}, ttl=STATIC_TTL, tags=("sensors",))
+        return _keyed(rows, "id")
 
     @staticmethod
-    def get_sensor_observations(sensor_id: str, limit: int = 100):
-        """Get observations for sensor"""
+    async def get_latest_observations(sensor_ids: list, limit: int = 1):
+        """Get the latest observations of many sensors in one query, keyed by sensor ID"""
         query = """
-        MATCH (o:SensorObservation)-[:madeBySensor]->(s:Sensor)
-        WHERE s.sensorId[0] = $id OR s.sensorId = $id
-        RETURN s.sensorId[0] AS sensorId,
-               o.timestamp[0] AS timestamp,
-               o.value[0] AS value,
-               o.unit[0] AS unit
-        ORDER BY o.timestamp DESC
+        UNWIND $ids AS key
+        OPTIONAL MATCH (s:Resource {sensorId: key})
+        CALL {
+          WITH s
+          MATCH (o:SensorObservation)-[:madeBySensor]->(s)
+          WITH s, o
+          ORDER BY o.timestamp DESC
+          LIMIT $limit
+          RETURN collect({
+            sensorId: s.sensorId,
+            timestamp: o.timestamp,
+            value: o.value,
+            unit: o.unit
+          }) AS observations
+        }
+        RETURN key AS _key, s.sensorId AS sensorId, observations
+        """
+        ids = list(dict.fromkeys(sensor_ids))
+        rows = await _query(query, {"ids": ids, "limit": limit},
+                            ttl=EVENT_TTL, tags=("observations",))
+        return {row["_key"]: row["observations"] if row["sensorId"] is not None else None
+                for row in rows}
+
+    @staticmethod
+    async def get_sensor_observations(sensor_id: str, limit: int = 100,
+                                      cursor: str = None, from_time: datetime = None,
+                                      to_time: datetime = None):
+        """Get a page of observations for sensor, newest first"""
+        params = {"id": sensor_id, "limit": limit + 1,
+                  "from": as_utc(from_time), "to": as_utc(to_time)}
+        conditions = []
+        if from_time:
+            conditions.append("o.timestamp >= $from")
+        if to_time:
+            conditions.append("o.timestamp < $to")
+        if cursor:
+            params["cursorKey"], params["cursorId"] = decode_cursor(cursor, datetime, str)
+            conditions.append("(o.timestamp < $cursorKey OR "
+                              "(o.timestamp = $cursorKey AND elementId(o) < $cursorId))")
+        query = f"""
+        MATCH (o:SensorObservation)-[:madeBySensor]->(s:Resource {{sensorId: $id}})
+        {_where(conditions)}
+        RETURN s.sensorId AS sensorId,
+               o.timestamp AS timestamp,
+               o.value AS value,
+               o.unit AS unit,
+               elementId(o) AS _nodeId
+        ORDER BY o.timestamp DESC, _nodeId DESC
         LIMIT $limit
         """
-        return neo4j_db.query(query, {"id": sensor_id, "limit": limit})
+        rows = await _query(query, params, ttl=EVENT_TTL, tags=("observations",))
+        return paginate(rows, limit, "timestamp", "_nodeId")
+
+    @staticmethod
+    async def stream_sensor_observations(sensor_id: str, from_time: datetime = None,
+                                         to_time: datetime = None):
+        """Stream all observations for sensor in time order (not cached)"""
+        conditions = []
+        if from_time:
+            conditions.append("o.timestamp >= $from")
+        if to_time:
+            conditions.append("o.timestamp < $to")
+        query = f"""
+        MATCH (o:SensorObservation)-[:madeBySensor]->(s:Resource {{sensorId: $id}})
+        {_where(conditions)}
+        RETURN s.sensorId AS sensorId,
+               o.timestamp AS timestamp,
+               o.value AS value,
+               o.unit AS unit
+        ORDER BY o.timestamp
+        """
+        params = {"id": sensor_id, "from": as_utc(from_time), "to": as_utc(to_time)}
+        async for row in _stream(query, params):
+            yield row
+
+    @staticmethod
+    async def get_sensor_series(sensor_id: str, bucket_ms: int, aggregates: list,
+                                from_time: datetime = None, to_time: datetime = None):
+        """Aggregate observations into fixed time buckets inside Neo4j"""
+        conditions = []
+        if from_time:
+            conditions.append("o.timestamp >= $from")
+        if to_time:
+            conditions.append("o.timestamp < $to")
+        columns = ", ".join(f"{AGGREGATES[a]} AS {a}" for a in aggregates)
+        query = f"""
+        MATCH (o:SensorObservation)-[:madeBySensor]->(s:Resource {{sensorId: $id}})
+        {_where(conditions)}
+        WITH (o.timestamp.epochMillis / $bucket) * $bucket AS bucket, o.value AS v
+        RETURN bucket, {columns}
+        ORDER BY bucket
+        """
+        params = {"id": sensor_id, "bucket": bucket_ms,
+                  "from": as_utc(from_time), "to": as_utc(to_time)}
+        rows = await _query(query, params, ttl=EVENT_TTL, tags=("observations",))
+        return [{"timestamp": epoch_ms_to_iso(row["bucket"]),
+                 **{k: v for k, v in row.items() if k != "bucket"}} for row in rows]
 
-    # Anomaly queries
     @staticmethod
-    def get_anomalies(threshold: float = 0.0):
-        """Get anomalies above threshold"""
+    async def get_sensor_series_downsampled(sensor_id: str, points: int, mode: str = "lttb",
+                                            from_time: datetime = None,
+                                            to_time: datetime = None):
+        """
+        Downsample observations to about `points` points.
+
+        Raw values are streamed through a min/max-per-bucket NumPy reduction
+        (constant memory); 'lttb' then applies Largest-Triangle-Three-Buckets
+        to those candidates (MinMaxLTTB).
+        """
+        params = {"id": sensor_id, "from": as_utc(from_time), "to": as_utc(to_time)}
+        conditions = []
+        if from_time:
+            conditions.append("o.timestamp >= $from")
+        if to_time:
+            conditions.append("o.timestamp < $to")
+        match = f"""
+        MATCH (o:SensorObservation)-[:madeBySensor]->(s:Resource {{sensorId: $id}})
+        {_where(conditions)}
+        """
+
+        bounds = await _query_single(match + """
+        WITH min(o.timestamp) AS first, max(o.timestamp) AS last
+        RETURN first.epochMillis AS t0, last.epochMillis AS t1
+        """, params, ttl=EVENT_TTL, tags=("observations",))
+        if not bounds or bounds["t0"] is None:
+            return []
+
+        n_buckets = max(1, points // 2) if mode == "minmax" else max(1, points * 2)
+        rows = _stream(match + "RETURN o.timestamp.epochMillis AS t, o.value AS v", params)
+        t, v = await minmax_reduce(chunked_arrays(rows), bounds["t0"], bounds["t1"] + 1, n_buckets)
+        if mode == "lttb":
+            t, v = lttb(t, v, points)
+        return [{"timestamp": epoch_ms_to_iso(ts), "value": val}
+                for ts, val in zip(t.tolist(), v.tolist())]
+
+    @staticmethod
+    async def write_observations(rows: list) -> int:
+        """
+        Write observations with one UNWIND query.
+
+        Rows need sensorId, timestamp, value, unit and uri. MERGE on the unique
+        uri makes retried batches idempotent; rows for unknown sensors are skipped.
+        Newly created observations are pushed to stream subscribers.
+
+        Returns:
+            Number of observations written
+        """
         query = """
+        UNWIND $rows AS row
+        MATCH (s:Resource {sensorId: row.sensorId})
+        WITH row, s, EXISTS { MATCH (:Resource {uri: row.uri}) } AS existed
+        MERGE (o:Resource {uri: row.uri})
+        ON CREATE SET o:SensorObservation,
+                      o.timestamp = row.timestamp,
+                      o.value = row.value,
+                      o.unit = row.unit
+        MERGE (o)-[:madeBySensor]->(s)
+        WITH count(o) AS written,
+             collect(CASE WHEN NOT existed THEN row.uri END) AS created
+        OPTIONAL MATCH (st:Stats {id: 'summary'})
+        SET st.observationsChangedAt = CASE WHEN size(created) > 0 THEN datetime()
+                                            ELSE st.observationsChangedAt END
+        RETURN written, created
+        """
+        result = await _write(query, {"rows": rows})
+        record_change("observations")
+        if not result:
+            return 0
+        created = set(result[0]["created"])
+        publish_observations([r for r in rows if r["uri"] in created])
+        return result[0]["written"]
+
+    @staticmethod
+    async def write_anomalies(rows: list) -> int:
+        """
+        Create anomaly detections and count them into the :Stats node.
+
+        Rows need uri, sensorId, score, timestamp, label and description;
+        rows for unknown sensors are skipped. Written anomalies are pushed to
+        stream subscribers.
+
+        Returns:
+            Number of anomalies written
+        """
+        query = """
+        UNWIND $rows AS row
+        MATCH (s:Resource {sensorId: row.sensorId})
+        CREATE (a:AnomalyDetection:Resource {
+            uri: row.uri,
+            anomalyScore: row.score,
+            timestamp: row.timestamp,
+            rdfs__label: row.label,
+            rdfs__comment: row.description
+        })
+        CREATE (a)-[:madeBySensor]->(s)
+        WITH collect(row.uri) AS created
+        OPTIONAL MATCH (st:Stats {id: 'summary'})
+        SET st.anomalyCount = st.anomalyCount + size(created),
+            st.anomaliesChangedAt = CASE WHEN size(created) > 0 THEN datetime()
+                                         ELSE st.anomaliesChangedAt END
+        RETURN created
+        """
+        result = await _write(query, {"rows": rows})
+        record_change("anomalies")
+        created = set(result[0]["created"]) if result else set()
+        publish_anomalies([r for r in rows if r["uri"] in created])
+        return len(created)
+
+    # Anomaly queries
+    @staticmethod
+    async def get_anomalies(threshold: float = 0.0, limit: int = 100,
+                            cursor: str = None, from_time: datetime = None,
+                            to_time: datetime = None):
+        """Get a page of anomalies above threshold, highest score first"""
+        params = {"threshold": threshold, "limit": limit + 1,
+                  "from": as_utc(from_time), "to": as_utc(to_time)}
+        conditions = ["a.anomalyScore >= $threshold"]
+        if from_time:
+            conditions.append("a.timestamp >= $from")
+        if to_time:
+            conditions.append("a.timestamp < $to")
+        if cursor:
+            params["cursorKey"], params["cursorId"] = decode_cursor(cursor, (int, float), str)
+            conditions.append("(a.anomalyScore < $cursorKey OR "
+                              "(a.anomalyScore = $cursorKey AND elementId(a) < $cursorId))")
+        query = f"""
         MATCH (a:AnomalyDetection)
-        WHERE a.anomalyScore[0] >= $threshold
+        {_where(conditions)}
+        WITH a
+        ORDER BY a.anomalyScore DESC, elementId(a) DESC
+        LIMIT $limit
         OPTIONAL MATCH (a)-[:madeBySensor]->(s:Sensor)
-        RETURN a.anomalyScore[0] AS score,
+        RETURN a.anomalyScore AS score,
                a.rdfs__label AS label,
                a.rdfs__comment AS description,
-               a.timestamp[0] AS timestamp,
-               s.sensorId[0] AS sensorId
-        ORDER BY a.anomalyScore DESC
+               a.timestamp AS timestamp,
+               s.sensorId AS sensorId,
+               elementId(a) AS _nodeId
+        ORDER BY score DESC, _nodeId DESC
         """
-        return neo4j_db.query(query, {"threshold": threshold})
+        rows = await _query(query, params, ttl=EVENT_TTL, tags=("anomalies",))
+        return paginate(rows, limit, "score", "_nodeId")
 
     # Prediction queries
     @staticmethod
-    def get_failure_predictions():
+    async def get_failure_predictions():
         """Get failure predictions"""
         query = """
         MATCH (fp:FailurePrediction)
         OPTIONAL MATCH (e)-[:hasPrediction]->(fp)
         WHERE e.equipmentId IS NOT NULL
-        RETURN e.equipmentId[0] AS equipmentId,
-               e.equipmentName[0] AS equipmentName,
-               fp.failureMode[0] AS failureMode,
-               fp.predictedFailureDate[0] AS predictedDate,
-               fp.confidenceScore[0] AS confidence,
-               fp.remainingUsefulLife[0] AS rul,
+        RETURN e.equipmentId AS equipmentId,
+               e.equipmentName AS equipmentName,
+               fp.failureMode AS failureMode,
+               fp.predictedFailureDate AS predictedDate,
+               fp.confidenceScore AS confidence,
+               fp.remainingUsefulLife AS rul,
                fp.rdfs__comment AS comment
         ORDER BY fp.predictedFailureDate
         """
-        return neo4j_db.query(query)
+        return await _query(query, ttl=PREDICTION_TTL, tags=("predictions",))
 
     @staticmethod
-    def get_energy_prediction(forecast_date: str = None):
-        """Get energy prediction"""
+    async def get_energy_prediction(forecast_date: str = None):
+        """Get energy prediction (the latest forecast when no date is given)"""
         if forecast_date:
-            query = """
+            query = f"""
             MATCH (ep:EnergyPrediction)
-            WHERE ep.forecastDate[0] = $date
-            OPTIONAL MATCH (ep)-[:hasForecastPoint]->(fp:EnergyForecastPoint)
-            RETURN ep.forecastDate[0] AS forecastDate,
-                   ep.totalDailyEnergy[0] AS totalEnergy,
-                   ep.peakPower[0] AS peakPower,
-                   ep.confidenceScore[0] AS confidence,
-                   collect({
-                     intervalIndex: fp.intervalIndex[0],
-                     startTime: fp.intervalStartTime[0],
-                     powerKW: fp.powerConsumption[0],
-                     confidence: fp.confidenceScore[0]
-                   }) AS forecastPoints
+            WHERE ep.forecastDate = date($date)
+            RETURN {ENERGY_PREDICTION_FIELDS}
             """
-            return neo4j_db.query_single(query, {"date": forecast_date})
+            return await _query_single(query, {"date": forecast_date},
+                                       ttl=PREDICTION_TTL, tags=("predictions",))
         else:
-            query = """
+            query = f"""
             MATCH (ep:EnergyPrediction)
-            OPTIONAL MATCH (ep)-[:hasForecastPoint]->(fp:EnergyForecastPoint)
-            RETURN ep.forecastDate[0] AS forecastDate,
-                   ep.totalDailyEnergy[0] AS totalEnergy,
-                   ep.peakPower[0] AS peakPower,
-                   ep.confidenceScore[0] AS confidence,
-                   collect({
-                     intervalIndex: fp.intervalIndex[0],
-                     startTime: fp.intervalStartTime[0],
-                     powerKW: fp.powerConsumption[0],
-                     confidence: fp.confidenceScore[0]
-                   }) AS forecastPoints
+            RETURN {ENERGY_PREDICTION_FIELDS}
+            ORDER BY ep.forecastDate DESC
             LIMIT 1
             """
-            return neo4j_db.query_single(query)
+            return await _query_single(query, ttl=PREDICTION_TTL, tags=("predictions",))
+
+    @staticmethod
+    async def get_energy_range(from_date: date, to_date: date) -> list:
+        """
+        Get the forecast points of every prediction in from_date..to_date.
+
+        Returns:
+            Rows of forecastDate, intervals and power (aligned lists)
+        """
+        query = """
+        MATCH (ep:EnergyPrediction)
+        WHERE ep.forecastDate >= $from AND ep.forecastDate <= $to
+        RETURN ep.forecastDate AS forecastDate,
+               ep.forecastIntervals AS intervals,
+               ep.forecastPower AS power,
+               CASE WHEN ep.forecastPower IS NULL THEN COLLECT {
+                 MATCH (ep)-[:hasForecastPoint]->(fp:EnergyForecastPoint)
+                 WHERE fp.intervalIndex IS NOT NULL
+                 RETURN [fp.intervalIndex, fp.powerConsumption]
+               } END AS points
+        ORDER BY forecastDate
+        """
+        rows = await _query(query, {"from": from_date, "to": to_date},
+                            ttl=PREDICTION_TTL, tags=("predictions",))
+        return [{
+            "forecastDate": r["forecastDate"],
+            "intervals": r["intervals"] if r["points"] is None else [p[0] for p in r["points"]],
+            "power": r["power"] if r["points"] is None else [p[1] for p in r["points"]],
+        } for r in rows]
 
     # Maintenance queries
     @staticmethod
-    def get_maintenance_events(status: str = None):
-        """Get maintenance events"""
+    async def get_maintenance_events(status: str = None, limit: int = 100,
+                                     cursor: str = None, from_time: datetime = None,
+                                     to_time: datetime = None):
+        """Get a page of maintenance events by scheduled date"""
+        params = {"status": status, "limit": limit + 1,
+                  "from": as_utc(from_time), "to": as_utc(to_time)}
+        conditions = ["e.equipmentId IS NOT NULL"]
         if status:
-            query = """
-            MATCH (e)-[:hasMaintenanceSchedule]->(ms:MaintenanceSchedule)-[:hasMaintenanceEvent]->(me:MaintenanceEvent)
-            WHERE e.equipmentId IS NOT NULL AND me.status[0] = $status
-            OPTIONAL MATCH (me)-[:hasMaintenanceType]->(mt:MaintenanceType)
-            RETURN e.equipmentId[0] AS equipmentId,
-                   e.equipmentName[0] AS equipmentName,
-                   me.rdfs__label AS eventName,
-                   me.scheduledDate[0] AS scheduledDate,
-                   me.completedDate[0] AS completedDate,
-                   me.priority[0] AS priority,
-                   me.estimatedDuration[0] AS duration,
-                   me.status[0] AS status,
-                   me.maintenanceDescription[0] AS description,
-                   mt.rdfs__label AS maintenanceType
-            ORDER BY me.scheduledDate
-            """
-            return neo4j_db.query(query, {"status": status})
-        else:
-            query = """
-            MATCH (e)-[:hasMaintenanceSchedule]->(ms:MaintenanceSchedule)-[:hasMaintenanceEvent]->(me:MaintenanceEvent)
-            WHERE e.equipmentId IS NOT NULL
-            OPTIONAL MATCH (me)-[:hasMaintenanceType]->(mt:MaintenanceType)
-            RETURN e.equipmentId[0] AS equipmentId,
-                   e.equipmentName[0] AS equipmentName,
-                   me.rdfs__label AS eventName,
-                   me.scheduledDate[0] AS scheduledDate,
-                   me.completedDate[0] AS completedDate,
-                   me.priority[0] AS priority,
-                   me.estimatedDuration[0] AS duration,
-                   me.status[0] AS status,
-                   me.maintenanceDescription[0] AS description,
-                   mt.rdfs__label AS maintenanceType
-            ORDER BY me.scheduledDate
-            """
-            return neo4j_db.query(query)
+            conditions.append("me.status = $status")
+        if from_time:
+            conditions.append("me.scheduledDate >= $from")
+        if to_time:
+            conditions.append("me.scheduledDate < $to")
+        if cursor:
+            params["cursorKey"], params["cursorId"] = decode_cursor(cursor, datetime, str)
+            conditions.append("(me.scheduledDate > $cursorKey OR "
+                              "(me.scheduledDate = $cursorKey AND elementId(me) > $cursorId))")
+        query = f"""
+        MATCH (e)-[:hasMaintenanceSchedule]->(ms:MaintenanceSchedule)
+              -[:hasMaintenanceEvent]->(me:MaintenanceEvent)
+        {_where(conditions)}
+        WITH e, me
+        ORDER BY me.scheduledDate, elementId(me)
+        LIMIT $limit
+        OPTIONAL MATCH (me)-[:hasMaintenanceType]->(mt:MaintenanceType)
+        RETURN e.equipmentId AS equipmentId,
+               e.equipmentName AS equipmentName,
+               me.rdfs__label AS eventName,
+               me.scheduledDate AS scheduledDate,
+               me.completedDate AS completedDate,
+               me.priority AS priority,
+               me.estimatedDuration AS duration,
+               me.status AS status,
+               me.maintenanceDescription AS description,
+               mt.rdfs__label AS maintenanceType,
+               elementId(me) AS _nodeId
+        ORDER BY scheduledDate, _nodeId
+        """
+        rows = await _query(query, params, ttl=PREDICTION_TTL, tags=("maintenance",))
+        return paginate(rows, limit, "scheduledDate", "_nodeId")
+
+    # Summary
+    @staticmethod
+    async def get_summary():
+        """Get the materialized dashboard counters, computing them on first use"""
+        summary = await _query_single(GET_SUMMARY, ttl=EVENT_TTL, tags=SUMMARY_TAGS)
+        return summary or await Neo4jService.refresh_summary()
+
+    @staticmethod
+    async def refresh_summary():
+        """
+        Recount the dashboard counters into the :Stats node.
+
+        Each counter is a full label scan, so this runs on first use, on
+        demand and on the opt-in refresh interval; readers only ever touch
+        the single :Stats node. Unchanged counts leave the node and the
+        summary version alone.
+        """
+        result = await _write(REFRESH_SUMMARY)
+        if not result:
+            return None
+        summary = result[0]
+        if summary.pop("changed"):
+            record_change("summary")
+        return summary
+
+    @staticmethod
+    async def get_change_marks() -> dict:
+        """Change marks of the :Stats node (empty until it exists)"""
+        row = await _query_single(GET_CHANGE_MARKS)
+        if not row:
+            return {}
+        return {key[:-len("ChangedAt")]: as_utc(value.to_native()) for key, value in row["marks"]}
 
     # Health check
     @staticmethod
-    def health_check():
+    def get_pool_stats() -> dict:
+        """Get connection pool utilisation of the configured driver"""
+        db = async_neo4j_db if settings.neo4j_async else neo4j_db
+        return db.pool_stats()
+
+    @staticmethod
+    async def health_check():
         """Check Neo4j connection"""
         try:
-            result = neo4j_db.query("RETURN 1 AS status")
-            return {"status": "healthy", "neo4j": "connected"}
+            await _query("RETURN 1 AS status")
+            return {"status": "healthy", "neo4j": "connected",
+                    "pool": Neo4jService.get_pool_stats()}
         except Exception as e:
             return {"status": "unhealthy", "neo4j": str(e)}
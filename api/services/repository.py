@@ -0,0 +1,203 @@
+"""Graph repository interface shared by the Neo4j and in-memory backends"""
+
+from abc import ABC, abstractmethod
+from datetime import date, datetime
+
+from api.core.cache import query_cache
+from api.core.events import event_broker
+from api.core.versions import graph_versions
+
+# Tags whose writes change the dashboard summary counters
+SUMMARY_TAGS = ("summary", "equipment", "sensors", "anomalies", "predictions", "maintenance")
+
+
+def record_change(*tags: str) -> int:
+    """Record a write: bump graph versions and drop cached results for the tags"""
+    graph_versions.bump(*tags)
+    return query_cache.invalidate(*tags)
+
+
+def publish_observations(rows: list):
+    """Push written observation rows to /api/stream/observations subscribers"""
+    event_broker.publish("observations", [
+        {"sensorId": r["sensorId"], "timestamp": r["timestamp"],
+         "value": r["value"], "unit": r.get("unit")} for r in rows
+    ])
+
+
+def publish_anomalies(rows: list):
+    """Push written anomaly rows to /api/stream/anomalies subscribers"""
+    event_broker.publish("anomalies", [
+        {"score": r["score"], "label": r.get("label"), "description": r.get("description"),
+         "timestamp": r["timestamp"], "sensorId": r["sensorId"]} for r in rows
+    ])
+
+
+class GraphRepository(ABC):
+    """
+    Operations the routers, ingestion and health checks use.
+
+    Backends implement every abstract method as a static method returning
+    the same row shapes; paged methods return (rows, next_cursor). Backends
+    are used as classes, never instantiated, so a backend missing a method
+    fails when its class is defined.
+    """
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        missing = sorted(name for name in GraphRepository.__abstractmethods__
+                         if getattr(getattr(cls, name), "__isabstractmethod__", False))
+        if missing:
+            raise TypeError(f"{cls.__name__} does not implement {', '.join(missing)}")
+
+    # Equipment
+    @staticmethod
+    @abstractmethod
+    async def get_all_equipment() -> list:
+        ...
+
+    @staticmethod
+    @abstractmethod
+    async def get_equipment_by_id(equipment_id: str):
+        ...
+
+    @staticmethod
+    @abstractmethod
+    async def get_equipment_sensors(equipment_id: str) -> list:
+        ...
+
+    @staticmethod
+    @abstractmethod
+    async def get_equipment_detail(equipment_id: str, observations: int = 10, limit: int = 20):
+        ...
+
+    @staticmethod
+    @abstractmethod
+    async def get_equipment_batch(equipment_ids: list) -> dict:
+        ...
+
+    # Sensors and observations
+    @staticmethod
+    @abstractmethod
+    async def get_all_sensors() -> list:
+        ...
+
+    @staticmethod
+    @abstractmethod
+    async def get_sensor_by_id(sensor_id: str):
+        ...
+
+    @staticmethod
+    @abstractmethod
+    async def get_sensor_batch(sensor_ids: list) -> dict:
+        ...
+
+    @staticmethod
+    @abstractmethod
+    async def get_latest_observations(sensor_ids: list, limit: int = 1) -> dict:
+        ...
+
+    @staticmethod
+    @abstractmethod
+    async def get_sensor_observations(sensor_id: str, limit: int = 100, cursor: str = None,
+                                      from_time: datetime = None, to_time: datetime = None):
+        ...
+
+    @staticmethod
+    @abstractmethod
+    async def stream_sensor_observations(sensor_id: str, from_time: datetime = None,
+                                         to_time: datetime = None):
+        """Yields observation rows in time order"""
+
+    @staticmethod
+    @abstractmethod
+    async def get_sensor_series(sensor_id: str, bucket_ms: int, aggregates: list,
+                                from_time: datetime = None, to_time: datetime = None) -> list:
+        ...
+
+    @staticmethod
+    @abstractmethod
+    async def get_sensor_series_downsampled(sensor_id: str, points: int, mode: str = "lttb",
+                                            from_time: datetime = None,
+                                            to_time: datetime = None) -> list:
+        ...
+
+    @staticmethod
+    @abstractmethod
+    async def write_observations(rows: list) -> int:
+        ...
+
+    # Events and predictions
+    @staticmethod
+    @abstractmethod
+    async def get_anomalies(threshold: float = 0.0, limit: int = 100, cursor: str = None,
+                            from_time: datetime = None, to_time: datetime = None):
+        ...
+
+    @staticmethod
+    @abstractmethod
+    async def write_anomalies(rows: list) -> int:
+        ...
+
+    @staticmethod
+    @abstractmethod
+    async def get_failure_predictions() -> list:
+        ...
+
+    @staticmethod
+    @abstractmethod
+    async def get_energy_prediction(forecast_date: str = None):
+        ...
+
+    @staticmethod
+    @abstractmethod
+    async def get_energy_range(from_date: date, to_date: date) -> list:
+        ...
+
+    @staticmethod
+    @abstractmethod
+    async def get_maintenance_events(status: str = None, limit: int = 100, cursor: str = None,
+                                     from_time: datetime = None, to_time: datetime = None):
+        ...
+
+    # Summary
+    @staticmethod
+    @abstractmethod
+    async def get_summary() -> dict:
+        ...
+
+    @staticmethod
+    @abstractmethod
+    async def refresh_summary() -> dict:
+        ...
+
+    # Cache
+    @staticmethod
+    def invalidate_cache(*tags: str) -> int:
+        """Record an external write: drop cached results and bump versions for the tags"""
+        return record_change(*tags)
+
+    @staticmethod
+    def get_cache_stats() -> dict:
+        """Get query cache counters"""
+        return query_cache.stats()
+
+    @staticmethod
+    async def get_change_marks() -> dict:
+        """
+        Time of the last change per tag as recorded in the graph by every
+        writer, for conditional GET. Empty for backends only this process
+        writes to.
+        """
+        return {}
+
+    # Health check
+    @staticmethod
+    @abstractmethod
+    def get_pool_stats() -> dict:
+        ...
+
+    @staticmethod
+    @abstractmethod
+    async def health_check() -> dict:
+        ...
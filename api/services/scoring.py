@@ -0,0 +1,278 @@
+"""Resident anomaly detectors scoring observations in micro-batches"""
+
+import asyncio
+import logging
+import os
+import sys
+import threading
+import time
+from collections import deque
+from itertools import groupby
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from ..core.config import settings
+from ..core.metrics import SCORING_BATCH_SIZE, SCORING_LATENCY
+
+logger = logging.getLogger(__name__)
+
+ROOT = Path(__file__).resolve().parents[2]
+# ml/ modules import each other by top-level name, and pickled models refer to them so
+ML_DIR = ROOT / "ml"
+
+
+def _ml():
+    """Import the ml/ model cache and streaming detector"""
+    if str(ML_DIR) not in sys.path:
+        sys.path.insert(0, str(ML_DIR))
+    import model_cache
+    import registry
+    import streaming
+    return model_cache, registry, streaming
+
+
+def _resolve(path: Optional[str]) -> Optional[str]:
+    if not path:
+        return None
+    return path if os.path.isabs(path) else str(ROOT / path)
+
+
+class AnomalyScorer:
+    """
+    Scores (sensor_id, timestamp, value) items with detectors kept in memory.
+
+    Concurrent score() calls queue up; one task takes whole requests until
+    `max_batch` items are pending or `max_wait` seconds have passed since the
+    first, and scores them in a worker thread with one model call per model
+    (StreamingDetector.update_many), so the event loop stays free to accept
+    the next batch. Each model has a StreamingDetector holding the rolling
+    window of its sensors, so scores match predict_batch over each sensor's
+    stream. Models come from the ml model cache and reload when their
+    artifact changes. A model that fails to load or score fails only the
+    requests with items for it. Requests scored with update=False (dry runs)
+    see the windows but leave them unchanged.
+    """
+
+    def __init__(self, model_path: str, registry_path: Optional[str] = None,
+                 max_batch: int = 1024, max_wait: float = 0.002,
+                 state_dir: Optional[str] = None):
+        self.model_path = _resolve(model_path)
+        self.registry_path = _resolve(registry_path)
+        self.max_batch = max_batch
+        self.max_wait = max_wait
+        self.state_dir = _resolve(state_dir)
+        self._pending: deque = deque()
+        self._queued = 0
+        self._wakeup: Optional[asyncio.Event] = None
+        self._task: Optional[asyncio.Task] = None
+        self._stopping = False
+        self._streams: Dict[str, object] = {}
+        # _stream adds models from the worker thread while stats() reads on the loop
+        self._streams_lock = threading.Lock()
+        self.requests = 0
+        self.items = 0
+        self.batches = 0
+        self.failed = 0
+
+    def start(self):
+        """Start the batching task on the running event loop"""
+        self._stopping = False
+        self._wakeup = asyncio.Event()
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        """Score what is still queued, stop, and save stream state"""
+        self._stopping = True
+        if self._wakeup:
+            self._wakeup.set()
+        if self._task:
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+        if self.state_dir and self._streams:
+            await asyncio.to_thread(self._snapshot)
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done() and not self._stopping
+
+    async def score(self, items: List[tuple], update: bool = True) -> List[tuple]:
+        """
+        (score, label) for each (sensor_id, timestamp, value), in order.
+
+        With update=False the items are scored against the sensors' windows
+        without entering them.
+        """
+        if not self.running:
+            raise RuntimeError("Anomaly scorer is not running")
+        future = asyncio.get_running_loop().create_future()
+        self._pending.append((items, future, update))
+        self._queued += len(items)
+        self.requests += 1
+        # Wake the task for the first request (starts the wait) and for a full batch
+        if len(self._pending) == 1 or self._queued >= self.max_batch:
+            self._wakeup.set()
+        return await future
+
+    def stats(self) -> dict:
+        """Request, item and batch counters"""
+        with self._streams_lock:
+            streams = list(self._streams.values())
+        return {
+            "running": self.running,
+            "models": len(streams),
+            "sensors": sum(len(stream) for stream in streams),
+            "requests": self.requests,
+            "items": self.items,
+            "batches": self.batches,
+            "failed": self.failed,
+            "queued": self._queued,
+            "meanBatchSize": self.items / self.batches if self.batches else 0.0,
+        }
+
+    async def _run(self):
+        while True:
+            if not self._pending:
+                if self._stopping:
+                    return
+                self._wakeup.clear()
+                await self._wakeup.wait()
+                continue
+            if self._queued < self.max_batch and self.max_wait > 0 and not self._stopping:
+                # Let concurrent requests join the batch
+                self._wakeup.clear()
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), self.max_wait)
+                except asyncio.TimeoutError:
+                    pass
+
+            batch, items, dry_runs = [], [], []
+            while self._pending and (
+                    not items or len(items) + len(self._pending[0][0]) <= self.max_batch):
+                request_items, future, update = self._pending.popleft()
+                self._queued -= len(request_items)
+                # Dry-run items carry their request's index so each request scores alone
+                dry_runs.extend([None if update else len(batch)] * len(request_items))
+                batch.append((len(request_items), future))
+                items.extend(request_items)
+
+            start = time.perf_counter()
+            try:
+                results = await asyncio.to_thread(self._score_batch, items, dry_runs)
+            except Exception as exc:
+                # Keep serving: fail this batch's requests, not the task
+                logger.exception(f"Scoring {len(items)} observations failed")
+                results = [exc] * len(items)
+            SCORING_LATENCY.observe(time.perf_counter() - start)
+            SCORING_BATCH_SIZE.observe(len(items))
+            self.batches += 1
+
+            offset = 0
+            for size, future in batch:
+                request_results = results[offset:offset + size]
+                offset += size
+                error = next((r for r in request_results if isinstance(r, Exception)), None)
+                if error is None:
+                    self.items += size
+                else:
+                    self.failed += size
+                if not future.done():
+                    if error is None:
+                        future.set_result(request_results)
+                    else:
+                        future.set_exception(error)
+
+    def _score_batch(self, items: List[tuple], dry_runs: List[Optional[int]]) -> list:
+        """
+        Score items grouped by the model serving each sensor (worker thread).
+
+        dry_runs holds None for items that update the windows, else the index
+        of their dry-run request. Items of a model that fails to load or score
+        (or of a sensor the registry maps to a missing model) get the
+        exception in place of their (score, label).
+        """
+        try:
+            model_cache, _, _ = _ml()
+            registry = model_cache.model_cache.registry(self.registry_path) \
+                if self.registry_path else None
+        except Exception as exc:
+            logger.error(f"Loading the scoring model registry failed: {exc}")
+            return [exc] * len(items)
+
+        results = [None] * len(items)
+        groups: Dict[str, List[int]] = {}
+        for i, (sensor_id, _, _) in enumerate(items):
+            try:
+                key = registry.model_key(sensor_id) if registry else None
+                path = registry.model_path(key) if key else self.model_path
+            except Exception as exc:
+                # A manifest sensor entry naming a model key that is not registered
+                logger.error(f"No model for sensor {sensor_id}: {exc!r}")
+                results[i] = exc
+                continue
+            groups.setdefault(path, []).append(i)
+
+        for path, indices in groups.items():
+            try:
+                stream = self._stream(path, model_cache.model_cache.get(path))
+                scored = []
+                # Consecutive runs of updating items, or of one dry-run request's items
+                for dry_run, run in groupby(indices, key=lambda i: dry_runs[i]):
+                    observations = [items[i] for i in run]
+                    if dry_run is None:
+                        scored.extend(stream.update_many(observations))
+                    else:
+                        scored.extend(stream.score_many(observations))
+            except Exception as exc:
+                logger.error(f"Scoring {len(indices)} observations with {path} failed: {exc}")
+                scored = [exc] * len(indices)
+            for i, result in zip(indices, scored):
+                results[i] = result
+        return results
+
+    def _stream(self, path: str, detector):
+        """StreamingDetector of a model, following reloads of its artifact"""
+        stream = self._streams.get(path)
+        if stream is None:
+            _, _, streaming = _ml()
+            stream = streaming.StreamingDetector(detector)
+            state_path = self._state_path(path)
+            if state_path and os.path.exists(state_path):
+                try:
+                    stream.restore(state_path)
+                except (ValueError, KeyError) as exc:
+                    logger.warning(f"Ignoring stream state {state_path}: {exc}")
+            with self._streams_lock:
+                self._streams[path] = stream
+        elif stream.detector is not detector:
+            # Retrained artifact: keep the sensors' windows, score with the new model
+            stream.detector = detector
+        return stream
+
+    def _state_path(self, model_path: str) -> Optional[str]:
+        if not self.state_dir:
+            return None
+        _, registry, _ = _ml()
+        # Repository-relative names survive moving the checkout
+        name = os.path.relpath(model_path, ROOT)
+        if name.startswith(os.pardir):
+            name = model_path.lstrip(os.sep)
+        return os.path.join(self.state_dir, registry.artifact_name(os.path.splitext(name)[0]))
+
+    def _snapshot(self):
+        """Save every model's stream state to state_dir"""
+        os.makedirs(self.state_dir, exist_ok=True)
+        for path, stream in list(self._streams.items()):
+            try:
+                stream.snapshot(self._state_path(path))
+            except OSError as exc:
+                logger.error(f"Saving stream state of {path} failed: {exc}")
+
+
+# Singleton instance
+anomaly_scorer = AnomalyScorer(
+    model_path=settings.scoring_model_path,
+    registry_path=settings.scoring_registry_path,
+    max_batch=settings.scoring_batch_size,
+    max_wait=settings.scoring_max_wait,
+    state_dir=settings.scoring_state_dir
+)
@@ -0,0 +1,131 @@
+"""Time series aggregation and downsampling"""
+
+import re
+from datetime import datetime, timezone
+from typing import AsyncIterator, Tuple
+
+import numpy as np
+
+# Cypher aggregate expressions over the observation value `v`
+AGGREGATES = {
+    "avg": "avg(v)",
+    "min": "min(v)",
+    "max": "max(v)",
+    "count": "count(v)",
+    "sum": "sum(v)",
+}
+
+_UNIT_MS = {"s": 1000, "m": 60_000, "h": 3_600_000, "d": 86_400_000}
+
+# Rows pulled from the result stream per NumPy reduction step
+CHUNK_ROWS = 10_000
+
+
+def parse_bucket(bucket: str) -> int:
+    """Parse a bucket width such as '30s', '15m', '1h' or '1d' into milliseconds"""
+    match = re.fullmatch(r"(\d+)([smhd])", bucket.strip())
+    if not match or int(match.group(1)) == 0:
+        raise ValueError(f"Invalid bucket: {bucket}")
+    return int(match.group(1)) * _UNIT_MS[match.group(2)]
+
+
+def parse_aggregates(agg: str) -> list:
+    """Parse a comma separated aggregate list such as 'avg,min,max,count'"""
+    names = [a.strip() for a in agg.split(",") if a.strip()]
+    unknown = [a for a in names if a not in AGGREGATES]
+    if not names or unknown:
+        raise ValueError(f"Invalid agg: {agg} (allowed: {', '.join(AGGREGATES)})")
+    return list(dict.fromkeys(names))
+
+
+def epoch_ms_to_iso(ms: int) -> str:
+    """Convert epoch milliseconds to an ISO 8601 UTC timestamp"""
+    return datetime.fromtimestamp(ms / 1000, tz=timezone.utc).isoformat()
+
+
+async def chunked_arrays(rows: AsyncIterator[dict],
+                         size: int = CHUNK_ROWS) -> AsyncIterator[Tuple[np.ndarray, np.ndarray]]:
+    """Group streamed {t, v} rows into (timestamps, values) arrays"""
+    ts, vs = [], []
+    async for row in rows:
+        if row["v"] is None:
+            continue
+        ts.append(row["t"])
+        vs.append(row["v"])
+        if len(ts) >= size:
+            yield np.array(ts, dtype=np.int64), np.array(vs, dtype=np.float64)
+            ts, vs = [], []
+    if ts:
+        yield np.array(ts, dtype=np.int64), np.array(vs, dtype=np.float64)
+
+
+async def minmax_reduce(chunks: AsyncIterator[Tuple[np.ndarray, np.ndarray]],
+                        t0: int, t1: int, n_buckets: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Keep the minimum and maximum point of each of n_buckets equal time buckets.
+
+    Consumes the stream chunk by chunk, so memory is O(n_buckets) regardless
+    of the number of rows.
+
+    Returns:
+        Tuple of (timestamps, values) in time order
+    """
+    span = max(t1 - t0, 1)
+    min_v = np.full(n_buckets, np.inf)
+    max_v = np.full(n_buckets, -np.inf)
+    min_t = np.zeros(n_buckets, dtype=np.int64)
+    max_t = np.zeros(n_buckets, dtype=np.int64)
+
+    async for t, v in chunks:
+        idx = np.clip((t - t0) * n_buckets // span, 0, n_buckets - 1)
+
+        # First row per bucket after sorting by (bucket, value) is the bucket min
+        order = np.lexsort((v, idx))
+        first = np.unique(idx[order], return_index=True)[1]
+        b, rows = idx[order][first], order[first]
+        better = v[rows] < min_v[b]
+        min_v[b[better]], min_t[b[better]] = v[rows[better]], t[rows[better]]
+
+        order = np.lexsort((-v, idx))
+        first = np.unique(idx[order], return_index=True)[1]
+        b, rows = idx[order][first], order[first]
+        better = v[rows] > max_v[b]
+        max_v[b[better]], max_t[b[better]] = v[rows[better]], t[rows[better]]
+
+    filled = np.isfinite(min_v)
+    t = np.concatenate([min_t[filled], max_t[filled]])
+    v = np.concatenate([min_v[filled], max_v[filled]])
+    order = np.argsort(t, kind="stable")
+    t, v = t[order], v[order]
+
+    # Drop duplicates where a bucket's min and max are the same point
+    keep = np.ones(len(t), dtype=bool)
+    keep[1:] = (t[1:] != t[:-1]) | (v[1:] != v[:-1])
+    return t[keep], v[keep]
+
+
+def lttb(t: np.ndarray, v: np.ndarray, n_out: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Largest-Triangle-Three-Buckets downsampling to n_out points"""
+    n = len(t)
+    if n_out >= n or n_out < 3:
+        return t, v
+
+    x = t.astype(np.float64)
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.int64)
+    selected = np.empty(n_out, dtype=np.int64)
+    selected[0], selected[-1] = 0, n - 1
+
+    a = 0
+    for i in range(n_out - 2):
+        start, end = edges[i], edges[i + 1]
+        # Average of the next bucket (or the last point) is the third vertex
+        if i + 2 < len(edges):
+            nxt = slice(edges[i + 1], edges[i + 2])
+            cx, cy = x[nxt].mean(), v[nxt].mean()
+        else:
+            cx, cy = x[-1], v[-1]
+        area = np.abs((x[a] - cx) * (v[start:end] - v[a]) - (x[a] - x[start:end]) * (cy - v[a]))
+        a = start + int(np.argmax(area))
+        selected[i + 1] = a
+
+    return t[selected], v[selected]
@@ -0,0 +1,48 @@
+"""Periodic refresh of the materialized dashboard summary"""
+
+import asyncio
+import logging
+from typing import Optional
+
+from ..core.config import settings
+from .graph import GraphService
+
+logger = logging.getLogger(__name__)
+
+
+class SummaryRefresher:
+    """
+    Recounts the :Stats node at startup and then every `interval` seconds.
+
+    Tracked write paths keep the counters current in their own transactions;
+    the recount repairs drift from writes made outside them (manual Cypher).
+    It is opt-in (interval 0 disables it) since every worker would otherwise
+    repeat the same full label scans; enable it on a single worker.
+    """
+
+    def __init__(self, interval: float = 300.0):
+        self.interval = interval
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self):
+        """Start the refresh task on the running event loop"""
+        if self.interval > 0:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        if self._task:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+    async def _run(self):
+        while True:
+            try:
+                await GraphService.refresh_summary()
+            except Exception as exc:
+                logger.warning(f"Summary refresh failed: {exc}")
+            await asyncio.sleep(self.interval)
+
+
+# Singleton instance
+summary_refresher = SummaryRefresher(interval=settings.summary_refresh_interval)
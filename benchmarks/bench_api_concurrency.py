@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""Concurrency benchmark for the API Neo4j access path
+
+Fires many concurrent calls at a router coroutine on one event loop and
+reports throughput and latency percentiles for each driver mode:
+
+- blocking:   sync driver called directly on the event loop (previous behaviour)
+- threadpool: sync driver run in a threadpool (neo4j_async = False)
+- async:      native async driver (neo4j_async = True)
+
+Usage (from the repository root, Neo4j must be running):
+    python benchmarks/bench_api_concurrency.py --requests 2000 --concurrency 200
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from api.core.config import settings
+from api.core.database import neo4j_db, async_neo4j_db
+from api.routers import equipment
+from api.services import neo4j_service
+
+MODES = ["blocking", "threadpool", "async"]
+
+
+async def _blocking_query(cypher: str, parameters: dict = None) -> list:
+    """Previous behaviour: sync query executed on the event loop"""
+    return neo4j_db.query(cypher, parameters)
+
+
+async def run_mode(mode: str, n_requests: int, concurrency: int) -> dict:
+    """Run the benchmark for one mode and return its statistics"""
+    original_query = neo4j_service._query
+    settings.neo4j_async = mode == "async"
+    if mode == "blocking":
+        neo4j_service._query = _blocking_query
+
+    latencies = []
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def one_request():
+        async with semaphore:
+            start = time.perf_counter()
+            await equipment.get_all_equipment()
+            latencies.append(time.perf_counter() - start)
+
+    try:
+        # Warm up the connection pool
+        await asyncio.gather(*(one_request() for _ in range(min(concurrency, 20))))
+        latencies.clear()
+
+        start = time.perf_counter()
+        await asyncio.gather(*(one_request() for _ in range(n_requests)))
+        elapsed = time.perf_counter() - start
+    finally:
+        neo4j_service._query = original_query
+
+    ms = np.array(latencies) * 1000
+    return {
+        "mode": mode,
+        "throughput": n_requests / elapsed,
+        "p50": np.percentile(ms, 50),
+        "p99": np.percentile(ms, 99),
+        "max": ms.max(),
+    }
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="API concurrency benchmark")
+    parser.add_argument("--requests", type=int, default=2000,
+                        help="Total number of requests per mode")
+    parser.add_argument("--concurrency", type=int, default=200,
+                        help="Maximum requests in flight")
+    parser.add_argument("--modes", nargs="+", default=MODES, choices=MODES,
+                        help="Modes to benchmark")
+    args = parser.parse_args()
+
+    neo4j_db.connect()
+    async_neo4j_db.connect()
+    try:
+        results = [await run_mode(m, args.requests, args.concurrency) for m in args.modes]
+    finally:
+        neo4j_db.close()
+        await async_neo4j_db.close()
+
+    print(f"\n{args.requests} requests, concurrency {args.concurrency}")
+    print(f"{'mode':<12}{'req/s':>10}{'p50 ms':>10}{'p99 ms':>10}{'max ms':>10}")
+    for r in results:
+        print(f"{r['mode']:<12}{r['throughput']:>10.1f}{r['p50']:>10.2f}"
+              f"{r['p99']:>10.2f}{r['max']:>10.2f}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+"""Energy forecast layout benchmark: point nodes vs. compact arrays
+
+Creates `--days` synthetic 96-point forecasts and measures reading the whole
+range with the API's EnergyPrediction projection, once with the points as
+EnergyForecastPoint nodes and once packed into forecastPower /
+forecastConfidence arrays on the prediction (neo4j/migrate-energy-compact.cypher).
+
+--backend neo4j (default) uses :EnergyBench prediction nodes, removed at the
+end; --backend memory compares the two layouts of the in-memory graph and
+needs no database.
+
+Usage (from the repository root):
+    python benchmarks/bench_energy_layout.py --days 365
+    python benchmarks/bench_energy_layout.py --days 365 --backend memory
+"""
+
+import argparse
+import os
+import sys
+import time
+from datetime import date, timedelta
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from api.core.memory_graph import MemoryGraph, add_synthetic
+
+START = date(2024, 1, 1)
+
+RANGE_READ = """
+MATCH (ep:EnergyBench)
+WHERE ep.forecastDate >= date($from) AND ep.forecastDate < date($to)
+RETURN {fields}
+ORDER BY forecastDate
+"""
+
+POPULATE = """
+UNWIND range(0, $days - 1) AS d
+WITH d, date($start) + duration({days: d}) AS day
+CREATE (ep:EnergyBench {forecastDate: day, totalDailyEnergy: 2400.0,
+                        peakPower: 140.0, confidenceScore: 0.9})
+WITH ep, day
+UNWIND range(0, 95) AS i
+CREATE (ep)-[:hasForecastPoint]->(:EnergyForecastPoint:EnergyBench {
+    intervalIndex: i,
+    intervalStartTime: datetime({date: day, timezone: 'Z'}) + duration({minutes: 15 * i}),
+    powerConsumption: 100.0 + 40.0 * sin(i * pi() / 48) + rand(),
+    confidenceScore: 0.9
+})
+"""
+
+COMPACT = """
+MATCH (ep:EnergyBench)-[:hasForecastPoint]->(fp:EnergyForecastPoint)
+WITH ep, fp ORDER BY fp.intervalIndex
+WITH ep, collect(fp) AS points
+SET ep.forecastIntervals = [fp IN points | fp.intervalIndex],
+    ep.forecastPower = [fp IN points | fp.powerConsumption],
+    ep.forecastConfidence = [fp IN points | fp.confidenceScore],
+    ep.forecastStart = points[0].intervalStartTime
+WITH points
+UNWIND points AS fp
+DETACH DELETE fp
+"""
+
+
+def summarize(latencies: list) -> tuple:
+    ms = np.array(latencies)
+    return np.percentile(ms, 50), np.percentile(ms, 99)
+
+
+def bench_neo4j(days: int, reads: int) -> dict:
+    """p50/p99 range-read latency per layout on a running Neo4j"""
+    from api.core.database import neo4j_db
+    from api.services.neo4j_service import ENERGY_PREDICTION_FIELDS
+
+    query = RANGE_READ.format(fields=ENERGY_PREDICTION_FIELDS)
+    params = {"from": START.isoformat(), "to": (START + timedelta(days=days)).isoformat()}
+
+    def measure() -> list:
+        latencies = []
+        for _ in range(reads):
+            start = time.perf_counter()
+            rows = neo4j_db.query(query, params)
+            latencies.append((time.perf_counter() - start) * 1000)
+        assert len(rows) == days and all(len(r["forecastPoints"]) == 96 for r in rows)
+        return latencies
+
+    neo4j_db.connect()
+    results = {}
+    try:
+        neo4j_db.run("CREATE INDEX energy_bench_date IF NOT EXISTS "
+                     "FOR (ep:EnergyBench) ON (ep.forecastDate)")
+        neo4j_db.run(POPULATE, {"days": days, "start": START.isoformat()})
+        neo4j_db.run("CALL db.awaitIndexes(300)")
+        results["nodes"] = measure()
+        neo4j_db.run(COMPACT)
+        results["compact"] = measure()
+    finally:
+        neo4j_db.run("""
+        MATCH (n:EnergyBench)
+        CALL { WITH n DETACH DELETE n } IN TRANSACTIONS OF 10000 ROWS
+        """)
+        neo4j_db.run("DROP INDEX energy_bench_date IF EXISTS")
+        neo4j_db.close()
+    return results
+
+
+def bench_memory(days: int, reads: int) -> dict:
+    """
+    p50/p99 range-read latency per layout of the in-memory graph: API point
+    rows, and the day x 96 power matrix the range aggregates work on
+    """
+    results = {}
+    for layout in ("nodes", "compact"):
+        graph = MemoryGraph()
+        add_synthetic(graph, 0, 0, days=days)
+        graph.reindex(compact_forecasts=layout == "compact")
+        predictions = [uri for _, uri in sorted(graph.energy_predictions.items())]
+        print(f"{layout}: {len(graph.props)} graph nodes")
+
+        def power_matrix():
+            if layout == "compact":
+                return np.stack([graph.props[uri]["forecastPower"] for uri in predictions])
+            return np.array([[p["powerConsumption"] for p in graph.forecast_points(uri)]
+                             for uri in predictions])
+
+        for read, run in (("points", lambda: [graph.forecast_points(u) for u in predictions]),
+                          ("matrix", power_matrix)):
+            latencies = []
+            for _ in range(reads):
+                start = time.perf_counter()
+                rows = run()
+                latencies.append((time.perf_counter() - start) * 1000)
+            assert len(rows) == days and all(len(r) == 96 for r in rows)
+            results[f"{layout}/{read}"] = latencies
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Energy forecast layout benchmark")
+    parser.add_argument("--days", type=int, default=365, help="Forecast days in the range")
+    parser.add_argument("--reads", type=int, default=50, help="Range reads per layout")
+    parser.add_argument("--backend", choices=("neo4j", "memory"), default="neo4j")
+    args = parser.parse_args()
+
+    bench = bench_neo4j if args.backend == "neo4j" else bench_memory
+    results = bench(args.days, args.reads)
+
+    print(f"\n{args.days}-day range read ({args.days * 96} points, {args.backend})")
+    print(f"{'layout':>16}{'p50 ms':>12}{'p99 ms':>12}")
+    for layout, latencies in results.items():
+        p50, p99 = summarize(latencies)
+        print(f"{layout:>16}{p50:>12.2f}{p99:>12.2f}")
+    for layout in results:
+        if layout.startswith("nodes"):
+            read = layout[len("nodes"):]
+            speedup = summarize(results[layout])[0] / summarize(results["compact" + read])[0]
+            print(f"compact speedup{read.replace('/', ' ')} (p50): {speedup:.1f}x")
+
+if __name__ == "__main__":
+    main()
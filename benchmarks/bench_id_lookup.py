@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""ID lookup benchmark: n10s array predicate vs. index-backed scalar lookup
+
+For each graph size, creates synthetic :LookupBench nodes carrying the same ID
+both as a one-element array (n10s handleMultival "ARRAY") and as an indexed
+scalar, then measures the two lookup patterns:
+
+- array:  MATCH (n) WHERE n.arrayId[0] = $id OR n.arrayId = $id
+- scalar: MATCH (n:LookupBench {scalarId: $id})
+
+Benchmark nodes are removed at the end of each size.
+
+Usage (from the repository root, Neo4j must be running):
+    python benchmarks/bench_id_lookup.py --sizes 10000 100000 1000000
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from api.core.database import neo4j_db
+
+ARRAY_LOOKUP = """
+MATCH (n)
+WHERE n.arrayId[0] = $id OR n.arrayId = $id
+RETURN n.scalarId AS id
+"""
+
+SCALAR_LOOKUP = """
+MATCH (n:LookupBench {scalarId: $id})
+RETURN n.scalarId AS id
+"""
+
+
+def populate(size: int, batch_size: int = 50000):
+    """Create benchmark nodes and the scalar index"""
+    neo4j_db.run(
+        "CREATE INDEX lookup_bench_scalar_id IF NOT EXISTS "
+        "FOR (n:LookupBench) ON (n.scalarId)"
+    )
+    for start in range(0, size, batch_size):
+        end = min(start + batch_size, size) - 1
+        neo4j_db.run("""
+        UNWIND range($start, $end) AS i
+        CREATE (:LookupBench {arrayId: ['ID-' + i], scalarId: 'ID-' + i})
+        """, {"start": start, "end": end})
+    neo4j_db.run("CALL db.awaitIndexes(300)")
+
+
+def cleanup(batch_size: int = 50000):
+    """Remove benchmark nodes and index"""
+    neo4j_db.run(f"""
+    MATCH (n:LookupBench)
+    CALL {{ WITH n DETACH DELETE n }} IN TRANSACTIONS OF {batch_size} ROWS
+    """)
+    neo4j_db.run("DROP INDEX lookup_bench_scalar_id IF EXISTS")
+
+
+def measure(cypher: str, size: int, n_lookups: int) -> np.ndarray:
+    """Run random lookups and return latencies in ms"""
+    latencies = []
+    for _ in range(n_lookups):
+        params = {"id": f"ID-{random.randrange(size)}"}
+        start = time.perf_counter()
+        neo4j_db.query(cypher, params)
+        latencies.append((time.perf_counter() - start) * 1000)
+    return np.array(latencies)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="ID lookup benchmark")
+    parser.add_argument("--sizes", nargs="+", type=int,
+                        default=[10000, 100000, 1000000],
+                        help="Number of benchmark nodes per run")
+    parser.add_argument("--lookups", type=int, default=200,
+                        help="Lookups per pattern and size")
+    args = parser.parse_args()
+
+    neo4j_db.connect()
+    rows = []
+    try:
+        for size in args.sizes:
+            print(f"Populating {size} nodes...")
+            populate(size)
+            try:
+                # Array scans are slow on large graphs; fewer samples suffice
+                array_ms = measure(ARRAY_LOOKUP, size, max(10, args.lookups // 10))
+                scalar_ms = measure(SCALAR_LOOKUP, size, args.lookups)
+            finally:
+                cleanup()
+            rows.append((size, array_ms, scalar_ms))
+    finally:
+        neo4j_db.close()
+
+    print(f"\n{'nodes':>10}{'array p50':>12}{'array p99':>12}"
+          f"{'scalar p50':>12}{'scalar p99':>12}{'speedup':>10}")
+    for size, array_ms, scalar_ms in rows:
+        speedup = np.median(array_ms) / np.median(scalar_ms)
+        print(f"{size:>10}{np.percentile(array_ms, 50):>12.2f}{np.percentile(array_ms, 99):>12.2f}"
+              f"{np.percentile(scalar_ms, 50):>12.2f}{np.percentile(scalar_ms, 99):>12.2f}"
+              f"{speedup:>9.0f}x")
+
+
+if __name__ == "__main__":
+    main()
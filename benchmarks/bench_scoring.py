@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""Scoring service benchmark: concurrent POST /api/anomalies/score requests
+
+Trains a detector on synthetic values, starts the API's anomaly scorer with
+it and fires `--requests` concurrent requests of `--items` observations each
+(round-robin over `--sensors` sensors), through the FastAPI app in-process
+(--via http) or straight at the scorer (--via scorer). Reports requests/s,
+amortized time per point, latency percentiles and the mean micro-batch size,
+and checks the first sensor's scores against predict_batch over its stream.
+No Neo4j instance is needed.
+
+Usage (from the repository root):
+    python benchmarks/bench_scoring.py --requests 5000 --concurrency 500 --items 1
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+import pandas as pd
+
+# persist=true (so requests update the windows) writes nothing for unknown sensors here
+os.environ.setdefault("GRAPH_BACKEND", "memory")
+ROOT = os.path.join(os.path.dirname(__file__), "..")
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, "ml"))
+
+from anomaly_detection import AnomalyDetector  # noqa: E402
+from api.services import anomaly_scorer  # noqa: E402
+
+ALGORITHMS = ("isolation_forest", "one_class_svm", "zscore")
+START = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+
+def request_bodies(requests: int, items: int, sensors: int, seed: int = 0) -> list:
+    """Observation lists per request; each sensor's timestamps increase"""
+    rng = np.random.default_rng(seed)
+    values = rng.normal(2.5, 0.5, requests * items)
+    values[rng.random(len(values)) < 0.01] += 4.0
+    observations = [(f"SENSOR-{i % sensors:04d}", START + timedelta(minutes=i // sensors),
+                     values[i]) for i in range(len(values))]
+    return [observations[r * items:(r + 1) * items] for r in range(requests)]
+
+
+async def run(args, detector: AnomalyDetector) -> dict:
+    bodies = request_bodies(args.requests, args.items, args.sensors)
+    latencies = []
+    results = [None] * len(bodies)
+    semaphore = asyncio.Semaphore(args.concurrency)
+
+    if args.via == "http":
+        import httpx
+        from api.main import app
+        client = httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test")
+
+        async def send(body: list) -> list:
+            payload = [{"sensorId": s, "timestamp": t.isoformat(), "value": v} for s, t, v in body]
+            reply = await client.post("/api/anomalies/score", json=payload,
+                                      params={"persist": "true", "threshold": 1.0})
+            reply.raise_for_status()
+            return [(r["score"], r["label"]) for r in reply.json()["data"]]
+    else:
+        client = None
+
+        async def send(body: list) -> list:
+            return await anomaly_scorer.score(body)
+
+    async def one_request(i: int):
+        async with semaphore:
+            start = time.perf_counter()
+            results[i] = await send(bodies[i])
+            latencies.append(time.perf_counter() - start)
+
+    anomaly_scorer.start()
+    try:
+        # Requests go out in order, so each sensor's observations are scored in order
+        start = time.perf_counter()
+        await asyncio.gather(*(one_request(i) for i in range(len(bodies))))
+        elapsed = time.perf_counter() - start
+    finally:
+        await anomaly_scorer.stop()
+        if client:
+            await client.aclose()
+
+    first = [(v, r[0]) for body, res in zip(bodies, results) for (s, _, v), r in zip(body, res)
+             if s == "SENSOR-0000"]
+    expected = detector.predict_batch(pd.DataFrame({"value": [v for v, _ in first]}))
+    stats = anomaly_scorer.stats()
+    ms = np.array(latencies) * 1000
+    return {
+        "throughput": len(bodies) / elapsed,
+        "perPointUs": elapsed / (len(bodies) * args.items) * 1e6,
+        "p50": np.percentile(ms, 50),
+        "p99": np.percentile(ms, 99),
+        "batch": stats["meanBatchSize"],
+        "identical": np.array_equal(expected["anomaly_score"].to_numpy(), [s for _, s in first]),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Scoring service benchmark")
+    parser.add_argument("--requests", type=int, default=5000, help="Requests per algorithm")
+    parser.add_argument("--concurrency", type=int, default=500, help="Requests in flight")
+    parser.add_argument("--items", type=int, default=1, help="Observations per request")
+    parser.add_argument("--sensors", type=int, default=100, help="Distinct sensors")
+    parser.add_argument("--batch", type=int, default=1024, help="Scorer max batch size")
+    parser.add_argument("--wait", type=float, default=0.002, help="Scorer max wait (s)")
+    parser.add_argument("--via", choices=("http", "scorer"), default="http")
+    parser.add_argument("--algorithms", nargs="+", choices=ALGORITHMS, default=list(ALGORITHMS))
+    args = parser.parse_args()
+
+    train = pd.DataFrame({"value": np.random.default_rng(1).normal(2.5, 0.5, 2000)})
+    anomaly_scorer.registry_path = None
+    anomaly_scorer.state_dir = None
+    anomaly_scorer.max_batch = args.batch
+    anomaly_scorer.max_wait = args.wait
+
+    print(f"{args.requests} requests x {args.items} items, concurrency {args.concurrency}, "
+          f"via {args.via}")
+    print(f"{'algorithm':>18}{'req/s':>10}{'us/point':>10}{'p50 ms':>9}{'p99 ms':>9}"
+          f"{'batch':>8}{'identical':>11}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for algorithm in args.algorithms:
+            detector = AnomalyDetector(algorithm).fit(train)
+            anomaly_scorer.model_path = os.path.join(tmp, f"{algorithm}.joblib")
+            detector.save(anomaly_scorer.model_path)
+            anomaly_scorer._streams.clear()
+            anomaly_scorer.items = anomaly_scorer.batches = 0
+            result = asyncio.run(run(args, detector))
+            print(f"{algorithm:>18}{result['throughput']:>10.0f}{result['perPointUs']:>10.1f}"
+                  f"{result['p50']:>9.1f}{result['p99']:>9.1f}{result['batch']:>8.1f}"
+                  f"{str(result['identical']):>11}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""Serialization benchmark: Pydantic response model path vs. orjson fast path
+
+Builds synthetic observation and anomaly rows shaped like the Neo4j results
+(timestamps as neo4j.time.DateTime) and measures, per 10k rows:
+
+- model: APIResponse(...) + response-model validation + JSON encoding,
+         i.e. what FastAPI does for `response_model=APIResponse[List[...]]`
+- fast:  api_response() with FAST_SERIALIZATION (projection + orjson)
+- fast+debug: fast path with row validation (DEBUG=true)
+
+plus the size and time of gzip / brotli compression of the encoded body.
+No Neo4j instance is needed.
+
+Usage (from the repository root):
+    python benchmarks/bench_serialization.py --rows 10000 100000
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import time
+import zlib
+from datetime import timezone
+from typing import List
+
+import numpy as np
+from neo4j.time import DateTime
+from pydantic import TypeAdapter
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from api.core.config import settings
+from api.core.responses import api_response
+from api.models import Anomaly, APIResponse, SensorObservation
+
+
+def observation_rows(n: int) -> list:
+    return [{
+        "sensorId": f"VIB-{i % 50:03d}",
+        "timestamp": DateTime(2025, 1, 1 + i % 28, i % 24, i % 60, i % 60, tzinfo=timezone.utc),
+        "value": random.random() * 10,
+        "unit": "mm/s",
+    } for i in range(n)]
+
+
+def anomaly_rows(n: int) -> list:
+    return [{
+        "score": random.random(),
+        "label": "Vibration anomaly",
+        "description": "Detected by isolation forest",
+        "timestamp": DateTime(2025, 1, 1 + i % 28, i % 24, i % 60, i % 60, tzinfo=timezone.utc),
+        "sensorId": f"VIB-{i % 50:03d}",
+    } for i in range(n)]
+
+
+def model_path(data_type, rows: list) -> bytes:
+    """Mirror FastAPI: build APIResponse, validate against response model, dump JSON"""
+    adapter = TypeAdapter(APIResponse[data_type])
+    response = APIResponse(success=True, data=rows, count=len(rows))
+    validated = adapter.validate_python(response, from_attributes=True)
+    content = adapter.dump_python(validated, mode="json")
+    return json.dumps(content, ensure_ascii=False, allow_nan=False,
+                      separators=(",", ":")).encode()
+
+
+def fast_path(data_type, rows: list, debug: bool) -> bytes:
+    settings.fast_serialization, settings.debug = True, debug
+    return api_response(data_type, rows, count=len(rows)).body
+
+
+def timed(fn, repeat: int) -> tuple:
+    """Return (median seconds, last result)"""
+    times, result = [], None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        times.append(time.perf_counter() - start)
+    return float(np.median(times)), result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serialization benchmark")
+    parser.add_argument("--rows", nargs="+", type=int, default=[10000, 100000],
+                        help="Rows per response")
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per measurement")
+    args = parser.parse_args()
+
+    try:
+        import brotli
+    except ImportError:
+        brotli = None
+
+    print(f"{'dataset':>12}{'rows':>9}{'model ms/10k':>14}{'fast ms/10k':>13}"
+          f"{'fast+dbg ms/10k':>17}{'speedup':>9}{'json KB':>9}{'gzip KB':>9}{'br KB':>8}")
+    for name, data_type, make in (("observation", List[SensorObservation], observation_rows),
+                                  ("anomaly", List[Anomaly], anomaly_rows)):
+        for n in args.rows:
+            rows = make(n)
+            per_10k = 10000 / n * 1000
+            model_s, model_body = timed(lambda: model_path(data_type, rows), args.repeat)
+            fast_s, fast_body = timed(lambda: fast_path(data_type, rows, False), args.repeat)
+            debug_s, _ = timed(lambda: fast_path(data_type, rows, True), args.repeat)
+            assert json.loads(model_body) == json.loads(fast_body), "fast path output differs"
+
+            gz = zlib.compress(fast_body, 6)
+            br = brotli.compress(fast_body, quality=4) if brotli else None
+            print(f"{name:>12}{n:>9}{model_s * per_10k:>14.1f}{fast_s * per_10k:>13.1f}"
+                  f"{debug_s * per_10k:>17.1f}{model_s / fast_s:>8.1f}x"
+                  f"{len(fast_body) / 1024:>9.0f}{len(gz) / 1024:>9.0f}"
+                  f"{(len(br) / 1024 if br else float('nan')):>8.0f}")
+
+
+if __name__ == "__main__":
+    main()
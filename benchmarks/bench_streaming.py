@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""Streaming scoring benchmark: per-sensor state, updates/s and snapshot size
+
+Feeds `--rounds` observations to each of `--sensors` sensors through
+StreamingDetector, one update() per observation and in micro-batches of
+`--batch` (update_many), and reports updates/s, state memory per sensor and
+the snapshot/restore time. The first sensor's streamed scores are checked
+against predict_batch over its whole series. No Neo4j instance is needed.
+
+Usage (from the repository root):
+    python benchmarks/bench_streaming.py --sensors 5000 --rounds 20
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "ml"))
+
+from anomaly_detection import AnomalyDetector
+from streaming import StreamingDetector
+
+ALGORITHMS = ("isolation_forest", "one_class_svm", "zscore")
+
+
+def observations(sensors: int, rounds: int, seed: int = 0) -> list:
+    """Round-robin (sensor_id, timestamp, value) readings, about 1% spikes"""
+    rng = np.random.default_rng(seed)
+    values = rng.normal(2.5, 0.5, (rounds, sensors))
+    values[rng.random(values.shape) < 0.01] += 4.0
+    return [(f"SENSOR-{s:05d}", t, values[t, s]) for t in range(rounds) for s in range(sensors)]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Streaming scoring benchmark")
+    parser.add_argument("--sensors", type=int, default=5000, help="Concurrent sensors")
+    parser.add_argument("--rounds", type=int, default=20, help="Observations per sensor")
+    parser.add_argument("--batch", type=int, default=500, help="Observations per update_many call")
+    parser.add_argument("--algorithms", nargs="+", choices=ALGORITHMS, default=list(ALGORITHMS))
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(1)
+    train = pd.DataFrame({"value": rng.normal(2.5, 0.5, 2000)})
+    stream = observations(args.sensors, args.rounds)
+    first = np.array([value for sensor_id, _, value in stream if sensor_id == stream[0][0]])
+    print(f"{len(stream)} observations, {args.sensors} sensors")
+    print(f"{'algorithm':>18}{'update/s':>12}{'batched/s':>12}{'bytes/sensor':>14}"
+          f"{'snapshot ms':>13}{'restore ms':>12}{'identical':>11}")
+
+    for algorithm in args.algorithms:
+        detector = AnomalyDetector(algorithm).fit(train)
+
+        # One model call per observation is slow for the sklearn models; time a slice
+        single = StreamingDetector(detector)
+        head = stream[:min(len(stream), 2000)]
+        start = time.perf_counter()
+        for observation in head:
+            single.update(*observation)
+        update_rate = len(head) / (time.perf_counter() - start)
+
+        batched = StreamingDetector(detector)
+        tracemalloc.start()
+        start = time.perf_counter()
+        results = []
+        for i in range(0, len(stream), args.batch):
+            results.extend(batched.update_many(stream[i:i + args.batch]))
+        batch_rate = len(stream) / (time.perf_counter() - start)
+        state_bytes = tracemalloc.get_traced_memory()[0] - sys.getsizeof(results) \
+            - sum(sys.getsizeof(r) for r in results)
+        tracemalloc.stop()
+
+        scores = [score for (sensor_id, _, _), (score, _) in zip(stream, results)
+                  if sensor_id == stream[0][0]]
+        expected = detector.predict_batch(pd.DataFrame({"value": first}))["anomaly_score"]
+        identical = np.array_equal(expected.to_numpy(), np.array(scores))
+
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "stream.joblib")
+            start = time.perf_counter()
+            batched.snapshot(path)
+            snapshot_ms = (time.perf_counter() - start) * 1000
+            start = time.perf_counter()
+            StreamingDetector(detector).restore(path)
+            restore_ms = (time.perf_counter() - start) * 1000
+
+        print(f"{algorithm:>18}{update_rate:>12.0f}{batch_rate:>12.0f}"
+              f"{state_bytes / args.sensors:>14.0f}{snapshot_ms:>13.1f}{restore_ms:>12.1f}"
+              f"{str(identical):>11}")
+
+
+if __name__ == "__main__":
+    main()
@@ -24,7 +24,8 @@ st.sidebar.markdown("페이지를 선택하세요")
 # Connection status
 try:
     client = get_cached_client()
-    summary = client.query_single(queries.GET_DASHBOARD_SUMMARY)
+    summary = (client.query_single(queries.GET_DASHBOARD_SUMMARY)
+               or client.query_single(queries.COUNT_DASHBOARD_SUMMARY))
     st.sidebar.success("✅ Neo4j Connected")
 except Exception as e:
     st.sidebar.error(f"❌ Neo4j Connection Failed")
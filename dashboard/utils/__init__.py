@@ -1,4 +1,15 @@
-from .neo4j_client import Neo4jClient, get_client, get_cached_client
-from . import queries
+import os
+import sys
 
+# graphdb (the Neo4j client shared with the API) lives at the repository root;
+# streamlit only puts dashboard/ on the path
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..")
+if ROOT not in sys.path:
+    sys.path.append(ROOT)
+
+from .neo4j_client import Neo4jClient, get_client, get_cached_client  # noqa: E402
+from . import queries  # noqa: E402
+
+# MemoryClient (GRAPH_BACKEND=memory) loads the API's in-memory graph, so it is
+# imported on demand from utils.memory_client
 __all__ = ['Neo4jClient', 'get_client', 'get_cached_client', 'queries']
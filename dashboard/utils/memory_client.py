@@ -0,0 +1,192 @@
+"""In-memory graph client for UPW Dashboard (GRAPH_BACKEND=memory)"""
+
+from collections import Counter
+from datetime import datetime, timezone
+
+from api.core.memory_graph import get_memory_graph
+
+from . import queries
+
+
+def _text(value):
+    """toString() of a property, keeping nulls"""
+    return value.isoformat() if hasattr(value, "isoformat") else value
+
+
+def _label(graph, uri):
+    return graph.props.get(uri, {}).get("rdfs__label")
+
+
+def _all_equipment(graph):
+    rows = [{
+        "id": props.get("equipmentId"),
+        "name": props.get("equipmentName"),
+        "type": graph.node_type(uri),
+        "operatingHours": props.get("operatingHours"),
+        "installationDate": _text(props.get("installationDate")),
+    } for uri, props in ((u, graph.props[u]) for u in graph.equipment.values())]
+    return sorted(rows, key=lambda r: r["name"] or "")
+
+
+def _equipment_with_sensors(graph):
+    rows = []
+    for uri in graph.equipment.values():
+        sensors = [{
+            "id": graph.props[s]["sensorId"],
+            "type": graph.node_type(s),
+            "location": graph.props[s].get("sensorLocation"),
+        } for s in graph.related(uri, "hasSensor") if "sensorId" in graph.props.get(s, {})]
+        if sensors:
+            rows.append({"equipmentId": graph.props[uri]["equipmentId"],
+                         "equipmentName": graph.props[uri].get("equipmentName"),
+                         "sensors": sensors})
+    return sorted(rows, key=lambda r: r["equipmentName"] or "")
+
+
+def _equipment_stats(graph):
+    counts = Counter(graph.node_type(uri) for uri in graph.equipment.values())
+    return [{"type": t, "count": n} for t, n in counts.most_common()]
+
+
+def _anomalies(graph):
+    rows = []
+    for score, uri in graph.anomalies:
+        props = graph.props[uri]
+        sensors = [graph.props[s]["sensorId"] for s in graph.related(uri, "madeBySensor")
+                   if "sensorId" in graph.props.get(s, {})] or [None]
+        rows.extend({
+            "score": score,
+            "label": props.get("rdfs__label"),
+            "description": props.get("rdfs__comment"),
+            "timestamp": _text(props.get("timestamp")),
+            "sensorId": sensor,
+        } for sensor in sensors)
+    return rows
+
+
+def _anomaly_levels(graph):
+    levels = ("Critical (≥0.7)", "Warning (0.5-0.7)", "Normal (<0.5)")
+    counts = Counter(levels[0] if (s or 0) >= 0.7 else levels[1] if (s or 0) >= 0.5 else levels[2]
+                     for s, _ in graph.anomalies)
+    return [{"level": level, "count": counts[level]} for level in levels if counts[level]]
+
+
+def _failure_predictions(graph):
+    rows = []
+    for fp in graph.failure_predictions:
+        props = graph.props[fp]
+        owners = [e for e in graph.related_from(fp, "hasPrediction")
+                  if "equipmentId" in graph.props.get(e, {})] or [None]
+        rows.extend({
+            "equipmentId": graph.props.get(e, {}).get("equipmentId"),
+            "equipmentName": graph.props.get(e, {}).get("equipmentName"),
+            "failureMode": props.get("failureMode"),
+            "predictedDate": _text(props.get("predictedFailureDate")),
+            "confidence": props.get("confidenceScore"),
+            "rul": props.get("remainingUsefulLife"),
+            "comment": props.get("rdfs__comment"),
+        } for e in owners)
+    return rows
+
+
+def _energy_forecast(graph):
+    rows = []
+    for day in sorted(graph.energy_predictions):
+        ep = graph.energy_predictions[day]
+        props = graph.props[ep]
+        for p in graph.forecast_points(ep):
+            rows.append({
+                "forecastDate": _text(day),
+                "totalEnergy": props.get("totalDailyEnergy"),
+                "peakPower": props.get("peakPower"),
+                "intervalIndex": p.get("intervalIndex"),
+                "startTime": _text(p.get("intervalStartTime")),
+                "powerKW": p.get("powerConsumption"),
+                "confidence": p.get("confidenceScore"),
+            })
+    return sorted(rows, key=lambda r: r["intervalIndex"])
+
+
+def _energy_summary(graph):
+    if not graph.energy_predictions:
+        return []
+    day = min(graph.energy_predictions)
+    props = graph.props[graph.energy_predictions[day]]
+    return [{"forecastDate": _text(day), "totalEnergy": props.get("totalDailyEnergy"),
+             "peakPower": props.get("peakPower"), "confidence": props.get("confidenceScore")}]
+
+
+def _maintenance_events(graph):
+    owner = {event: equipment for _, event, equipment in graph.maintenance_events}
+    events = [u for u, labels in graph.labels.items() if "MaintenanceEvent" in labels]
+    events.sort(key=lambda u: _text(graph.props[u].get("scheduledDate")) or "")
+    rows = []
+    for uri in events:
+        props = graph.props[uri]
+        equipment = graph.props.get(owner.get(uri), {})
+        types = graph.related(uri, "hasMaintenanceType") or [None]
+        rows.extend({
+            "equipmentId": equipment.get("equipmentId"),
+            "equipmentName": equipment.get("equipmentName"),
+            "eventName": props.get("rdfs__label"),
+            "scheduledDate": _text(props.get("scheduledDate")),
+            "completedDate": _text(props.get("completedDate")),
+            "priority": props.get("priority"),
+            "duration": props.get("estimatedDuration"),
+            "status": props.get("status"),
+            "description": props.get("maintenanceDescription"),
+            "maintenanceType": _label(graph, mt),
+        } for mt in types)
+    return rows
+
+
+def _maintenance_by_type(graph):
+    counts = Counter(_label(graph, mt) for u, labels in graph.labels.items()
+                     if "MaintenanceEvent" in labels
+                     for mt in graph.related(u, "hasMaintenanceType"))
+    return [{"type": t, "count": n} for t, n in counts.items()]
+
+
+def _dashboard_summary(graph):
+    return [{**graph.summary(), "updatedAt": datetime.now(timezone.utc).isoformat()}]
+
+
+# Dashboard query -> equivalent lookup on the in-memory graph
+HANDLERS = {
+    queries.GET_ALL_EQUIPMENT: _all_equipment,
+    queries.GET_EQUIPMENT_WITH_SENSORS: _equipment_with_sensors,
+    queries.GET_EQUIPMENT_STATS: _equipment_stats,
+    queries.GET_ANOMALIES: _anomalies,
+    queries.GET_ANOMALY_COUNT_BY_THRESHOLD: _anomaly_levels,
+    queries.GET_FAILURE_PREDICTIONS: _failure_predictions,
+    queries.GET_ENERGY_FORECAST: _energy_forecast,
+    queries.GET_ENERGY_SUMMARY: _energy_summary,
+    queries.GET_MAINTENANCE_EVENTS: _maintenance_events,
+    queries.GET_MAINTENANCE_BY_TYPE: _maintenance_by_type,
+    queries.GET_DASHBOARD_SUMMARY: _dashboard_summary,
+    queries.COUNT_DASHBOARD_SUMMARY: _dashboard_summary,
+}
+
+
+class MemoryClient:
+    """Answers the dashboard queries from the in-memory graph (no Cypher engine)"""
+
+    def __init__(self):
+        self.graph = get_memory_graph()
+
+    def query(self, cypher: str, parameters: dict = None) -> list:
+        handler = HANDLERS.get(cypher)
+        if handler is None:
+            raise ValueError("Query is not supported by the memory backend")
+        with self.graph.lock:
+            return handler(self.graph)
+
+    def write(self, cypher: str, parameters: dict = None) -> list:
+        return self.query(cypher, parameters)
+
+    def query_single(self, cypher: str, parameters: dict = None):
+        results = self.query(cypher, parameters)
+        return results[0] if results else None
+
+    def close(self):
+        pass
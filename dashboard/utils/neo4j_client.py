@@ -1,40 +1,31 @@
 """Neo4j connection utility for UPW Dashboard"""
 
-from neo4j import GraphDatabase
-from contextlib import contextmanager
 import os
+from contextlib import contextmanager
 
-# Default connection settings
-NEO4J_URI = os.getenv("NEO4J_URI", "bolt://localhost:17687")
-NEO4J_USER = os.getenv("NEO4J_USER", "neo4j")
-NEO4J_PASSWORD = os.getenv("NEO4J_PASSWORD", "password123")
-
+from graphdb import GraphClient
 
-class Neo4jClient:
-    """Neo4j database client"""
 
-    def __init__(self, uri=NEO4J_URI, user=NEO4J_USER, password=NEO4J_PASSWORD):
-        self.driver = GraphDatabase.driver(uri, auth=(user, password))
+class Neo4jClient(GraphClient):
+    """Neo4j database client (same NEO4J_* pool and routing settings as the API)"""
 
-    def close(self):
-        self.driver.close()
+    def __init__(self, uri=None, user=None, password=None):
+        super().__init__(uri, user, password)
+        self.connect()
 
-    def query(self, cypher, parameters=None):
-        """Execute a Cypher query and return results as list of dicts"""
-        with self.driver.session() as session:
-            result = session.run(cypher, parameters or {})
-            return [record.data() for record in result]
 
-    def query_single(self, cypher, parameters=None):
-        """Execute a query and return single result"""
-        results = self.query(cypher, parameters)
-        return results[0] if results else None
+def _new_client():
+    """Neo4j client, or the in-memory graph client when GRAPH_BACKEND=memory"""
+    if os.getenv("GRAPH_BACKEND", "neo4j").lower() == "memory":
+        from .memory_client import MemoryClient
+        return MemoryClient()
+    return Neo4jClient()
 
 
 @contextmanager
 def get_client():
     """Context manager for Neo4j client"""
-    client = Neo4jClient()
+    client = _new_client()
     try:
         yield client
     finally:
@@ -48,5 +39,5 @@ def get_cached_client():
     """Get or create a cached Neo4j client"""
     global _client
     if _client is None:
-        _client = Neo4jClient()
+        _client = _new_client()
     return _client
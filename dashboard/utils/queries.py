@@ -1,33 +1,35 @@
 """Cypher queries for UPW Dashboard"""
 
+from graphdb.summary import COUNT_SUMMARY, GET_SUMMARY
+
 # Equipment queries
 GET_ALL_EQUIPMENT = """
-MATCH (e)
+MATCH (e:Resource)
 WHERE e.equipmentId IS NOT NULL
-RETURN e.equipmentId[0] AS id,
-       e.equipmentName[0] AS name,
+RETURN e.equipmentId AS id,
+       e.equipmentName AS name,
        [l IN labels(e) WHERE l <> 'Resource'][0] AS type,
-       e.operatingHours[0] AS operatingHours,
-       toString(e.installationDate[0]) AS installationDate
-ORDER BY e.equipmentName[0]
+       e.operatingHours AS operatingHours,
+       toString(e.installationDate) AS installationDate
+ORDER BY e.equipmentName
 """
 
 GET_EQUIPMENT_WITH_SENSORS = """
 MATCH (e)-[:hasSensor]->(s)
 WHERE e.equipmentId IS NOT NULL AND s.sensorId IS NOT NULL
 WITH e, collect({
-    id: s.sensorId[0],
+    id: s.sensorId,
     type: [l IN labels(s) WHERE l <> 'Resource'][0],
-    location: s.sensorLocation[0]
+    location: s.sensorLocation
 }) AS sensors
-RETURN e.equipmentId[0] AS equipmentId,
-       e.equipmentName[0] AS equipmentName,
+RETURN e.equipmentId AS equipmentId,
+       e.equipmentName AS equipmentName,
        sensors
-ORDER BY e.equipmentName[0]
+ORDER BY e.equipmentName
 """
 
 GET_EQUIPMENT_STATS = """
-MATCH (e)
+MATCH (e:Resource)
 WHERE e.equipmentId IS NOT NULL
 WITH [l IN labels(e) WHERE l <> 'Resource'][0] AS type
 RETURN type, count(*) AS count
@@ -39,17 +41,17 @@ GET_ANOMALIES = """
 MATCH (a:AnomalyDetection)
 OPTIONAL MATCH (a)-[:madeBySensor]->(s)
 WHERE s.sensorId IS NOT NULL OR s IS NULL
-RETURN a.anomalyScore[0] AS score,
-       a.label[0] AS label,
-       a.comment[0] AS description,
-       toString(a.timestamp[0]) AS timestamp,
-       s.sensorId[0] AS sensorId
-ORDER BY a.anomalyScore[0] DESC
+RETURN a.anomalyScore AS score,
+       a.label AS label,
+       a.comment AS description,
+       toString(a.timestamp) AS timestamp,
+       s.sensorId AS sensorId
+ORDER BY a.anomalyScore DESC
 """
 
 GET_ANOMALY_COUNT_BY_THRESHOLD = """
 MATCH (a:AnomalyDetection)
-WITH a.anomalyScore[0] AS score
+WITH a.anomalyScore AS score
 RETURN
   CASE
     WHEN score >= 0.7 THEN 'Critical (≥0.7)'
@@ -70,35 +72,49 @@ GET_FAILURE_PREDICTIONS = """
 MATCH (fp:FailurePrediction)
 OPTIONAL MATCH (e)-[:hasPrediction]->(fp)
 WHERE e.equipmentId IS NOT NULL OR e IS NULL
-RETURN e.equipmentId[0] AS equipmentId,
-       e.equipmentName[0] AS equipmentName,
-       fp.failureMode[0] AS failureMode,
-       toString(fp.predictedFailureDate[0]) AS predictedDate,
-       fp.confidenceScore[0] AS confidence,
-       fp.remainingUsefulLife[0] AS rul,
-       fp.comment[0] AS comment
-ORDER BY fp.predictedFailureDate[0]
+RETURN e.equipmentId AS equipmentId,
+       e.equipmentName AS equipmentName,
+       fp.failureMode AS failureMode,
+       toString(fp.predictedFailureDate) AS predictedDate,
+       fp.confidenceScore AS confidence,
+       fp.remainingUsefulLife AS rul,
+       fp.comment AS comment
+ORDER BY fp.predictedFailureDate
 """
 
 # Energy Prediction queries
+# Compact forecasts (neo4j/migrate-energy-compact.cypher) keep points as arrays
 GET_ENERGY_FORECAST = """
-MATCH (ep:EnergyPrediction)-[:hasForecastPoint]->(fp:EnergyForecastPoint)
-RETURN toString(ep.forecastDate[0]) AS forecastDate,
-       ep.totalDailyEnergy[0] AS totalEnergy,
-       ep.peakPower[0] AS peakPower,
-       fp.intervalIndex[0] AS intervalIndex,
-       toString(fp.intervalStartTime[0]) AS startTime,
-       fp.powerConsumption[0] AS powerKW,
-       fp.confidenceScore[0] AS confidence
-ORDER BY fp.intervalIndex[0]
+MATCH (ep:EnergyPrediction)
+UNWIND CASE WHEN ep.forecastPower IS NOT NULL
+  THEN [i IN range(0, size(ep.forecastPower) - 1) | {
+    intervalIndex: ep.forecastIntervals[i],
+    startTime: ep.forecastStart + duration({minutes: 15 * ep.forecastIntervals[i]}),
+    powerKW: ep.forecastPower[i],
+    confidence: ep.forecastConfidence[i]
+  }]
+  ELSE COLLECT {
+    MATCH (ep)-[:hasForecastPoint]->(fp:EnergyForecastPoint)
+    RETURN {intervalIndex: fp.intervalIndex, startTime: fp.intervalStartTime,
+            powerKW: fp.powerConsumption, confidence: fp.confidenceScore}
+  }
+END AS fp
+RETURN toString(ep.forecastDate) AS forecastDate,
+       ep.totalDailyEnergy AS totalEnergy,
+       ep.peakPower AS peakPower,
+       fp.intervalIndex AS intervalIndex,
+       toString(fp.startTime) AS startTime,
+       fp.powerKW AS powerKW,
+       fp.confidence AS confidence
+ORDER BY fp.intervalIndex
 """
 
 GET_ENERGY_SUMMARY = """
 MATCH (ep:EnergyPrediction)
-RETURN toString(ep.forecastDate[0]) AS forecastDate,
-       ep.totalDailyEnergy[0] AS totalEnergy,
-       ep.peakPower[0] AS peakPower,
-       ep.confidenceScore[0] AS confidence
+RETURN toString(ep.forecastDate) AS forecastDate,
+       ep.totalDailyEnergy AS totalEnergy,
+       ep.peakPower AS peakPower,
+       ep.confidenceScore AS confidence
 LIMIT 1
 """
 
@@ -108,34 +124,25 @@ MATCH (me:MaintenanceEvent)
 OPTIONAL MATCH (e)-[:hasMaintenanceSchedule]->(:MaintenanceSchedule)-[:hasMaintenanceEvent]->(me)
 WHERE e.equipmentId IS NOT NULL OR e IS NULL
 OPTIONAL MATCH (me)-[:hasMaintenanceType]->(mt)
-RETURN e.equipmentId[0] AS equipmentId,
-       e.equipmentName[0] AS equipmentName,
-       me.label[0] AS eventName,
-       toString(me.scheduledDate[0]) AS scheduledDate,
-       toString(me.completedDate[0]) AS completedDate,
-       me.priority[0] AS priority,
-       me.estimatedDuration[0] AS duration,
-       me.status[0] AS status,
-       me.maintenanceDescription[0] AS description,
-       mt.label[0] AS maintenanceType
-ORDER BY me.scheduledDate[0]
+RETURN e.equipmentId AS equipmentId,
+       e.equipmentName AS equipmentName,
+       me.label AS eventName,
+       toString(me.scheduledDate) AS scheduledDate,
+       toString(me.completedDate) AS completedDate,
+       me.priority AS priority,
+       me.estimatedDuration AS duration,
+       me.status AS status,
+       me.maintenanceDescription AS description,
+       mt.label AS maintenanceType
+ORDER BY me.scheduledDate
 """
 
 GET_MAINTENANCE_BY_TYPE = """
 MATCH (me:MaintenanceEvent)-[:hasMaintenanceType]->(mt)
-RETURN mt.label[0] AS type, count(me) AS count
+RETURN mt.label AS type, count(me) AS count
 """
 
-# Dashboard summary
-GET_DASHBOARD_SUMMARY = """
-MATCH (e) WHERE e.equipmentId IS NOT NULL
-WITH count(e) AS equipmentCount
-OPTIONAL MATCH (s) WHERE s.sensorId IS NOT NULL
-WITH equipmentCount, count(s) AS sensorCount
-OPTIONAL MATCH (a:AnomalyDetection)
-WITH equipmentCount, sensorCount, count(a) AS anomalyCount
-OPTIONAL MATCH (fp:FailurePrediction)
-WITH equipmentCount, sensorCount, anomalyCount, count(fp) AS predictionCount
-OPTIONAL MATCH (me:MaintenanceEvent)
-RETURN equipmentCount, sensorCount, anomalyCount, predictionCount, count(me) AS maintenanceCount
-"""
+# Dashboard summary (materialized :Stats node, kept current by the API; the
+# read-only count covers the time before the API has created it)
+GET_DASHBOARD_SUMMARY = GET_SUMMARY
+COUNT_DASHBOARD_SUMMARY = COUNT_SUMMARY
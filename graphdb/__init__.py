@@ -0,0 +1,9 @@
+"""Neo4j client shared by the API, dashboard and ML (needs only the neo4j driver)"""
+
+from .client import (
+    ConnectionConfig, GraphClient, create_async_driver, create_driver, driver_options,
+    pool_stats, session_options,
+)
+
+__all__ = ['ConnectionConfig', 'GraphClient', 'create_driver', 'create_async_driver',
+           'driver_options', 'session_options', 'pool_stats']
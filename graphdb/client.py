@@ -0,0 +1,219 @@
+"""Neo4j driver configuration and a sync client with read/write routing"""
+
+import os
+import time
+from dataclasses import dataclass
+from typing import Optional
+
+from neo4j import GraphDatabase, AsyncGraphDatabase, READ_ACCESS, WRITE_ACCESS
+
+
+def _env(name: str, default, cast=str):
+    value = os.getenv(name)
+    if value is None or value == "":
+        return default
+    if cast is bool:
+        return value.strip().lower() in ("1", "true", "yes", "on")
+    return cast(value)
+
+
+@dataclass
+class ConnectionConfig:
+    """Connection, pool and routing settings (the API's NEO4J_* settings)"""
+    uri: str = "bolt://localhost:17687"
+    user: str = "neo4j"
+    password: str = "password123"
+    database: Optional[str] = None
+    max_pool_size: int = 100
+    acquisition_timeout: float = 60.0
+    connection_timeout: float = 30.0
+    max_connection_lifetime: float = 3600.0
+    # Total time managed transactions keep retrying transient errors
+    max_retry_time: float = 30.0
+    # Records pulled per round trip
+    fetch_size: int = 1000
+    # True: reads run in read sessions so a cluster routes them to followers
+    read_routing: bool = True
+
+    @classmethod
+    def from_env(cls) -> 'ConnectionConfig':
+        """Settings from the same NEO4J_* environment variables the API reads"""
+        default = cls()
+        return cls(
+            uri=_env("NEO4J_URI", default.uri),
+            user=_env("NEO4J_USER", default.user),
+            password=_env("NEO4J_PASSWORD", default.password),
+            database=_env("NEO4J_DATABASE", default.database),
+            max_pool_size=_env("NEO4J_MAX_POOL_SIZE", default.max_pool_size, int),
+            acquisition_timeout=_env("NEO4J_ACQUISITION_TIMEOUT",
+                                     default.acquisition_timeout, float),
+            connection_timeout=_env("NEO4J_CONNECTION_TIMEOUT", default.connection_timeout, float),
+            max_connection_lifetime=_env("NEO4J_MAX_CONNECTION_LIFETIME",
+                                         default.max_connection_lifetime, float),
+            max_retry_time=_env("NEO4J_MAX_RETRY_TIME", default.max_retry_time, float),
+            fetch_size=_env("NEO4J_FETCH_SIZE", default.fetch_size, int),
+            read_routing=_env("NEO4J_READ_ROUTING", default.read_routing, bool),
+        )
+
+
+def driver_options(config: ConnectionConfig) -> dict:
+    """Driver pool/retry options"""
+    return {
+        "max_connection_pool_size": config.max_pool_size,
+        "connection_acquisition_timeout": config.acquisition_timeout,
+        "connection_timeout": config.connection_timeout,
+        "max_connection_lifetime": config.max_connection_lifetime,
+        "max_transaction_retry_time": config.max_retry_time,
+    }
+
+
+def session_options(config: ConnectionConfig, access_mode: str = READ_ACCESS,
+                    fetch_size: int = None) -> dict:
+    """
+    Session options for a read or write session.
+
+    With read_routing disabled, reads are sent to the writer like writes.
+    """
+    if not config.read_routing:
+        access_mode = WRITE_ACCESS
+    options = {
+        "default_access_mode": access_mode,
+        "fetch_size": fetch_size or config.fetch_size,
+    }
+    if config.database:
+        options["database"] = config.database
+    return options
+
+
+def create_driver(config: ConnectionConfig, uri: str = None, user: str = None,
+                  password: str = None):
+    """Create a sync driver using the configured pool settings"""
+    return GraphDatabase.driver(
+        uri or config.uri,
+        auth=(user or config.user, password or config.password),
+        **driver_options(config)
+    )
+
+
+def create_async_driver(config: ConnectionConfig, uri: str = None, user: str = None,
+                        password: str = None):
+    """Create an async driver using the configured pool settings"""
+    return AsyncGraphDatabase.driver(
+        uri or config.uri,
+        auth=(user or config.user, password or config.password),
+        **driver_options(config)
+    )
+
+
+def pool_stats(driver, max_size: int) -> dict:
+    """
+    Connection pool utilisation of a sync or async driver.
+
+    The driver has no public pool metrics, so this reads its pool internals
+    and returns only the configured size if they are unavailable.
+    """
+    stats = {"maxSize": max_size, "inUse": 0, "idle": 0, "servers": {}}
+    pool = getattr(driver, "_pool", None)
+    connections = getattr(pool, "connections", None)
+    if not connections:
+        return stats
+    for address, conns in list(connections.items()):
+        conns = list(conns)
+        in_use = sum(1 for c in conns if getattr(c, "in_use", False))
+        stats["servers"][str(address)] = {"inUse": in_use, "idle": len(conns) - in_use}
+        stats["inUse"] += in_use
+        stats["idle"] += len(conns) - in_use
+    return stats
+
+
+class GraphClient:
+    """
+    Sync Neo4j client: reads in managed read transactions, writes in write
+    transactions.
+
+    Settings default to the NEO4J_* environment variables. Subclasses can
+    record each query in _record and each failure in _on_error.
+    """
+
+    def __init__(self, uri: str = None, user: str = None, password: str = None,
+                 config: ConnectionConfig = None):
+        self.config = config or ConnectionConfig.from_env()
+        self.uri = uri
+        self.user = user
+        self.password = password
+        self.driver = None
+
+    def connect(self):
+        """Connect to Neo4j"""
+        self.driver = create_driver(self.config, self.uri, self.user, self.password)
+
+    def close(self):
+        """Close connection"""
+        if self.driver:
+            self.driver.close()
+
+    def query(self, cypher: str, parameters: dict = None) -> list:
+        """Execute a Cypher query in a managed read transaction"""
+        return self._execute(READ_ACCESS, cypher, parameters)
+
+    def query_single(self, cypher: str, parameters: dict = None):
+        """Execute a query and return single result"""
+        results = self.query(cypher, parameters)
+        return results[0] if results else None
+
+    def write(self, cypher: str, parameters: dict = None) -> list:
+        """Execute a Cypher query in a managed write transaction (retried on transient errors)"""
+        return self._execute(WRITE_ACCESS, cypher, parameters)
+
+    def run(self, cypher: str, parameters: dict = None) -> list:
+        """Execute an auto-commit query (schema changes, CALL {} IN TRANSACTIONS)"""
+        with self.driver.session(**session_options(self.config, WRITE_ACCESS)) as session:
+            return session.run(cypher, parameters or {}).data()
+
+    def stream(self, cypher: str, parameters: dict = None, fetch_size: int = None):
+        """Yield records one by one, fetching fetch_size records per round trip"""
+        start, rows = time.perf_counter(), 0
+        options = session_options(self.config, READ_ACCESS, fetch_size)
+        with self.driver.session(**options) as session:
+            result = session.run(cypher, parameters or {})
+            for record in result:
+                rows += 1
+                yield record.data()
+            summary = result.consume()
+        self._record(time.perf_counter() - start, summary, rows, cypher, parameters, READ_ACCESS)
+
+    def pool_stats(self) -> dict:
+        """Connection pool utilisation"""
+        return pool_stats(self.driver, self.config.max_pool_size)
+
+    def _execute(self, access_mode: str, cypher: str, parameters: dict = None) -> list:
+        """Run a managed transaction and record it"""
+        start = time.perf_counter()
+        try:
+            options = session_options(self.config, access_mode)
+            with self.driver.session(**options) as session:
+                if options["default_access_mode"] == READ_ACCESS:
+                    execute = session.execute_read
+                else:
+                    execute = session.execute_write
+                records, summary = execute(_fetch_all, cypher, parameters or {})
+        except Exception:
+            self._on_error()
+            raise
+        self._record(time.perf_counter() - start, summary, len(records),
+                     cypher, parameters, access_mode)
+        return records
+
+    def _record(self, elapsed: float, summary, rows: int,
+                cypher: str, parameters: dict, access_mode: str):
+        """Called after each query with its timing and result summary"""
+
+    def _on_error(self):
+        """Called when a query fails"""
+
+
+def _fetch_all(tx, cypher: str, parameters: dict) -> tuple:
+    """Transaction function returning all records as dicts and the result summary"""
+    result = tx.run(cypher, parameters)
+    records = result.data()
+    return records, result.consume()
@@ -0,0 +1,61 @@
+"""Cypher of the materialized dashboard summary (:Stats node)
+
+Shared by the Neo4j backend and the dashboard; the import scripts only drop
+the node so the next API read recounts it with REFRESH_SUMMARY. The dashboard
+never writes: without the node it falls back to the read-only COUNT_SUMMARY.
+
+The node also carries `<tag>ChangedAt` change marks (tags as in the query
+cache) that every writer sets in its write transaction; conditional GET
+compares them, so writes made outside this process change ETags too.
+"""
+
+GET_SUMMARY = """
+MATCH (st:Stats {id: 'summary'})
+RETURN st.equipmentCount AS equipmentCount,
+       st.sensorCount AS sensorCount,
+       st.anomalyCount AS anomalyCount,
+       st.predictionCount AS predictionCount,
+       st.maintenanceCount AS maintenanceCount,
+       toString(st.updatedAt) AS updatedAt
+"""
+
+GET_CHANGE_MARKS = """
+MATCH (st:Stats {id: 'summary'})
+RETURN [k IN keys(st) WHERE k ENDS WITH 'ChangedAt' | [k, st[k]]] AS marks
+"""
+
+# Each count is a separate label scan (the ID counts filter on a property),
+# run only on first use, on demand or on the opt-in refresh interval;
+# readers touch one node
+_COUNTS = """
+CALL { MATCH (e:Resource) WHERE e.equipmentId IS NOT NULL RETURN count(e) AS equipmentCount }
+CALL { MATCH (s:Resource) WHERE s.sensorId IS NOT NULL RETURN count(s) AS sensorCount }
+CALL { MATCH (a:AnomalyDetection) RETURN count(a) AS anomalyCount }
+CALL { MATCH (fp:FailurePrediction) RETURN count(fp) AS predictionCount }
+CALL { MATCH (me:MaintenanceEvent) RETURN count(me) AS maintenanceCount }
+"""
+
+COUNT_SUMMARY = _COUNTS + """
+RETURN equipmentCount, sensorCount, anomalyCount, predictionCount,
+       maintenanceCount, toString(datetime()) AS updatedAt
+"""
+
+# Only writes (and sets summaryChangedAt) when a count differs from the node
+REFRESH_SUMMARY = _COUNTS + """
+MERGE (st:Stats {id: 'summary'})
+WITH st, equipmentCount, sensorCount, anomalyCount, predictionCount, maintenanceCount,
+     coalesce([st.equipmentCount, st.sensorCount, st.anomalyCount, st.predictionCount,
+               st.maintenanceCount] <> [equipmentCount, sensorCount, anomalyCount,
+                                        predictionCount, maintenanceCount], true) AS changed
+FOREACH (_ IN CASE WHEN changed THEN [1] ELSE [] END |
+  SET st.equipmentCount = equipmentCount,
+      st.sensorCount = sensorCount,
+      st.anomalyCount = anomalyCount,
+      st.predictionCount = predictionCount,
+      st.maintenanceCount = maintenanceCount,
+      st.updatedAt = datetime(),
+      st.summaryChangedAt = datetime()
+)
+RETURN equipmentCount, sensorCount, anomalyCount, predictionCount,
+       maintenanceCount, toString(st.updatedAt) AS updatedAt, changed
+"""
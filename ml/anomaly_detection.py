@@ -10,6 +10,9 @@ from typing import Tuple, Optional, Dict, Any
 
 from preprocessing import SensorDataPreprocessor, zscore_anomaly_score
 
+# Values before each row used for its rolling features
+HISTORY_WINDOW = 10
+
 
 class AnomalyDetector:
     """Anomaly detection using multiple algorithms"""
@@ -137,6 +140,10 @@ class AnomalyDetector:
         """
         Predict anomaly scores for batch data.
 
+        Builds the rolling-feature matrix for all rows at once and scores it
+        with one transform / decision_function call; scores are identical to
+        calling predict() row by row with the previous HISTORY_WINDOW values.
+
         Args:
             data: DataFrame with 'value' column
 
@@ -147,23 +154,48 @@ class AnomalyDetector:
             raise RuntimeError("Model not trained. Call fit() first.")
 
         result = data.copy()
-        scores = []
-        labels = []
-
-        values = data['value'].tolist()
-        for i, value in enumerate(values):
-            history = values[max(0, i-10):i]
-            score, label = self.predict(value, history)
-            scores.append(score)
-            labels.append(label)
-
+        scores = self.score_values(data['value'].to_numpy(dtype=np.float64))
         result['anomaly_score'] = scores
-        result['anomaly_label'] = labels
-
+        result['anomaly_label'] = self.labels(scores)
         return result
 
+    def score_values(self, values: np.ndarray) -> np.ndarray:
+        """Anomaly scores (0-1) of a value sequence, each with its preceding history"""
+        if self.algorithm == "zscore":
+            return self._zscores(values)
+        features = self.preprocessor.extract_window_features(values, HISTORY_WINDOW)
+        return self.score_features(features)
+
+    def score_features(self, features: np.ndarray) -> np.ndarray:
+        """Anomaly scores (0-1) of an (n, 5) matrix of extract_single_features rows"""
+        if self.algorithm == "zscore":
+            return self._zscores(features[:, 0])
+        if len(features) == 0:
+            return np.zeros(0)
+        if self.preprocessor.fitted:
+            scaler = self.preprocessor.scaler
+            # Same column names as at fit time, so sklearn does not warn per batch
+            names = getattr(scaler, 'feature_names_in_', None)
+            features = scaler.transform(
+                pd.DataFrame(features, columns=names) if names is not None else features
+            )
+        if hasattr(self.model, 'decision_function'):
+            raw_scores = self.model.decision_function(features)
+            return np.clip(-raw_scores / 0.5 + 0.5, 0, 1)
+        return np.where(self.model.predict(features) == 1, 0.0, 1.0)
+
+    def _zscores(self, values: np.ndarray) -> np.ndarray:
+        if self.std == 0:
+            return np.zeros(len(values))
+        return np.minimum(np.abs(values - self.mean) / self.std / 3.0, 1.0)
+
+    @staticmethod
+    def labels(scores: np.ndarray) -> np.ndarray:
+        """'anomaly' (>= 0.7), 'warning' (>= 0.5) or 'normal' per score"""
+        return np.select([scores >= 0.7, scores >= 0.5], ["anomaly", "warning"], "normal")
+
     def save(self, filepath: str):
-        """Save model to file"""
+        """Save model to file (atomically replaced, so mapped readers keep the old file)"""
         state = {
             'algorithm': self.algorithm,
             'model': self.model,
@@ -173,13 +205,22 @@ class AnomalyDetector:
             'trained': self.trained,
             'params': self.params
         }
-        joblib.dump(state, filepath)
+        tmp_path = f"{filepath}.tmp"
+        joblib.dump(state, tmp_path)
+        os.replace(tmp_path, filepath)
         print(f"Model saved to {filepath}")
 
     @classmethod
-    def load(cls, filepath: str) -> 'AnomalyDetector':
-        """Load model from file"""
-        state = joblib.load(filepath)
+    def load(cls, filepath: str, mmap_mode: Optional[str] = None,
+             verbose: bool = True) -> 'AnomalyDetector':
+        """
+        Load model from file.
+
+        With mmap_mode='r' the model's NumPy arrays (SVM support vectors,
+        scaler statistics) are memory-mapped read-only from the file, so
+        processes loading the same artifact share their pages.
+        """
+        state = joblib.load(filepath, mmap_mode=mmap_mode)
         detector = cls(algorithm=state['algorithm'])
         detector.model = state['model']
         detector.preprocessor = state['preprocessor']
@@ -187,7 +228,8 @@ class AnomalyDetector:
         detector.std = state['std']
         detector.trained = state['trained']
         detector.params = state['params']
-        print(f"Model loaded from {filepath}")
+        if verbose:
+            print(f"Model loaded from {filepath}")
         return detector
 
     def get_info(self) -> Dict[str, Any]:
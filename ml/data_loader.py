@@ -1,42 +1,42 @@
 """Data loader for anomaly detection"""
 
+import json
 import os
+import sys
+import urllib.request
 import pandas as pd
-from neo4j import GraphDatabase
 
+# graphdb (the Neo4j client shared with the API) lives at the repository root
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+if ROOT not in sys.path:
+    sys.path.append(ROOT)
 
-class Neo4jDataLoader:
-    """Load data from Neo4j for ML"""
+from graphdb import GraphClient  # noqa: E402
+
+
+class Neo4jDataLoader(GraphClient):
+    """Load data from Neo4j for ML (same NEO4J_* pool and routing settings as the API)"""
 
     def __init__(self,
                  uri: str = None,
                  user: str = None,
-                 password: str = None):
-        self.uri = uri or os.getenv("NEO4J_URI", "bolt://localhost:17687")
-        self.user = user or os.getenv("NEO4J_USER", "neo4j")
-        self.password = password or os.getenv("NEO4J_PASSWORD", "password123")
-        self.driver = GraphDatabase.driver(self.uri, auth=(self.user, self.password))
-
-    def close(self):
-        self.driver.close()
-
-    def query(self, cypher: str, parameters: dict = None) -> list:
-        """Execute Cypher query"""
-        with self.driver.session() as session:
-            result = session.run(cypher, parameters or {})
-            return [record.data() for record in result]
+                 password: str = None,
+                 api_url: str = None):
+        super().__init__(uri, user, password)
+        # REST API to notify after writes so its query cache drops stale entries
+        self.api_url = api_url or os.getenv("UPW_API_URL")
+        self.connect()
 
     def get_sensor_observations(self, sensor_id: str = None, limit: int = 1000) -> pd.DataFrame:
         """Get sensor observations as DataFrame"""
         if sensor_id:
             query = """
-            MATCH (o:SensorObservation)-[:madeBySensor]->(s:Sensor)
-            WHERE s.sensorId[0] = $sensor_id OR s.sensorId = $sensor_id
-            RETURN s.sensorId[0] AS sensor_id,
+            MATCH (o:SensorObservation)-[:madeBySensor]->(s:Resource {sensorId: $sensor_id})
+            RETURN s.sensorId AS sensor_id,
                    labels(s)[1] AS sensor_type,
-                   o.timestamp[0] AS timestamp,
-                   o.value[0] AS value,
-                   o.unit[0] AS unit
+                   o.timestamp AS timestamp,
+                   o.value AS value,
+                   o.unit AS unit
             ORDER BY o.timestamp DESC
             LIMIT $limit
             """
@@ -44,11 +44,11 @@ class Neo4jDataLoader:
         else:
             query = """
             MATCH (o:SensorObservation)-[:madeBySensor]->(s:Sensor)
-            RETURN s.sensorId[0] AS sensor_id,
+            RETURN s.sensorId AS sensor_id,
                    labels(s)[1] AS sensor_type,
-                   o.timestamp[0] AS timestamp,
-                   o.value[0] AS value,
-                   o.unit[0] AS unit
+                   o.timestamp AS timestamp,
+                   o.value AS value,
+                   o.unit AS unit
             ORDER BY o.timestamp DESC
             LIMIT $limit
             """
@@ -62,51 +62,90 @@ class Neo4jDataLoader:
         MATCH (s:Sensor)
         OPTIONAL MATCH (e)-[:hasSensor]->(s)
         WHERE e.equipmentId IS NOT NULL
-        RETURN s.sensorId[0] AS sensor_id,
+        RETURN s.sensorId AS sensor_id,
                labels(s)[1] AS sensor_type,
-               s.sensorLocation[0] AS location,
-               e.equipmentId[0] AS equipment_id,
-               e.equipmentName[0] AS equipment_name
+               s.sensorLocation AS location,
+               e.equipmentId AS equipment_id,
+               e.equipmentName AS equipment_name
         """
         return pd.DataFrame(self.query(query))
 
     def get_equipment_sensor_data(self, equipment_id: str) -> pd.DataFrame:
         """Get all sensor data for equipment"""
         query = """
-        MATCH (e)-[:hasSensor]->(s:Sensor)
-        WHERE e.equipmentId[0] = $equipment_id OR e.equipmentId = $equipment_id
+        MATCH (e:Resource {equipmentId: $equipment_id})-[:hasSensor]->(s:Sensor)
         OPTIONAL MATCH (o:SensorObservation)-[:madeBySensor]->(s)
-        RETURN s.sensorId[0] AS sensor_id,
+        RETURN s.sensorId AS sensor_id,
                labels(s)[1] AS sensor_type,
-               o.timestamp[0] AS timestamp,
-               o.value[0] AS value,
-               o.unit[0] AS unit
+               o.timestamp AS timestamp,
+               o.value AS value,
+               o.unit AS unit
         ORDER BY o.timestamp
         """
         return pd.DataFrame(self.query(query, {"equipment_id": equipment_id}))
 
     def save_anomaly_detection(self, sensor_id: str, score: float, timestamp: str,
                                label: str = None, description: str = None):
-        """Save anomaly detection result to Neo4j"""
+        """Save anomaly detection result (through the API when set, so live streams see it)"""
+        if self.api_url:
+            try:
+                return self._post_anomaly(sensor_id, score, timestamp, label, description)
+            except OSError as e:
+                print(f"API write failed, writing to Neo4j directly: {e}")
         query = """
-        MATCH (s:Sensor)
-        WHERE s.sensorId[0] = $sensor_id OR s.sensorId = $sensor_id
+        MATCH (s:Resource {sensorId: $sensor_id})
         CREATE (a:AnomalyDetection:Resource {
-            anomalyScore: [$score],
-            timestamp: [$timestamp],
+            anomalyScore: $score,
+            timestamp: datetime($timestamp),
             rdfs__label: $label,
             rdfs__comment: $description
         })
         CREATE (a)-[:madeBySensor]->(s)
+        WITH a
+        OPTIONAL MATCH (st:Stats {id: 'summary'})
+        SET st.anomalyCount = st.anomalyCount + 1,
+            st.anomaliesChangedAt = datetime()
         RETURN a
         """
-        return self.query(query, {
+        result = self.write(query, {
             "sensor_id": sensor_id,
             "score": score,
             "timestamp": timestamp,
             "label": label,
             "description": description
         })
+        self.notify_write("anomalies")
+        return result
+
+    def _post_anomaly(self, sensor_id: str, score: float, timestamp: str,
+                      label: str = None, description: str = None) -> dict:
+        """POST one anomaly to /api/anomalies"""
+        body = json.dumps([{
+            "sensorId": sensor_id,
+            "score": score,
+            "timestamp": timestamp,
+            "label": label,
+            "description": description
+        }]).encode()
+        request = urllib.request.Request(
+            f"{self.api_url.rstrip('/')}/api/anomalies", data=body, method="POST",
+            headers={"Content-Type": "application/json"}
+        )
+        with urllib.request.urlopen(request, timeout=5) as response:
+            return json.loads(response.read())
+
+    def notify_write(self, *tags: str):
+        """Invalidate the API query cache for the given tags (no-op without api_url)"""
+        if not self.api_url:
+            return
+        params = "&".join(f"tag={t}" for t in tags)
+        request = urllib.request.Request(
+            f"{self.api_url.rstrip('/')}/api/cache/invalidate?{params}", method="POST"
+        )
+        try:
+            urllib.request.urlopen(request, timeout=2).close()
+        except OSError as e:
+            print(f"Cache invalidation failed: {e}")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,155 @@
+"""In-process cache of loaded anomaly models with hot reload"""
+
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional
+
+import numpy as np
+
+from anomaly_detection import AnomalyDetector
+from registry import DEFAULT_REGISTRY, ModelRegistry
+
+# Memory budget of the cached detectors (MB)
+MODEL_CACHE_MB = int(os.getenv("UPW_MODEL_CACHE_MB", "256"))
+
+
+def _signature(path: str) -> tuple:
+    """File version: changes when the artifact is rewritten or replaced"""
+    stat = os.stat(path)
+    return stat.st_mtime_ns, stat.st_size, stat.st_ino
+
+
+def _mapped_bytes(detector: AnomalyDetector) -> int:
+    """Bytes of the detector's arrays that are memory-mapped from its file"""
+    owners = [detector.model, detector.preprocessor.scaler]
+    return sum(value.nbytes for owner in owners if owner is not None
+               for value in vars(owner).values() if isinstance(value, np.memmap))
+
+
+class _Entry:
+    __slots__ = ("value", "signature", "nbytes", "checked_at")
+
+    def __init__(self, value, signature: tuple, nbytes: int = 0):
+        self.value = value
+        self.signature = signature
+        self.nbytes = nbytes
+        self.checked_at = time.monotonic()
+
+
+class ModelCache:
+    """
+    LRU of loaded AnomalyDetectors keyed by artifact path.
+
+    Artifacts load with joblib mmap_mode='r', so arrays that stay NumPy
+    arrays after unpickling (One-Class SVM support vectors, scaler
+    statistics) are shared read-only through the page cache by every process
+    mapping the same file; Isolation Forest trees are copied by sklearn when
+    unpickled. Each detector counts its unmapped bytes (file size minus
+    mapped arrays) against `max_bytes`; least recently used detectors are
+    evicted past it.
+
+    An artifact (or registry manifest) is reloaded when its mtime, size or
+    inode changes, checked at most every `check_interval` seconds.
+    Thread-safe.
+    """
+
+    def __init__(self, max_bytes: int = MODEL_CACHE_MB * 1024 * 1024,
+                 check_interval: float = 1.0, mmap: bool = True):
+        self.max_bytes = max_bytes
+        self.check_interval = check_interval
+        self.mmap_mode = 'r' if mmap else None
+        self._models: "OrderedDict[str, _Entry]" = OrderedDict()
+        self._registries = {}
+        self._lock = threading.RLock()
+        self.hits = 0
+        self.misses = 0
+        self.reloads = 0
+        self.evictions = 0
+
+    def _current(self, entry: Optional[_Entry], path: str) -> Optional[tuple]:
+        """None if the entry is up to date, else the file's signature"""
+        now = time.monotonic()
+        if entry is not None and now - entry.checked_at < self.check_interval:
+            return None
+        signature = _signature(path)
+        if entry is not None and entry.signature == signature:
+            entry.checked_at = now
+            return None
+        return signature
+
+    def get(self, path: str) -> AnomalyDetector:
+        """Detector of an artifact, loaded (or reloaded) on demand"""
+        path = os.path.abspath(path)
+        with self._lock:
+            entry = self._models.get(path)
+            signature = self._current(entry, path)
+            if signature is None:
+                self.hits += 1
+                self._models.move_to_end(path)
+                return entry.value
+
+            if entry is None:
+                self.misses += 1
+            else:
+                self.reloads += 1
+            detector = AnomalyDetector.load(path, mmap_mode=self.mmap_mode, verbose=False)
+            nbytes = max(0, signature[1] - _mapped_bytes(detector))
+            self._models[path] = _Entry(detector, signature, nbytes)
+            self._models.move_to_end(path)
+            self._evict()
+            return detector
+
+    def _evict(self):
+        """Drop least recently used detectors past the budget (keeps the newest)"""
+        total = sum(entry.nbytes for entry in self._models.values())
+        while total > self.max_bytes and len(self._models) > 1:
+            _, entry = self._models.popitem(last=False)
+            total -= entry.nbytes
+            self.evictions += 1
+
+    def registry(self, path: str = DEFAULT_REGISTRY) -> ModelRegistry:
+        """Registry manifest, reloaded when the file changes"""
+        path = os.path.abspath(path)
+        with self._lock:
+            entry = self._registries.get(path)
+            signature = self._current(entry, path)
+            if signature is not None:
+                entry = self._registries[path] = _Entry(ModelRegistry.load(path), signature)
+            return entry.value
+
+    def for_sensor(self, sensor_id: str, sensor_type: str = None,
+                   registry_path: str = DEFAULT_REGISTRY) -> Optional[AnomalyDetector]:
+        """Detector serving a sensor according to the registry, or None"""
+        registry = self.registry(registry_path)
+        key = registry.model_key(sensor_id, sensor_type)
+        return self.get(registry.model_path(key)) if key else None
+
+    def invalidate(self, path: str = None):
+        """Forget one artifact, or every cached model and registry"""
+        with self._lock:
+            if path is None:
+                self._models.clear()
+                self._registries.clear()
+            else:
+                self._models.pop(os.path.abspath(path), None)
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "models": len(self._models),
+                "bytes": sum(entry.nbytes for entry in self._models.values()),
+                "maxBytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "reloads": self.reloads,
+                "evictions": self.evictions,
+            }
+
+    def __len__(self) -> int:
+        return len(self._models)
+
+
+# Process-wide cache used by predict.py
+model_cache = ModelCache()
@@ -6,11 +6,23 @@ from datetime import datetime
 
 from anomaly_detection import AnomalyDetector
 from data_loader import Neo4jDataLoader
+from model_cache import model_cache
+
+
+def load_detector(model_path: str, sensor_id: str = None,
+                  registry_path: str = None) -> AnomalyDetector:
+    """Cached detector: the sensor's registry model if there is one, else model_path"""
+    if registry_path and sensor_id:
+        detector = model_cache.for_sensor(sensor_id, registry_path=registry_path)
+        if detector is not None:
+            return detector
+    return model_cache.get(model_path)
 
 
 def predict_single(model_path: str, value: float,
                    sensor_id: str = None,
-                   save_to_neo4j: bool = False):
+                   save_to_neo4j: bool = False,
+                   registry_path: str = None):
     """
     Predict anomaly for a single value.
 
@@ -19,9 +31,10 @@ def predict_single(model_path: str, value: float,
         value: Sensor measurement value
         sensor_id: Sensor ID (for saving to Neo4j)
         save_to_neo4j: Whether to save result to Neo4j
+        registry_path: Registry manifest to pick the sensor's model from
     """
     # Load model
-    detector = AnomalyDetector.load(model_path)
+    detector = load_detector(model_path, sensor_id, registry_path)
 
     # Predict
     score, label = detector.predict(value)
@@ -57,16 +70,17 @@ def predict_single(model_path: str, value: float,
     return score, label
 
 
-def predict_batch(model_path: str, sensor_id: str):
+def predict_batch(model_path: str, sensor_id: str, registry_path: str = None):
     """
     Predict anomalies for all observations of a sensor.
 
     Args:
         model_path: Path to trained model
         sensor_id: Sensor ID
+        registry_path: Registry manifest to pick the sensor's model from
     """
     # Load model
-    detector = AnomalyDetector.load(model_path)
+    detector = load_detector(model_path, sensor_id, registry_path)
 
     # Load data
     print(f"Loading data for sensor {sensor_id}...")
@@ -119,6 +133,9 @@ def main():
                         help="Batch prediction for sensor")
     parser.add_argument("--save", action="store_true",
                         help="Save results to Neo4j")
+    parser.add_argument("--registry", type=str, default=None,
+                        help="Registry manifest (train.py --all-sensors) "
+                             "to pick the sensor's model from")
 
     args = parser.parse_args()
 
@@ -127,12 +144,14 @@ def main():
             model_path=args.model,
             value=args.value,
             sensor_id=args.sensor,
-            save_to_neo4j=args.save
+            save_to_neo4j=args.save,
+            registry_path=args.registry
         )
     elif args.batch and args.sensor:
         predict_batch(
             model_path=args.model,
-            sensor_id=args.sensor
+            sensor_id=args.sensor,
+            registry_path=args.registry
         )
     else:
         print("Please specify --value or (--batch --sensor)")
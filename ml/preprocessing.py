@@ -2,6 +2,7 @@
 
 import pandas as pd
 import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
 from sklearn.preprocessing import StandardScaler
 
 
@@ -82,6 +83,47 @@ class SensorDataPreprocessor:
 
         return np.array(features).reshape(1, -1)
 
+    def extract_window_features(self, values, history: int = 10) -> np.ndarray:
+        """
+        Features of every value given up to `history` values before it.
+
+        Vectorized equivalent of calling extract_single_features(values[i],
+        values[max(0, i - history):i]) for each i; returns shape (n, 5).
+        """
+        values = np.asarray(values, dtype=np.float64)
+        n = len(values)
+        features = np.zeros((n, 5))
+        features[:, 0] = values
+        features[:2, 1] = values[:2]
+        if n < 3:
+            return features
+
+        last3 = sliding_window_view(values, 3)
+        features[2:, 1] = last3.mean(axis=1)
+        features[2:, 2] = last3.std(axis=1)
+        features[2:, 3] = values[2:] - values[1:-1]
+
+        # Rows before `history` see a shorter window
+        for i in range(2, min(history, n)):
+            features[i, 4] = values[i] - np.mean(values[:i + 1])
+        if n > history:
+            window_means = sliding_window_view(values, history + 1).mean(axis=1)
+            features[history:, 4] = values[history:] - window_means
+        return features
+
+    def extract_last_features(self, windows) -> np.ndarray:
+        """
+        Features of the last value of each row of a (k, w) window matrix, w >= 3.
+
+        Row i equals extract_single_features(windows[i, -1], list(windows[i, :-1]));
+        returns shape (k, 5).
+        """
+        windows = np.asarray(windows, dtype=np.float64)
+        values = windows[:, -1]
+        last3 = windows[:, -3:]
+        return np.column_stack([values, last3.mean(axis=1), last3.std(axis=1),
+                                values - windows[:, -2], values - windows.mean(axis=1)])
+
 
 def calculate_zscore(value: float, mean: float, std: float) -> float:
     """Calculate Z-score for anomaly detection"""
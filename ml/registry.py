@@ -0,0 +1,107 @@
+"""Registry manifest of per-sensor / per-sensor-type anomaly models"""
+
+import json
+import os
+import re
+from datetime import datetime
+from typing import Dict, Optional
+
+from anomaly_detection import AnomalyDetector
+
+REGISTRY_VERSION = 1
+DEFAULT_REGISTRY = "models/registry.json"
+
+
+def artifact_name(key: str) -> str:
+    """File name of a model key, safe on every filesystem"""
+    return re.sub(r"[^A-Za-z0-9_.-]", "_", key) + ".joblib"
+
+
+class ModelRegistry:
+    """
+    Manifest mapping sensors to trained model artifacts.
+
+    models:  key (sensor id, or sensor type with group_by="type") -> entry with
+             path (relative to the manifest), algorithm, sensorType, sensors,
+             trainingWindow, metrics and trainedAt
+    sensors: sensor id -> model key
+    skipped: key -> reason it has no model (e.g. too few observations)
+
+    Lookups fall back from the sensor's own model to its type's model, then
+    to the `default` key if one was registered.
+    """
+
+    def __init__(self, path: str = DEFAULT_REGISTRY, group_by: str = "sensor",
+                 algorithm: str = None):
+        self.path = path
+        self.group_by = group_by
+        self.algorithm = algorithm
+        self.created_at = None
+        self.models: Dict[str, dict] = {}
+        self.sensors: Dict[str, str] = {}
+        self.types: Dict[str, str] = {}
+        self.skipped: Dict[str, str] = {}
+
+    @property
+    def base_dir(self) -> str:
+        return os.path.dirname(os.path.abspath(self.path))
+
+    def add(self, key: str, entry: dict):
+        """Register a trained model and the sensors it serves"""
+        self.models[key] = entry
+        for sensor_id in entry.get("sensors", []):
+            self.sensors[sensor_id] = key
+        if entry.get("sensorType"):
+            self.types.setdefault(entry["sensorType"], key)
+
+    def model_key(self, sensor_id: str, sensor_type: str = None) -> Optional[str]:
+        """Key of the model serving a sensor, or None"""
+        if sensor_id in self.sensors:
+            return self.sensors[sensor_id]
+        if sensor_type and sensor_type in self.types:
+            return self.types[sensor_type]
+        return "default" if "default" in self.models else None
+
+    def model_path(self, key: str) -> str:
+        """Absolute artifact path of a model key"""
+        return os.path.join(self.base_dir, self.models[key]["path"])
+
+    def load_detector(self, sensor_id: str, sensor_type: str = None) -> Optional[AnomalyDetector]:
+        """Detector serving a sensor, loaded from its artifact, or None"""
+        key = self.model_key(sensor_id, sensor_type)
+        return AnomalyDetector.load(self.model_path(key)) if key else None
+
+    def save(self):
+        """Write the manifest (atomically replaced)"""
+        manifest = {
+            "version": REGISTRY_VERSION,
+            "createdAt": self.created_at or datetime.now().isoformat(),
+            "groupBy": self.group_by,
+            "algorithm": self.algorithm,
+            "models": self.models,
+            "sensors": self.sensors,
+            "skipped": self.skipped,
+        }
+        os.makedirs(self.base_dir, exist_ok=True)
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(manifest, f, indent=2, ensure_ascii=False, default=str)
+        os.replace(tmp_path, self.path)
+
+    @classmethod
+    def load(cls, path: str = DEFAULT_REGISTRY) -> 'ModelRegistry':
+        """Registry from a manifest file"""
+        with open(path, encoding="utf-8") as f:
+            manifest = json.load(f)
+        if manifest.get("version") != REGISTRY_VERSION:
+            raise ValueError(f"Unsupported registry version: {manifest.get('version')}")
+        registry = cls(path, manifest.get("groupBy", "sensor"), manifest.get("algorithm"))
+        registry.created_at = manifest.get("createdAt")
+        for key, entry in manifest.get("models", {}).items():
+            registry.add(key, entry)
+        registry.sensors.update(manifest.get("sensors", {}))
+        registry.skipped = manifest.get("skipped", {})
+        return registry
+
+    def __len__(self) -> int:
+        return len(self.models)
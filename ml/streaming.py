@@ -0,0 +1,248 @@
+"""Online anomaly scoring of sensor streams with bounded per-sensor state"""
+
+import math
+import os
+from collections import deque
+from typing import Dict, Hashable, Iterable, List, Optional, Tuple
+
+import joblib
+import numpy as np
+
+from anomaly_detection import HISTORY_WINDOW, AnomalyDetector
+
+SNAPSHOT_VERSION = 1
+ADAPTIVE_STATISTICS = ("welford", "ewma")
+
+
+class SensorState:
+    """
+    Stream state of one sensor: the last HISTORY_WINDOW values (ring buffer)
+    and running statistics of everything seen so far.
+
+    count/mean/m2 are Welford's running mean and sum of squared deviations;
+    ewma/ewmv the exponentially weighted mean and variance.
+    """
+
+    __slots__ = ("ring", "last_timestamp", "count", "mean", "m2", "ewma", "ewmv")
+
+    def __init__(self, history: int = HISTORY_WINDOW):
+        self.ring = deque(maxlen=history)
+        self.last_timestamp = None
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.ewma = 0.0
+        self.ewmv = 0.0
+
+    def push(self, value: float, alpha: float):
+        """Add a value to the ring and the running statistics"""
+        self.ring.append(value)
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (value - self.mean)
+        if self.count == 1:
+            self.ewma, self.ewmv = value, 0.0
+        else:
+            diff = value - self.ewma
+            self.ewma += alpha * diff
+            self.ewmv = (1 - alpha) * (self.ewmv + alpha * diff * diff)
+
+    @property
+    def std(self) -> float:
+        """Sample standard deviation of all values seen"""
+        return math.sqrt(self.m2 / (self.count - 1)) if self.count > 1 else 0.0
+
+    def copy(self) -> 'SensorState':
+        return SensorState.from_tuple(self.to_tuple(), self.ring.maxlen)
+
+    def to_tuple(self) -> tuple:
+        return (list(self.ring), self.last_timestamp, self.count,
+                self.mean, self.m2, self.ewma, self.ewmv)
+
+    @classmethod
+    def from_tuple(cls, data: tuple, history: int) -> 'SensorState':
+        state = cls(history)
+        ring, state.last_timestamp, state.count, state.mean, state.m2, state.ewma, state.ewmv = data
+        state.ring.extend(ring)
+        return state
+
+
+class StreamingDetector:
+    """
+    Scores observations of many sensors one at a time.
+
+    Each update touches only its sensor's SensorState: the rolling features
+    come from the last HISTORY_WINDOW values, so scores equal
+    AnomalyDetector.predict(value, history) with the sensor's previous values
+    (and predict_batch over the sensor's whole series), at constant cost per
+    observation regardless of how long the stream has run.
+
+    With adaptive set, 'zscore' scores each sensor against its own running
+    statistics instead of the trained mean/std: "welford" uses the cumulative
+    mean and std, "ewma" the exponentially weighted ones (smoothing `alpha`),
+    which follow slow drift. Observations are scored before they enter the
+    statistics, and sensors score 0 until `warmup` values have been seen.
+
+    Observations with a timestamp not after the sensor's last one are scored
+    but do not change its state. Not thread-safe.
+    """
+
+    def __init__(self, detector: AnomalyDetector, adaptive: Optional[str] = None,
+                 alpha: float = 0.05, warmup: int = 30):
+        if not detector.trained:
+            raise RuntimeError("Model not trained. Call fit() first.")
+        if adaptive is not None:
+            if adaptive not in ADAPTIVE_STATISTICS:
+                raise ValueError(f"adaptive must be one of {ADAPTIVE_STATISTICS}")
+            if detector.algorithm != "zscore":
+                raise ValueError("adaptive scoring requires the 'zscore' algorithm")
+        if not 0 < alpha <= 1:
+            raise ValueError("alpha must be in (0, 1]")
+        self.detector = detector
+        self.adaptive = adaptive
+        self.alpha = alpha
+        self.warmup = warmup
+        self.sensors: Dict[Hashable, SensorState] = {}
+
+    def update(self, sensor_id: Hashable, timestamp, value: float) -> Tuple[float, str]:
+        """Score one observation and add it to the sensor's state"""
+        return self.update_many([(sensor_id, timestamp, value)])[0]
+
+    def update_many(self, observations: Iterable[Tuple[Hashable, object, float]]
+                    ) -> List[Tuple[float, str]]:
+        """
+        Score observations (sensor_id, timestamp, value) in arrival order.
+
+        The state updates run per observation; the model is called once for
+        the whole batch, so feeding micro-batches amortizes its overhead.
+        """
+        return self._score(observations, self.sensors)
+
+    def score_many(self, observations: Iterable[Tuple[Hashable, object, float]]
+                   ) -> List[Tuple[float, str]]:
+        """
+        Score observations like update_many without changing any sensor's
+        state (dry run): they see the stored state plus the observations
+        before them in this call.
+        """
+        observations = list(observations)
+        states = {sensor_id: self.sensors[sensor_id].copy()
+                  for sensor_id in {o[0] for o in observations} if sensor_id in self.sensors}
+        return self._score(observations, states)
+
+    def _score(self, observations: Iterable[Tuple[Hashable, object, float]],
+               states: Dict[Hashable, SensorState]) -> List[Tuple[float, str]]:
+        """Score observations, pushing each into its sensor's entry of states"""
+        rows = []
+        for sensor_id, timestamp, value in observations:
+            value = float(value)
+            state = states.get(sensor_id)
+            if state is None:
+                state = states[sensor_id] = SensorState()
+            rows.append(self._row(state, value))
+            if state.last_timestamp is None or timestamp > state.last_timestamp:
+                state.last_timestamp = timestamp
+                state.push(value, self.alpha)
+
+        if not rows:
+            return []
+        if self.adaptive:
+            scores = np.array(rows)
+        elif self.detector.algorithm == "zscore":
+            scores = self.detector.score_features(np.array(rows).reshape(-1, 1))
+        else:
+            scores = self.detector.score_features(self._features(rows))
+        return list(zip(scores.tolist(), self.detector.labels(scores).tolist()))
+
+    def _row(self, state: SensorState, value: float):
+        """Model input for one observation (value or window), or its adaptive score"""
+        if self.adaptive:
+            if state.count < max(self.warmup, 2):
+                return 0.0
+            if self.adaptive == "welford":
+                mean, std = state.mean, state.std
+            else:
+                mean, std = state.ewma, math.sqrt(state.ewmv)
+            return min(abs(value - mean) / std / 3.0, 1.0) if std > 0 else 0.0
+        if self.detector.algorithm == "zscore":
+            return value
+        window = list(state.ring)
+        window.append(value)
+        return window
+
+    def _features(self, windows: list) -> np.ndarray:
+        """Feature rows of the last value of each window, full windows in one pass"""
+        preprocessor = self.detector.preprocessor
+        features = np.empty((len(windows), 5))
+        full = [i for i, window in enumerate(windows) if len(window) > HISTORY_WINDOW]
+        if full:
+            features[full] = preprocessor.extract_last_features([windows[i] for i in full])
+        for i, window in enumerate(windows):
+            if len(window) <= HISTORY_WINDOW:
+                features[i] = preprocessor.extract_single_features(window[-1], window[:-1])
+        return features
+
+    def stats(self, sensor_id: Hashable) -> Optional[dict]:
+        """Running statistics of a sensor, or None if it was never seen"""
+        state = self.sensors.get(sensor_id)
+        if state is None:
+            return None
+        return {
+            "count": state.count,
+            "mean": state.mean,
+            "std": state.std,
+            "ewma": state.ewma,
+            "ewmStd": math.sqrt(state.ewmv),
+            "lastTimestamp": state.last_timestamp,
+        }
+
+    def reset(self, sensor_id: Hashable = None):
+        """Forget one sensor's state, or every sensor's"""
+        if sensor_id is None:
+            self.sensors.clear()
+        else:
+            self.sensors.pop(sensor_id, None)
+
+    def snapshot(self, filepath: str):
+        """Write the state of every sensor to a file (atomically replaced)"""
+        state = {
+            'version': SNAPSHOT_VERSION,
+            'algorithm': self.detector.algorithm,
+            'history': HISTORY_WINDOW,
+            'adaptive': self.adaptive,
+            'alpha': self.alpha,
+            'warmup': self.warmup,
+            'sensors': {sensor_id: s.to_tuple() for sensor_id, s in self.sensors.items()},
+        }
+        tmp_path = f"{filepath}.tmp"
+        joblib.dump(state, tmp_path)
+        os.replace(tmp_path, filepath)
+
+    def restore(self, filepath: str) -> int:
+        """Replace the sensor states with a snapshot; returns the sensor count"""
+        state = joblib.load(filepath)
+        if state.get('version') != SNAPSHOT_VERSION:
+            raise ValueError(f"Unsupported snapshot version: {state.get('version')}")
+        if state['history'] != HISTORY_WINDOW:
+            raise ValueError(f"Snapshot history window {state['history']} != {HISTORY_WINDOW}")
+        if state['algorithm'] != self.detector.algorithm:
+            raise ValueError(f"Snapshot algorithm {state['algorithm']} "
+                             f"!= {self.detector.algorithm}")
+        self.adaptive = state['adaptive']
+        self.alpha = state['alpha']
+        self.warmup = state['warmup']
+        self.sensors = {sensor_id: SensorState.from_tuple(data, HISTORY_WINDOW)
+                        for sensor_id, data in state['sensors'].items()}
+        return len(self.sensors)
+
+    @classmethod
+    def load(cls, model_path: str, snapshot_path: str = None, **kwargs) -> 'StreamingDetector':
+        """Detector from a trained model file, resuming a snapshot if it exists"""
+        stream = cls(AnomalyDetector.load(model_path), **kwargs)
+        if snapshot_path and os.path.exists(snapshot_path):
+            stream.restore(snapshot_path)
+        return stream
+
+    def __len__(self) -> int:
+        return len(self.sensors)
@@ -2,18 +2,26 @@
 """Training script for anomaly detection models"""
 
 import os
+import time
+import zlib
 import argparse
 import pandas as pd
 import numpy as np
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from datetime import datetime
 
 from data_loader import Neo4jDataLoader
 from anomaly_detection import AnomalyDetector
+from registry import DEFAULT_REGISTRY, ModelRegistry, artifact_name
 
+# Loader of each --all-sensors worker process (None with synthetic data)
+_worker_loader = None
 
-def generate_synthetic_data(n_samples: int = 500) -> pd.DataFrame:
+
+def generate_synthetic_data(n_samples: int = 500, sensor_id: str = 'VIB-001',
+                            seed: int = 42) -> pd.DataFrame:
     """Generate synthetic sensor data for training"""
-    np.random.seed(42)
+    np.random.seed(seed)
 
     # Normal vibration data (2-3 mm/s)
     normal_vibration = np.random.normal(loc=2.5, scale=0.5, size=n_samples)
@@ -27,7 +35,7 @@ def generate_synthetic_data(n_samples: int = 500) -> pd.DataFrame:
     timestamps = pd.date_range(start='2025-01-01', periods=n_samples, freq='15min')
 
     return pd.DataFrame({
-        'sensor_id': 'VIB-001',
+        'sensor_id': sensor_id,
         'sensor_type': 'VibrationSensor',
         'timestamp': timestamps,
         'value': normal_vibration,
@@ -88,6 +96,169 @@ def train_model(sensor_id: str = None,
     return detector
 
 
+def _init_worker(use_synthetic: bool):
+    """Per-process setup: one BLAS/OpenMP thread, own Neo4j connection pool"""
+    global _worker_loader
+    try:
+        # Installed with scikit-learn, but not a declared dependency
+        from threadpoolctl import threadpool_limits
+        threadpool_limits(1)
+    except ImportError:
+        pass
+    if not use_synthetic:
+        _worker_loader = Neo4jDataLoader()
+
+
+def _native(value):
+    return value.to_native() if hasattr(value, "to_native") else value
+
+
+def _sensor_frames(sensor_ids: list, limit: int, use_synthetic: bool) -> list:
+    """Observations of each sensor, oldest first"""
+    frames = []
+    for sensor_id in sensor_ids:
+        if use_synthetic:
+            frame = generate_synthetic_data(sensor_id=sensor_id,
+                                            seed=zlib.crc32(sensor_id.encode()))
+        else:
+            frame = _worker_loader.get_sensor_observations(sensor_id=sensor_id, limit=limit)
+        if frame.empty:
+            continue
+        frame['timestamp'] = pd.to_datetime(frame['timestamp'].map(_native), utc=True)
+        frames.append(frame.sort_values('timestamp', ignore_index=True))
+    return frames
+
+
+def train_group(key: str, sensor_ids: list, sensor_type: str, algorithm: str,
+                limit: int, output_dir: str, use_synthetic: bool,
+                min_samples: int) -> tuple:
+    """
+    Train and save the model of one sensor (or sensor type) in a worker.
+
+    Returns:
+        Tuple of (key, registry entry or None, skip reason or None)
+    """
+    start = time.perf_counter()
+    frames = _sensor_frames(sensor_ids, limit, use_synthetic)
+    samples = sum(len(frame) for frame in frames)
+    if samples < min_samples:
+        return key, None, f"{samples} observations (< {min_samples})"
+
+    data = pd.concat(frames, ignore_index=True)
+    detector = AnomalyDetector(algorithm=algorithm).fit(data)
+    path = os.path.join(output_dir, artifact_name(key))
+    detector.save(path)
+
+    # Scored per sensor so rolling features never span two series
+    scores = np.concatenate([detector.score_values(frame['value'].to_numpy(dtype=np.float64))
+                             for frame in frames])
+    labels = detector.labels(scores)
+    timestamps = data['timestamp']
+    return key, {
+        "path": os.path.relpath(path, os.path.dirname(output_dir)),
+        "algorithm": algorithm,
+        "sensorType": sensor_type,
+        "sensors": [frame['sensor_id'].iloc[0] for frame in frames],
+        "trainingWindow": {"from": timestamps.min().isoformat(),
+                           "to": timestamps.max().isoformat()},
+        "metrics": {
+            "samples": samples,
+            "valueMean": float(detector.mean),
+            "valueStd": float(detector.std),
+            "meanScore": float(scores.mean()),
+            "warningRate": float(np.mean(labels == "warning")),
+            "anomalyRate": float(np.mean(labels == "anomaly")),
+            "trainSeconds": round(time.perf_counter() - start, 3),
+        },
+        "trainedAt": datetime.now().isoformat(),
+    }, None
+
+
+def train_all_sensors(algorithm: str = "isolation_forest",
+                      group_by: str = "sensor",
+                      registry_path: str = DEFAULT_REGISTRY,
+                      workers: int = None,
+                      limit: int = 1000,
+                      min_samples: int = 10,
+                      use_synthetic: bool = False,
+                      synthetic_sensors: int = 20) -> ModelRegistry:
+    """
+    Train one model per sensor (or per sensor type) in a process pool.
+
+    Artifacts go to sensors/ next to the registry manifest, which maps every
+    sensor to its model (see registry.ModelRegistry).
+
+    Args:
+        algorithm: Algorithm to use
+        group_by: 'sensor' (one model each) or 'type' (one per sensor type)
+        registry_path: Manifest path
+        workers: Worker processes (default: CPU count)
+        limit: Latest observations per sensor
+        min_samples: Fewest observations to train a model on
+        use_synthetic: Use synthetic data instead of Neo4j
+        synthetic_sensors: Sensor count with synthetic data
+
+    Returns:
+        Saved ModelRegistry
+    """
+    if use_synthetic:
+        sensors = pd.DataFrame({
+            'sensor_id': [f"VIB-{i:03d}" for i in range(1, synthetic_sensors + 1)],
+            'sensor_type': 'VibrationSensor',
+        })
+    else:
+        loader = Neo4jDataLoader()
+        try:
+            sensors = loader.get_all_sensors()
+        finally:
+            # Closed before the pool starts; each worker opens its own
+            loader.close()
+    if sensors.empty:
+        raise ValueError("No sensors found")
+    sensors = sensors.dropna(subset=['sensor_id']).drop_duplicates('sensor_id')
+
+    if group_by == "type":
+        groups = [(sensor_type, list(group['sensor_id']), sensor_type)
+                  for sensor_type, group in sensors.groupby('sensor_type')]
+    else:
+        groups = [(row.sensor_id, [row.sensor_id], row.sensor_type)
+                  for row in sensors.itertuples()]
+
+    workers = max(1, min(workers or os.cpu_count() or 1, len(groups)))
+    output_dir = os.path.join(os.path.dirname(os.path.abspath(registry_path)), "sensors")
+    os.makedirs(output_dir, exist_ok=True)
+    print(f"Training {len(groups)} {algorithm} models ({group_by}) "
+          f"for {len(sensors)} sensors on {workers} workers...")
+
+    registry = ModelRegistry(registry_path, group_by, algorithm)
+    start = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                             initargs=(use_synthetic,)) as pool:
+        futures = {
+            pool.submit(train_group, key, sensor_ids, sensor_type, algorithm,
+                        limit, output_dir, use_synthetic, min_samples): key
+            for key, sensor_ids, sensor_type in groups
+        }
+        for done, future in enumerate(as_completed(futures), 1):
+            key = futures[future]
+            try:
+                key, entry, reason = future.result()
+            except Exception as e:
+                entry, reason = None, f"{type(e).__name__}: {e}"
+            if entry is None:
+                registry.skipped[key] = reason
+            else:
+                registry.add(key, entry)
+            if done % 100 == 0 or done == len(groups):
+                print(f"  {done}/{len(groups)} done")
+
+    registry.save()
+    print(f"Trained {len(registry)} models ({len(registry.skipped)} skipped) "
+          f"in {time.perf_counter() - start:.1f}s")
+    print(f"Registry written to {registry_path}")
+    return registry
+
+
 def main():
     parser = argparse.ArgumentParser(description="Train anomaly detection model")
     parser.add_argument("--sensor", type=str, default=None,
@@ -99,12 +270,36 @@ def main():
                         help="Use synthetic data")
     parser.add_argument("--output", type=str, default="models/anomaly_model.joblib",
                         help="Output model path")
+    parser.add_argument("--all-sensors", action="store_true",
+                        help="Train one model per sensor into a registry")
+    parser.add_argument("--group-by", type=str, default="sensor", choices=["sensor", "type"],
+                        help="With --all-sensors: one model per sensor or per sensor type")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="With --all-sensors: worker processes (default: CPU count)")
+    parser.add_argument("--limit", type=int, default=1000,
+                        help="With --all-sensors: latest observations per sensor")
+    parser.add_argument("--registry", type=str, default=DEFAULT_REGISTRY,
+                        help="With --all-sensors: registry manifest path")
+    parser.add_argument("--synthetic-sensors", type=int, default=20,
+                        help="With --all-sensors --synthetic: number of sensors")
 
     args = parser.parse_args()
 
     # Ensure models directory exists
     os.makedirs("models", exist_ok=True)
 
+    if args.all_sensors:
+        train_all_sensors(
+            algorithm=args.algorithm,
+            group_by=args.group_by,
+            registry_path=args.registry,
+            workers=args.workers,
+            limit=args.limit,
+            use_synthetic=args.synthetic,
+            synthetic_sensors=args.synthetic_sensors
+        )
+        return
+
     # Train
     detector = train_model(
         sensor_id=args.sensor,
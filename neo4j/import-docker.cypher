@@ -10,7 +10,7 @@ CREATE CONSTRAINT n10s_unique_uri IF NOT EXISTS FOR (r:Resource) REQUIRE r.uri I
 // Step 2: Initialize n10s graph configuration
 CALL n10s.graphconfig.init({
   handleVocabUris: "MAP",
-  handleMultival: "ARRAY",
+  handleMultival: "OVERWRITE",
   handleRDFTypes: "LABELS_AND_NODES",
   keepLangTag: false,
   keepCustomDataTypes: false
@@ -28,7 +28,14 @@ CALL n10s.onto.import.fetch("file:///import/upw.owl.ttl", "Turtle");
 // Step 5: Import instance data (ABox) - Docker path
 CALL n10s.rdf.import.fetch("file:///import/sample_data.ttl", "Turtle");
 
-// Step 6: Verification - Count nodes by label
+// Step 6: Materialize dashboard summary counters (read by /api/summary)
+CREATE CONSTRAINT stats_id IF NOT EXISTS FOR (st:Stats) REQUIRE st.id IS UNIQUE;
+
+// Drop stale counters; the API (graphdb/summary.py REFRESH_SUMMARY) or the
+// dashboard recounts them into a new node on the next read
+MATCH (st:Stats {id: 'summary'}) DELETE st;
+
+// Step 7: Verification - Count nodes by label
 MATCH (n)
 UNWIND labels(n) AS label
 RETURN label, count(*) AS count
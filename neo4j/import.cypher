@@ -15,11 +15,11 @@ CREATE CONSTRAINT n10s_unique_uri IF NOT EXISTS FOR (r:Resource) REQUIRE r.uri I
 
 // Initialize n10s graph configuration
 // handleVocabUris: "MAP" - maps common vocab URIs to simpler labels
-// handleMultival: "ARRAY" - stores multiple values as arrays
+// handleMultival: "OVERWRITE" - stores single values as scalars (index-friendly)
 // handleRDFTypes: "LABELS" - converts rdf:type to Neo4j labels
 CALL n10s.graphconfig.init({
   handleVocabUris: "MAP",
-  handleMultival: "ARRAY",
+  handleMultival: "OVERWRITE",
   handleRDFTypes: "LABELS_AND_NODES",
   keepLangTag: false,
   keepCustomDataTypes: false
@@ -71,7 +71,20 @@ CALL n10s.rdf.import.fetch(
 );
 
 // -----------------------------------------------------------------------------
-// STEP 5: Verify import success
+// STEP 5: Materialize dashboard summary counters
+// -----------------------------------------------------------------------------
+// The API and dashboard read these from a single :Stats node instead of
+// counting the whole graph on every page load. The API also recounts them
+// periodically (SUMMARY_REFRESH_INTERVAL) and on POST /api/summary/refresh.
+
+CREATE CONSTRAINT stats_id IF NOT EXISTS FOR (st:Stats) REQUIRE st.id IS UNIQUE;
+
+// Drop stale counters; the API (graphdb/summary.py REFRESH_SUMMARY) or the
+// dashboard recounts them into a new node on the next read
+MATCH (st:Stats {id: 'summary'}) DELETE st;
+
+// -----------------------------------------------------------------------------
+// STEP 6: Verify import success
 // -----------------------------------------------------------------------------
 
 // Check node counts by label
@@ -0,0 +1,71 @@
+// =============================================================================
+// UPW Process Ontology - Compact Energy Forecast Migration
+// =============================================================================
+// Every EnergyPrediction fans out to up to 96 EnergyForecastPoint nodes, so
+// reading one forecast day costs ~97 node reads (35k for a year of history).
+//
+// This script stores the points as typed arrays on the prediction node:
+//   forecastIntervals:  [int]    intervalIndex of each point, ascending
+//   forecastPower:      [float]  powerConsumption (kW)
+//   forecastConfidence: [float]  confidenceScore
+//   forecastStart:      datetime start of interval 0; interval i starts
+//                                 15 * i minutes later
+//
+// The API and dashboard read either layout and return the same
+// EnergyPrediction / EnergyForecastPoint shapes. Predictions whose points
+// have missing values or irregular start times keep the node layout.
+//
+// The script is idempotent: re-run it after importing further forecasts.
+//
+// Requires APOC (installed by docker-compose.yml) and Neo4j 5.13+.
+// Usage: ./scripts/run.sh migrate-energy
+// =============================================================================
+
+// -----------------------------------------------------------------------------
+// STEP 1: Pack forecast points into arrays (batched, 1k predictions per transaction)
+// -----------------------------------------------------------------------------
+
+CALL apoc.periodic.iterate(
+  "MATCH (ep:EnergyPrediction)
+   WHERE ep.forecastPower IS NULL
+     AND EXISTS { (ep)-[:hasForecastPoint]->(:EnergyForecastPoint) }
+   RETURN ep",
+  "MATCH (ep)-[:hasForecastPoint]->(fp:EnergyForecastPoint)
+   WITH ep, fp ORDER BY fp.intervalIndex
+   WITH ep, collect(fp) AS points
+   WITH ep, points,
+        points[0].intervalStartTime - duration({minutes: 15 * points[0].intervalIndex}) AS start
+   WHERE all(fp IN points WHERE
+           fp.intervalIndex IS NOT NULL AND fp.powerConsumption IS NOT NULL
+           AND fp.confidenceScore IS NOT NULL
+           AND fp.intervalStartTime = start + duration({minutes: 15 * fp.intervalIndex}))
+   SET ep.forecastIntervals = [fp IN points | fp.intervalIndex],
+       ep.forecastPower = [fp IN points | toFloat(fp.powerConsumption)],
+       ep.forecastConfidence = [fp IN points | toFloat(fp.confidenceScore)],
+       ep.forecastStart = start",
+  {batchSize: 1000, parallel: false}
+)
+YIELD batches, total, errorMessages
+RETURN batches, total, errorMessages;
+
+// -----------------------------------------------------------------------------
+// STEP 2: Remove the packed point nodes (batched, 10k points per transaction)
+// -----------------------------------------------------------------------------
+
+CALL apoc.periodic.iterate(
+  "MATCH (ep:EnergyPrediction)-[:hasForecastPoint]->(fp:EnergyForecastPoint)
+   WHERE ep.forecastPower IS NOT NULL
+   RETURN fp",
+  "DETACH DELETE fp",
+  {batchSize: 10000, parallel: false}
+)
+YIELD batches, total, errorMessages
+RETURN batches, total, errorMessages;
+
+// -----------------------------------------------------------------------------
+// STEP 3: Check - predictions per layout
+// -----------------------------------------------------------------------------
+
+MATCH (ep:EnergyPrediction)
+RETURN CASE WHEN ep.forecastPower IS NOT NULL THEN 'compact' ELSE 'nodes' END AS layout,
+       count(*) AS predictions;
@@ -0,0 +1,85 @@
+// =============================================================================
+// UPW Process Ontology - Scalar Property Migration
+// =============================================================================
+// Graphs imported with n10s handleMultival: "ARRAY" store every literal as a
+// one-element list (e.g. equipmentId: ["PUMP-001"]). Predicates such as
+// `e.equipmentId[0] = $id` cannot be served by an index, so every lookup
+// scans the whole graph.
+//
+// This script:
+//   1. Converts single-valued list properties on all Resource nodes to scalars
+//   2. Creates the constraints/indexes used by the API, dashboard and ML code
+//
+// The script is idempotent: re-run it after any further import into a graph
+// that is still configured with handleMultival: "ARRAY". The compact energy
+// forecast arrays (see migrate-energy-compact.cypher) are kept as lists.
+//
+// Requires APOC (installed by docker-compose.yml) and Neo4j 5.13+.
+// Usage: ./scripts/run.sh migrate
+// =============================================================================
+
+// -----------------------------------------------------------------------------
+// STEP 1: Unwrap single-valued arrays (batched, 10k nodes per transaction)
+// -----------------------------------------------------------------------------
+
+CALL apoc.periodic.iterate(
+  "MATCH (n:Resource)
+   WHERE any(k IN keys(n) WHERE valueType(n[k]) STARTS WITH 'LIST' AND size(n[k]) = 1
+                              AND NOT k IN $compact)
+   RETURN n",
+  "SET n += apoc.map.fromPairs([k IN keys(n)
+     WHERE valueType(n[k]) STARTS WITH 'LIST' AND size(n[k]) = 1
+       AND NOT k IN $compact | [k, n[k][0]]])",
+  {batchSize: 10000, parallel: false,
+   params: {compact: ['forecastIntervals', 'forecastPower', 'forecastConfidence']}}
+)
+YIELD batches, total, errorMessages
+RETURN batches, total, errorMessages;
+
+// -----------------------------------------------------------------------------
+// STEP 2: Constraints and indexes
+// -----------------------------------------------------------------------------
+
+// ID lookups (uniqueness constraints are backed by range indexes)
+CREATE CONSTRAINT resource_equipment_id IF NOT EXISTS
+FOR (r:Resource) REQUIRE r.equipmentId IS UNIQUE;
+
+CREATE CONSTRAINT resource_sensor_id IF NOT EXISTS
+FOR (r:Resource) REQUIRE r.sensorId IS UNIQUE;
+
+// Observation / anomaly ordering and range filters
+CREATE INDEX observation_timestamp IF NOT EXISTS
+FOR (o:SensorObservation) ON (o.timestamp);
+
+CREATE INDEX anomaly_score IF NOT EXISTS
+FOR (a:AnomalyDetection) ON (a.anomalyScore);
+
+CREATE INDEX anomaly_timestamp IF NOT EXISTS
+FOR (a:AnomalyDetection) ON (a.timestamp);
+
+// Prediction and maintenance filters
+CREATE INDEX energy_forecast_date IF NOT EXISTS
+FOR (ep:EnergyPrediction) ON (ep.forecastDate);
+
+CREATE INDEX maintenance_status IF NOT EXISTS
+FOR (me:MaintenanceEvent) ON (me.status);
+
+CREATE INDEX maintenance_scheduled_date IF NOT EXISTS
+FOR (me:MaintenanceEvent) ON (me.scheduledDate);
+
+// Materialized dashboard summary (single node, see import.cypher STEP 5)
+CREATE CONSTRAINT stats_id IF NOT EXISTS
+FOR (st:Stats) REQUIRE st.id IS UNIQUE;
+
+// -----------------------------------------------------------------------------
+// STEP 3: Verification
+// -----------------------------------------------------------------------------
+
+// Remaining single-valued arrays (expected: 0)
+MATCH (n:Resource)
+WHERE any(k IN keys(n) WHERE valueType(n[k]) STARTS WITH 'LIST' AND size(n[k]) = 1)
+RETURN count(n) AS remainingArrayNodes;
+
+SHOW INDEXES YIELD name, labelsOrTypes, properties, state
+WHERE name <> 'n10s_unique_uri'
+RETURN name, labelsOrTypes, properties, state;
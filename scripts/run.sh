@@ -48,6 +48,22 @@ case "$1" in
     echo "Import complete!"
     ;;
 
+  migrate)
+    echo "Migrating array properties to scalars and creating indexes..."
+    docker exec -i $NEO4J_CONTAINER cypher-shell \
+      -u $NEO4J_USER -p $NEO4J_PASS \
+      < neo4j/migrate-scalar.cypher
+    echo "Migration complete!"
+    ;;
+
+  migrate-energy)
+    echo "Packing energy forecast points into arrays..."
+    docker exec -i $NEO4J_CONTAINER cypher-shell \
+      -u $NEO4J_USER -p $NEO4J_PASS \
+      < neo4j/migrate-energy-compact.cypher
+    echo "Migration complete!"
+    ;;
+
   verify)
     echo "Verifying n10s procedures..."
     docker exec $NEO4J_CONTAINER cypher-shell \
@@ -88,7 +104,7 @@ case "$1" in
     ;;
 
   *)
-    echo "Usage: $0 {validate|start|stop|logs|import|verify|query <file>|shell|reset|clean}"
+    echo "Usage: $0 {validate|start|stop|logs|import|migrate|migrate-energy|verify|query <file>|shell|reset|clean}"
     echo ""
     echo "Commands:"
     echo "  validate - Validate TTL files (uses rapper or rdflib)"
@@ -96,6 +112,8 @@ case "$1" in
     echo "  stop    - Stop Neo4j container"
     echo "  logs    - Show container logs"
     echo "  import  - Run ontology import script"
+    echo "  migrate - Convert n10s array properties to scalars and create indexes"
+    echo "  migrate-energy - Store energy forecast points as arrays on the prediction"
     echo "  verify  - Verify n10s procedures are loaded"
     echo "  query   - Run a cypher file (e.g., ./run.sh query queries/examples.cypher)"
     echo "  shell   - Open interactive cypher-shell"
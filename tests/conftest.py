@@ -0,0 +1,15 @@
+"""API tests run against the in-memory graph backend (no Neo4j needed)"""
+
+import os
+
+os.environ.setdefault("GRAPH_BACKEND", "memory")
+
+import pytest  # noqa: E402
+from fastapi.testclient import TestClient  # noqa: E402
+
+
+@pytest.fixture(scope="session")
+def client():
+    from api.main import app
+    with TestClient(app) as test_client:
+        yield test_client
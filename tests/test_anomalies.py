@@ -0,0 +1,15 @@
+"""POST /api/anomalies/score"""
+
+NDJSON = {"content-type": "application/x-ndjson"}
+
+
+def test_score_malformed_ndjson_line_is_422(client):
+    body = b'{"sensorId": "VIB-001", "timestamp": "2025-01-21T10:00:00Z", "value"'
+    response = client.post("/api/anomalies/score", content=body, headers=NDJSON)
+    assert response.status_code == 422
+    assert response.json()["detail"][0]["loc"][0] == 0
+
+
+def test_score_invalid_object_is_422(client):
+    response = client.post("/api/anomalies/score", json={"sensorId": "VIB-001"})
+    assert response.status_code == 422
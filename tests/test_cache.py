@@ -0,0 +1,55 @@
+"""Query result cache"""
+
+from api.core.cache import QueryCache
+
+
+def _cache(**kwargs):
+    now = [0.0]
+    cache = QueryCache(clock=lambda: now[0], **kwargs)
+    return cache, now
+
+
+def test_evicts_least_recently_used_by_entry_count():
+    cache, _ = _cache(max_entries=2)
+    cache.set(("a",), 1, ttl=60)
+    cache.set(("b",), 2, ttl=60)
+    assert cache.get(("a",)) == 1
+    cache.set(("c",), 3, ttl=60)
+    assert cache.get(("b",)) is None
+    assert cache.get(("a",)) == 1 and cache.get(("c",)) == 3
+    assert cache.stats()["evictions"] == 1
+
+
+def test_evicts_by_total_size():
+    value = "x" * 100
+    size = QueryCache.estimate_size(value)
+    cache, _ = _cache(max_bytes=2 * size)
+    for key in ("a", "b", "c"):
+        cache.set((key,), value, ttl=60)
+    assert cache.get(("a",)) is None
+    assert cache.stats()["bytes"] == 2 * size
+    # Larger than the whole cache: not stored, nothing evicted
+    cache.set(("big",), "x" * 1000, ttl=60)
+    assert cache.get(("big",)) is None and cache.get(("c",)) == value
+
+
+def test_entries_expire_after_ttl():
+    cache, now = _cache()
+    cache.set(("a",), 1, ttl=5)
+    now[0] = 4.9
+    assert cache.get(("a",)) == 1
+    now[0] = 5.0
+    assert cache.get(("a",)) is None
+    assert cache.stats()["expirations"] == 1
+
+
+def test_invalidate_by_tag():
+    cache, _ = _cache()
+    cache.set(("anomalies",), 1, ttl=60, tags=("anomalies",))
+    cache.set(("summary",), 2, ttl=60, tags=("summary", "anomalies"))
+    cache.set(("equipment",), 3, ttl=60, tags=("equipment",))
+    assert cache.invalidate("anomalies") == 2
+    assert cache.get(("anomalies",)) is None and cache.get(("summary",)) is None
+    assert cache.get(("equipment",)) == 3
+    assert cache.invalidate() == 1
+    assert cache.stats()["entries"] == 0 and cache.stats()["bytes"] == 0
@@ -0,0 +1,79 @@
+"""Single-flight coalescing of identical concurrent queries"""
+
+import asyncio
+
+from api.core.cache import query_cache
+from api.core.coalesce import SingleFlight
+from api.services import neo4j_service
+from api.services.repository import record_change
+
+
+def test_concurrent_calls_run_once():
+    flights = SingleFlight()
+    calls = []
+
+    async def fetch():
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return ["row"]
+
+    async def run():
+        return await asyncio.gather(*(flights.do("key", fetch) for _ in range(5)))
+
+    results = asyncio.run(run())
+    assert calls == [1] and results == [["row"]] * 5
+    assert flights.stats()["coalesced"] == 4 and flights.in_flight() == 0
+
+
+def test_cancelled_caller_does_not_cancel_the_flight():
+    flights = SingleFlight()
+
+    async def fetch():
+        await asyncio.sleep(0.01)
+        return "done"
+
+    async def run():
+        first = asyncio.ensure_future(flights.do("key", fetch))
+        second = asyncio.ensure_future(flights.do("key", fetch))
+        await asyncio.sleep(0)
+        first.cancel()
+        return await second
+
+    assert asyncio.run(run()) == "done"
+
+
+def test_write_splits_the_flight_and_skips_caching(monkeypatch):
+    runs = []
+    release = None
+
+    async def fake_run(cypher, parameters=None):
+        runs.append(len(runs))
+        await release.wait()
+        return [{"run": len(runs)}]
+
+    monkeypatch.setattr(neo4j_service, "_run", fake_run)
+    monkeypatch.setattr(neo4j_service.settings, "cache_enabled", True)
+    cypher = "MATCH (a:AnomalyDetection) RETURN count(a) AS coalesceTest"
+    key = query_cache.make_key(cypher)
+
+    def query():
+        return asyncio.ensure_future(neo4j_service._query(cypher, ttl=60, tags=("anomalies",)))
+
+    async def run():
+        nonlocal release
+        release = asyncio.Event()
+        before = [query() for _ in range(3)]
+        await asyncio.sleep(0)
+        record_change("anomalies")
+        after = query()
+        await asyncio.sleep(0)
+        release.set()
+        return await asyncio.gather(*before), await after
+
+    before, after = asyncio.run(run())
+    # One execution before the write, a separate one after it
+    assert len(runs) == 2
+    assert before[0] is before[1] is before[2] and after is not before[0]
+    # Only the result started after the write is cached
+    assert query_cache.get(key) is after
+    query_cache.invalidate("anomalies")
@@ -0,0 +1,20 @@
+"""Debug endpoints"""
+
+import os
+import subprocess
+import sys
+
+ROOT = os.path.join(os.path.dirname(__file__), "..")
+
+
+def _routes(debug: str) -> str:
+    env = {**os.environ, "GRAPH_BACKEND": "memory", "DEBUG": debug}
+    code = "from api.main import app\nprint(sorted(app.openapi()['paths']))"
+    result = subprocess.run([sys.executable, "-c", code], cwd=ROOT, env=env,
+                            capture_output=True, text=True, check=True)
+    return result.stdout
+
+
+def test_slow_queries_only_registered_in_debug():
+    assert "/debug/slow-queries" in _routes("true")
+    assert "/debug/slow-queries" not in _routes("false")
@@ -0,0 +1,71 @@
+"""Energy forecast range aggregates"""
+
+from datetime import date, timedelta
+
+import numpy as np
+import pytest
+
+from api.services.energy import energy_range
+
+START = date(2025, 3, 1)
+
+
+def _rows():
+    full = np.linspace(100.0, 195.0, 96)
+    return [
+        {"forecastDate": START, "intervals": list(range(96)), "power": full.tolist()},
+        # Partial day: only the morning period has points
+        {"forecastDate": START + timedelta(days=1), "intervals": [24, 25, 30],
+         "power": [50.0, 80.0, 20.0]},
+        {"forecastDate": START + timedelta(days=8), "intervals": list(range(96)),
+         "power": (full * 2).tolist()},
+    ]
+
+
+def test_missing_days_are_null_and_skipped_in_totals():
+    body = energy_range(_rows(), START, START + timedelta(days=9))
+    agg = body["aggregates"]
+    full = np.linspace(100.0, 195.0, 96)
+
+    assert len(body["dates"]) == 10 and body["forecastDays"] == 3
+    assert body["power"][2] == [None] * 96
+    assert agg["dailyEnergy"][0] == pytest.approx(full.sum() / 4)
+    assert agg["dailyEnergy"][1] == pytest.approx(150.0 / 4)
+    assert [agg["dailyEnergy"][d] for d in (2, 3, 7, 9)] == [None] * 4
+    assert agg["totalEnergy"] == pytest.approx(full.sum() * 3 / 4 + 150.0 / 4)
+    assert agg["meanPower"] == pytest.approx((full.sum() * 3 + 150.0) / (96 * 2 + 3))
+
+    assert (agg["dailyPeak"][1], agg["dailyPeakInterval"][1]) == (80.0, 25)
+    assert (agg["dailyMin"][1], agg["dailyMinInterval"][1]) == (20.0, 30)
+    assert agg["dailyPeakInterval"][2] is None
+    assert agg["periodMeans"][1] == [None, 50.0, None, None]
+    assert agg["peak"] == {"date": START + timedelta(days=8), "interval": 95, "powerKW": 390.0}
+    assert agg["minimum"] == {"date": START + timedelta(days=1), "interval": 30, "powerKW": 20.0}
+
+
+def test_week_over_week_needs_both_days():
+    agg = energy_range(_rows(), START, START + timedelta(days=9))["aggregates"]
+    assert agg["weekOverWeek"][:7] == [None] * 7
+    # Day 8 against day 1 (partial), day 9 has no forecast
+    assert agg["weekOverWeek"][8] == pytest.approx(agg["dailyEnergy"][8] - 150.0 / 4)
+    assert agg["weekOverWeekPct"][8] == pytest.approx(
+        agg["weekOverWeek"][8] * 100 / agg["dailyEnergy"][1])
+    assert agg["weekOverWeek"][9] is None
+
+
+def test_empty_range():
+    agg = energy_range([], START, START + timedelta(days=2))["aggregates"]
+    assert agg["totalEnergy"] is None and agg["peak"] is None
+    assert agg["dailyEnergy"] == [None] * 3
+
+
+def test_range_endpoint_over_days_without_forecasts(client):
+    response = client.get("/api/predictions/energy/range",
+                          params={"from": "2025-01-19", "to": "2025-01-23"})
+    data = response.json()["data"]
+    assert response.status_code == 200 and data["forecastDays"] == 1
+    missing = [day is None for day in data["aggregates"]["dailyEnergy"]]
+    assert missing == [True, True, False, True, True]
+    bad = client.get("/api/predictions/energy/range",
+                     params={"from": "2025-01-23", "to": "2025-01-19"})
+    assert bad.status_code == 400
@@ -0,0 +1,31 @@
+"""Stream event ids and resume"""
+
+from api.core.events import EventBroker
+
+
+def _broker():
+    broker = EventBroker(history=3, buffer=10)
+    broker.publish("anomalies", [{"n": n} for n in range(1, 6)])
+    return broker
+
+
+def test_resume_replays_events_after_own_id():
+    broker = _broker()
+    sub = broker.subscribe("anomalies", last_event_id=broker.event_id(3))
+    assert not sub.reset
+    assert [item["n"] for _, item in sub.replay] == [4, 5]
+
+
+def test_unresumable_ids_ask_for_reset():
+    broker = _broker()
+    other = EventBroker()
+    for last_event_id in (other.event_id(3), "3", "garbage",
+                          broker.event_id(9), broker.event_id(1)):
+        sub = broker.subscribe("anomalies", last_event_id=last_event_id)
+        assert sub.reset, last_event_id
+        assert sub.replay == []
+
+
+def test_new_subscriber_has_no_reset():
+    sub = _broker().subscribe("anomalies")
+    assert not sub.reset and sub.replay == []
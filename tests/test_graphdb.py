@@ -0,0 +1,34 @@
+"""Standalone Neo4j client shared by the API, dashboard and ML"""
+
+import os
+import subprocess
+import sys
+
+ROOT = os.path.join(os.path.dirname(__file__), "..")
+
+
+def _imported_api_modules(code: str, cwd: str) -> str:
+    env = {k: v for k, v in os.environ.items() if k != "PYTHONPATH"}
+    script = code + "\nprint(sorted(m for m in sys.modules if m.split('.')[0] == 'api'))"
+    result = subprocess.run([sys.executable, "-c", "import sys\n" + script], cwd=cwd, env=env,
+                            capture_output=True, text=True, check=True)
+    return result.stdout.strip()
+
+
+def test_ml_data_loader_imports_from_ml_dir_without_api():
+    assert _imported_api_modules("import data_loader", os.path.join(ROOT, "ml")) == "[]"
+
+
+def test_dashboard_client_imports_without_api():
+    code = "sys.path.insert(0, '.')\nfrom utils import neo4j_client, queries"
+    assert _imported_api_modules(code, os.path.join(ROOT, "dashboard")) == "[]"
+
+
+def test_config_from_env(monkeypatch):
+    from graphdb import ConnectionConfig, session_options
+
+    monkeypatch.setenv("NEO4J_FETCH_SIZE", "50")
+    monkeypatch.setenv("NEO4J_READ_ROUTING", "false")
+    config = ConnectionConfig.from_env()
+    assert config.fetch_size == 50
+    assert session_options(config)["default_access_mode"] == "WRITE"
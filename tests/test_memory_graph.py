@@ -0,0 +1,35 @@
+"""In-memory graph anomaly index"""
+
+import random
+from datetime import datetime, timezone
+
+from api.core.memory_graph import MemoryGraph, _anomaly_key
+
+
+def _graph():
+    graph = MemoryGraph()
+    graph.sensors["S"] = "urn:sensor:S"
+    rng = random.Random(7)
+    now = datetime.now(timezone.utc)
+    for n in range(200):
+        score = rng.choice([None, 0.5, round(rng.random(), 2)])
+        graph.add_anomaly("S", f"urn:anomaly:{n:03d}", score, now)
+    return graph
+
+
+def test_add_anomaly_keeps_index_sorted():
+    graph = _graph()
+    assert graph.anomalies == sorted(graph.anomalies, key=_anomaly_key, reverse=True)
+
+
+def test_anomalies_after_skips_to_cursor_position():
+    graph = _graph()
+    assert graph.anomalies_after(None) == 0
+    for index in (0, 57, 120):
+        score, uri = graph.anomalies[index]
+        assert graph.anomalies_after((score, uri)) == index + 1
+    # A position between entries (e.g. its anomaly was deleted)
+    after = (0.5, "urn:anomaly:~")
+    expected = next(i for i, (score, uri) in enumerate(graph.anomalies)
+                    if score is None or (score, uri) < after)
+    assert graph.anomalies_after(after) == expected
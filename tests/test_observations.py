@@ -0,0 +1,53 @@
+"""POST /api/observations"""
+
+NDJSON = {"content-type": "application/x-ndjson"}
+
+
+def test_malformed_ndjson_line_is_422(client):
+    body = (b'{"sensorId": "VIB-001", "timestamp": "2025-01-21T10:00:00Z", "value": 2.5}\n'
+            b'{"sensorId": ')
+    response = client.post("/api/observations", content=body, headers=NDJSON)
+    assert response.status_code == 422
+    assert response.json()["detail"][0]["loc"][0] == 1
+
+
+def test_invalid_json_array_is_422(client):
+    response = client.post("/api/observations", json=[{"sensorId": "VIB-001"}])
+    assert response.status_code == 422
+
+
+def test_unknown_sensor_is_rejected(client):
+    body = [{"sensorId": "NOPE", "timestamp": "2025-01-21T10:00:00Z", "value": 1.0}]
+    response = client.post("/api/observations", json=body)
+    assert response.status_code == 422
+    assert response.json()["detail"]["unknownSensors"] == ["NOPE"]
+
+
+def test_request_larger_than_queue_is_413(client, monkeypatch):
+    from api.services import observation_writer
+    monkeypatch.setattr(observation_writer, "max_queued", 1)
+    body = [{"sensorId": "VIB-001", "timestamp": f"2025-01-21T10:0{i}:00Z", "value": 1.0}
+            for i in range(2)]
+    assert client.post("/api/observations", json=body).status_code == 413
+
+
+def test_flushed_counts_written_rows(client, monkeypatch):
+    import asyncio
+    from api.services import GraphService, observation_writer
+
+    async def write_observations(rows):
+        return len(rows) - 1
+
+    monkeypatch.setattr(GraphService, "write_observations", write_observations)
+    before = observation_writer.stats()
+    asyncio.run(observation_writer._flush([{}, {}, {}]))
+    after = observation_writer.stats()
+    assert after["flushed"] - before["flushed"] == 2
+    assert after["skipped"] - before["skipped"] == 1
+
+
+def test_known_sensor_is_accepted(client):
+    body = [{"sensorId": "VIB-001", "timestamp": "2025-01-21T10:00:00Z", "value": 2.5}]
+    response = client.post("/api/observations", json=body)
+    assert response.status_code == 202
+    assert response.json()["data"]["accepted"] == 1
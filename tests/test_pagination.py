@@ -0,0 +1,44 @@
+"""Keyset pagination cursors"""
+
+from datetime import datetime, timezone
+
+import pytest
+
+from api.core.pagination import decode_cursor, encode_cursor
+
+PAGED = ["/api/anomalies", "/api/maintenance", "/api/sensors/VIB-001/observations"]
+
+
+def test_cursor_round_trip():
+    at = datetime(2025, 1, 20, 10, 15, tzinfo=timezone.utc)
+    assert decode_cursor(encode_cursor(at, "urn:a"), datetime, str) == [at, "urn:a"]
+    assert decode_cursor(encode_cursor(0.9, "urn:b"), (int, float), str) == [0.9, "urn:b"]
+
+
+@pytest.mark.parametrize("path", PAGED)
+def test_pages_join_up_to_the_full_list(client, path):
+    full = client.get(path, params={"limit": 1000}).json()["data"]
+    assert len(full) > 1
+    pages, cursor = [], None
+    while True:
+        params = {"limit": 1, **({"cursor": cursor} if cursor else {})}
+        body = client.get(path, params=params).json()
+        pages += body["data"]
+        cursor = body["nextCursor"]
+        if cursor is None:
+            break
+    assert pages == full
+
+
+@pytest.mark.parametrize("path", PAGED)
+@pytest.mark.parametrize("cursor", [
+    "not a cursor!",
+    encode_cursor("urn:a"),
+    encode_cursor("x", "urn:a"),
+    encode_cursor(None, "urn:a"),
+    encode_cursor({"$time": "10:00"}, "urn:a"),
+])
+def test_malformed_cursor_is_400(client, path, cursor):
+    response = client.get(path, params={"cursor": cursor})
+    assert response.status_code == 400
+    assert "Invalid cursor" in response.json()["detail"]
@@ -0,0 +1,16 @@
+"""GraphRepository interface"""
+
+import pytest
+
+from api.services import GraphRepository, MemoryGraphService, Neo4jService
+
+
+def test_backends_implement_every_method():
+    for backend in (MemoryGraphService, Neo4jService):
+        assert not backend.__abstractmethods__
+
+
+def test_backend_missing_a_method_fails_when_defined():
+    with pytest.raises(TypeError, match="health_check"):
+        class Incomplete(MemoryGraphService):
+            health_check = GraphRepository.health_check
@@ -0,0 +1,46 @@
+"""Fast serialization and compression"""
+
+from typing import List
+
+import orjson
+from starlette.testclient import TestClient
+
+from api.core.compression import CompressionMiddleware
+from api.core.config import settings
+from api.core.responses import api_response
+from api.models import APIResponse, Equipment
+
+
+def test_fast_path_matches_validated_response(monkeypatch):
+    rows = [{"id": "PUMP-001", "name": "Pump", "operatingHours": 14800, "extra": 1}]
+    model = APIResponse[List[Equipment]]
+    validated = model.model_validate(api_response(List[Equipment], rows, count=1).model_dump())
+    validated = validated.model_dump(mode="json")
+    monkeypatch.setattr(settings, "fast_serialization", True)
+    fast = orjson.loads(api_response(List[Equipment], rows, count=1).body)
+    assert fast == validated
+    assert isinstance(fast["data"][0]["operatingHours"], float)
+
+
+def test_series_points_omit_other_fields(client, monkeypatch):
+    for fast in (False, True):
+        monkeypatch.setattr(settings, "fast_serialization", fast)
+        bucket = client.get("/api/sensors/VIB-001/series", params={"agg": "avg,count"}).json()
+        assert bucket["data"] and "nextCursor" in bucket
+        assert all(point.keys() == {"timestamp", "avg", "count"} for point in bucket["data"])
+        raw = client.get("/api/sensors/VIB-001/series", params={"mode": "lttb"}).json()
+        assert all(point.keys() == {"timestamp", "value"} for point in raw["data"])
+
+
+def test_compressed_response_has_weak_etag():
+    async def app(scope, receive, send):
+        await send({"type": "http.response.start", "status": 200,
+                    "headers": [(b"content-type", b"application/json"), (b"etag", b'"v1"')]})
+        await send({"type": "http.response.body", "body": b"[" + b"0," * 2000 + b"0]"})
+
+    client = TestClient(CompressionMiddleware(app))
+    compressed = client.get("/", headers={"Accept-Encoding": "gzip"})
+    assert compressed.headers["content-encoding"] == "gzip"
+    assert compressed.headers["etag"] == 'W/"v1"'
+    identity = client.get("/", headers={"Accept-Encoding": "identity"})
+    assert identity.headers["etag"] == '"v1"'
@@ -0,0 +1,95 @@
+"""AnomalyScorer micro-batching"""
+
+import asyncio
+from datetime import datetime, timezone
+
+import numpy as np
+import pandas as pd
+
+from api.services.scoring import AnomalyScorer, _ml
+
+START = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+
+def test_failing_model_fails_only_its_requests(tmp_path):
+    _ml()
+    from anomaly_detection import AnomalyDetector
+    from registry import ModelRegistry
+
+    train = pd.DataFrame({"value": np.random.default_rng(0).normal(2.5, 0.5, 200)})
+    AnomalyDetector("zscore").fit(train).save(str(tmp_path / "good.joblib"))
+    registry = ModelRegistry(str(tmp_path / "registry.json"))
+    registry.add("good", {"path": "good.joblib", "sensors": ["GOOD"]})
+    registry.add("missing", {"path": "missing.joblib", "sensors": ["BAD"]})
+    registry.save()
+
+    scorer = AnomalyScorer(str(tmp_path / "good.joblib"), str(tmp_path / "registry.json"),
+                           max_wait=0.05)
+
+    async def run():
+        scorer.start()
+        try:
+            return await asyncio.gather(scorer.score([("GOOD", START, 2.5)]),
+                                        scorer.score([("BAD", START, 2.5)]),
+                                        return_exceptions=True)
+        finally:
+            await scorer.stop()
+
+    good, bad = asyncio.run(run())
+    assert len(good) == 1 and isinstance(good[0][0], float)
+    assert isinstance(bad, FileNotFoundError)
+    stats = scorer.stats()
+    assert stats["batches"] == 1
+    assert stats["items"] == 1 and stats["failed"] == 1
+    assert stats["models"] == 1
+
+
+def _registry(tmp_path, models: dict, sensors: dict):
+    _ml()
+    from anomaly_detection import AnomalyDetector
+    from registry import ModelRegistry
+
+    train = pd.DataFrame({"value": np.random.default_rng(0).normal(2.5, 0.5, 200)})
+    AnomalyDetector("isolation_forest").fit(train).save(str(tmp_path / "good.joblib"))
+    registry = ModelRegistry(str(tmp_path / "registry.json"))
+    for key, path in models.items():
+        registry.add(key, {"path": path})
+    registry.sensors.update(sensors)
+    registry.save()
+    return AnomalyScorer(str(tmp_path / "good.joblib"), str(tmp_path / "registry.json"),
+                         max_wait=0.05)
+
+
+def _run(scorer, *calls):
+    async def run():
+        scorer.start()
+        try:
+            return await asyncio.gather(*(scorer.score(*call) for call in calls),
+                                        return_exceptions=True)
+        finally:
+            await scorer.stop()
+    return asyncio.run(run())
+
+
+def test_dangling_registry_key_fails_only_its_request(tmp_path):
+    scorer = _registry(tmp_path, {"good": "good.joblib"}, {"GOOD": "good", "BAD": "gone"})
+    good, bad = _run(scorer, ([("GOOD", START, 2.5)],), ([("BAD", START, 2.5)],))
+    assert len(good) == 1
+    assert isinstance(bad, KeyError)
+
+    # The batching task survived and keeps serving
+    (again,) = _run(scorer, ([("GOOD", START, 2.6)],))
+    assert len(again) == 1
+
+
+def test_dry_run_leaves_windows_unchanged(tmp_path):
+    scorer = _registry(tmp_path, {"good": "good.joblib"}, {"S": "good"})
+    values = [("S", START.replace(minute=m), v) for m, v in enumerate([2.4, 2.6, 9.0, 2.5])]
+    dry = values[:2] + [("S", START.replace(minute=2), 50.0)]
+
+    (real,) = _run(scorer, (values,))
+    scorer._streams.clear()
+    dry_scores, with_dry = _run(scorer, (dry, False), (values,))
+    assert with_dry == real
+    assert len(dry_scores) == 3
+    assert scorer._streams[str(tmp_path / "good.joblib")].stats("S")["count"] == 4
@@ -0,0 +1,44 @@
+"""Chart downsampling"""
+
+import asyncio
+
+import numpy as np
+
+from api.services.series import lttb, minmax_reduce
+
+
+def _walk(n=10_000):
+    rng = np.random.default_rng(3)
+    t = np.arange(n, dtype=np.int64) * 1000 + 1_700_000_000_000
+    v = np.cumsum(rng.normal(size=n))
+    v[n * 4 // 10] += 100.0
+    return t, v
+
+
+def test_lttb_keeps_endpoints_and_point_count():
+    t, v = _walk()
+    for n_out in (3, 10, 500, 2000):
+        ts, vs = lttb(t, v, n_out)
+        assert len(ts) == len(vs) == n_out
+        assert (ts[0], vs[0]) == (t[0], v[0]) and (ts[-1], vs[-1]) == (t[-1], v[-1])
+        assert np.all(np.diff(ts) > 0)
+    # The spike is the largest triangle in its bucket
+    assert t[4000] in lttb(t, v, 100)[0]
+
+
+def test_lttb_returns_short_series_unchanged():
+    t, v = _walk(50)
+    ts, vs = lttb(t, v, 50)
+    assert ts is t and vs is v
+
+
+def test_minmax_keeps_extremes_of_each_bucket():
+    t, v = _walk()
+
+    async def chunks():
+        for start in range(0, len(t), 3000):
+            yield t[start:start + 3000], v[start:start + 3000]
+
+    ts, vs = asyncio.run(minmax_reduce(chunks(), int(t[0]), int(t[-1]) + 1, 20))
+    assert len(ts) <= 40 and np.all(np.diff(ts) >= 0)
+    assert v.max() in vs and v.min() in vs
@@ -0,0 +1,49 @@
+"""Conditional GET"""
+
+import asyncio
+from datetime import datetime, timezone
+
+from api.core.versions import GraphVersions, graph_versions
+
+
+def test_etag_changes_with_graph_change_marks(client):
+    first = client.get("/api/anomalies")
+    etag = first.headers["etag"]
+    assert client.get("/api/anomalies", headers={"If-None-Match": etag}).status_code == 304
+
+    # A write by another process only shows up in the graph's change marks
+    marks = {"anomalies": datetime(2030, 1, 1, tzinfo=timezone.utc)}
+
+    async def source():
+        return marks
+
+    saved = graph_versions._source, graph_versions.check_interval
+    graph_versions.set_source(source, check_interval=0)
+    try:
+        stale = client.get("/api/anomalies", headers={"If-None-Match": etag})
+        assert stale.status_code == 200
+        assert stale.headers["etag"] != etag
+        assert stale.headers["last-modified"] == "Tue, 01 Jan 2030 00:00:00 GMT"
+    finally:
+        graph_versions.set_source(*saved)
+        graph_versions._marks = {}
+
+
+def test_change_marks_are_read_at_most_every_interval():
+    versions = GraphVersions()
+    calls = []
+
+    async def source():
+        calls.append(1)
+        return {}
+
+    versions.set_source(source, check_interval=60)
+    asyncio.run(versions.refresh_marks())
+    asyncio.run(versions.refresh_marks())
+    assert len(calls) == 1
+
+
+def test_summary_refresh_without_changes_keeps_etag(client):
+    etag = client.get("/api/summary").headers["etag"]
+    assert client.post("/api/summary/refresh").status_code == 200
+    assert client.get("/api/summary", headers={"If-None-Match": etag}).status_code == 304